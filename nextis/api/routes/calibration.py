@@ -1,15 +1,20 @@
 """Calibration routes — profile management and interactive calibration.
 
 Manages calibration profiles (zeros, ranges, inversions, gravity) for each
-arm. Range discovery runs in a background thread with progress polling.
+arm. Range discovery runs in a background thread with progress polling or
+an NDJSON progress stream.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections.abc import Iterator
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from nextis.api.schemas import (
     CalibrationProfileResponse,
@@ -31,36 +36,33 @@ def _get_managers() -> tuple[Any, Any]:
     return state.calibration_manager, state.arm_registry
 
 
-def _read_positions(instance: Any) -> dict[str, float]:
+def _read_positions(instance: Any, lock: threading.Lock) -> dict[str, float]:
     """Read current motor positions from a robot instance.
 
-    Uses the same pattern as ``ArmRegistryService.set_home()``.
+    Uses the same pattern as ``ArmRegistryService.set_home()``. ``lock`` is
+    the arm's bus lock, held so reads don't interleave with the sampler's.
     """
     positions: dict[str, float] = {}
-    if hasattr(instance, "get_observation"):
-        obs = instance.get_observation()
-        for key, val in obs.items():
-            if key.endswith(".pos") or "position" in key.lower():
-                positions[key] = float(val)
-    elif hasattr(instance, "bus") and hasattr(instance.bus, "read"):
-        motor_names = getattr(instance, "motor_names", [])
-        for name in motor_names:
-            try:
-                val = instance.bus.read("Present_Position", name)
-                if val is not None:
-                    positions[name] = float(val)
-            except Exception:
-                pass
+    with lock:
+        if hasattr(instance, "get_observation"):
+            obs = instance.get_observation()
+            for key, val in obs.items():
+                if key.endswith(".pos") or "position" in key.lower():
+                    positions[key] = float(val)
+        elif hasattr(instance, "bus") and hasattr(instance.bus, "read"):
+            motor_names = getattr(instance, "motor_names", [])
+            for name in motor_names:
+                try:
+                    val = instance.bus.read("Present_Position", name)
+                    if val is not None:
+                        positions[name] = float(val)
+                except Exception:
+                    pass
     return positions
 
 
-@router.get("/{arm_id}/status", response_model=CalibrationStatusResponse)
-async def calibration_status(arm_id: str) -> CalibrationStatusResponse:
-    """Return calibration profile status for an arm."""
-    cal_mgr, reg = _get_managers()
-    if arm_id not in reg.arms:
-        raise HTTPException(404, f"Arm '{arm_id}' not found")
-
+def _status_response(cal_mgr: Any, arm_id: str) -> CalibrationStatusResponse:
+    """Build the calibration status (profile files + range discovery progress)."""
     file_status = cal_mgr.get_status(arm_id)
     discovery = cal_mgr.get_range_discovery_status(arm_id)
 
@@ -73,9 +75,20 @@ async def calibration_status(arm_id: str) -> CalibrationStatusResponse:
         range_discovery_active=(discovery is not None and discovery.get("phase") == "running"),
         range_discovery_progress=(discovery.get("progress", 0.0) if discovery else 0.0),
         range_discovery_joint=(discovery.get("current_joint") if discovery else None),
+        range_discovery_joints=(discovery.get("joints", {}) if discovery else {}),
     )
 
 
+@router.get("/{arm_id}/status", response_model=CalibrationStatusResponse)
+async def calibration_status(arm_id: str) -> CalibrationStatusResponse:
+    """Return calibration profile status for an arm."""
+    cal_mgr, reg = _get_managers()
+    if arm_id not in reg.arms:
+        raise HTTPException(404, f"Arm '{arm_id}' not found")
+
+    return _status_response(cal_mgr, arm_id)
+
+
 @router.post("/{arm_id}/zero")
 def record_zeros(arm_id: str) -> dict:
     """Record current joint positions as zero offsets."""
@@ -90,7 +103,7 @@ def record_zeros(arm_id: str) -> dict:
     if instance is None:
         raise HTTPException(500, "Arm instance not available")
 
-    positions = _read_positions(instance)
+    positions = _read_positions(instance, reg.bus_lock(arm_id))
     if not positions:
         raise HTTPException(500, "Could not read motor positions")
 
@@ -114,22 +127,50 @@ def start_range_discovery(arm_id: str, request: RangeDiscoveryRequest | None = N
     if instance is None:
         raise HTTPException(500, "Arm instance not available")
 
-    speed = request.speed if request else 0.1
-    duration = request.duration_per_joint if request else 10.0
-    joints = request.joints if request else None
+    request = request or RangeDiscoveryRequest()
+    if request.mode not in ("sequential", "simultaneous"):
+        raise HTTPException(400, f"Unknown range discovery mode '{request.mode}'")
 
     try:
         cal_mgr.start_range_discovery(
             arm_id,
             instance,
-            speed=speed,
-            duration_per_joint=duration,
-            joints=joints,
+            speed=request.speed,
+            duration_per_joint=request.duration_per_joint,
+            joints=request.joints,
+            simultaneous=request.mode == "simultaneous",
+            max_duration=request.max_duration,
+            settle_time=request.settle_time,
+            max_rate_hz=request.max_rate_hz,
+            bus_lock=reg.bus_lock(arm_id),
         )
     except CalibrationError as exc:
         raise HTTPException(409, str(exc)) from None
 
-    return {"status": "ok", "armId": arm_id}
+    return {"status": "ok", "armId": arm_id, "mode": request.mode}
+
+
+@router.get("/{arm_id}/range/stream")
+def stream_range_discovery(arm_id: str, interval: float = 0.2) -> StreamingResponse:
+    """Stream calibration status as NDJSON until range discovery stops running.
+
+    In simultaneous mode each line carries per-joint min/max/coverage.
+    """
+    cal_mgr, reg = _get_managers()
+    if arm_id not in reg.arms:
+        raise HTTPException(404, f"Arm '{arm_id}' not found")
+    if cal_mgr.get_range_discovery_status(arm_id) is None:
+        raise HTTPException(404, f"No range discovery for '{arm_id}'")
+
+    def lines() -> Iterator[str]:
+        while True:
+            status = _status_response(cal_mgr, arm_id)
+            yield status.model_dump_json(by_alias=True) + "\n"
+            if not status.range_discovery_active:
+                return
+            time.sleep(interval)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.post("/{arm_id}/apply")
@@ -1,14 +1,13 @@
 """Camera management and streaming routes.
 
 All hardware-touching endpoints use ``def`` (not ``async def``) to run
-in FastAPI's thread pool. MJPEG streaming uses StreamingResponse with
-a generator that yields JPEG-encoded frames.
+in FastAPI's thread pool. MJPEG streaming uses StreamingResponse with an
+async generator fed by the camera service's encode-once JPEG fan-out.
 """
 
 from __future__ import annotations
 
 import logging
-import time
 
 from fastapi import APIRouter, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
@@ -127,16 +126,12 @@ def scan_cameras() -> list[dict]:
 
 @router.get("/{camera_key}/snapshot")
 def camera_snapshot(camera_key: str) -> Response:
-    """Return a single JPEG frame from the camera."""
-    import cv2
-
+    """Return a single JPEG frame from the camera (shared with quality-85 streams)."""
     service = _get_camera_service()
-    frame = service.get_frame(camera_key)
-    if frame is None:
+    encoded = service.jpeg_fanout.encoder(camera_key, 85).encode_latest()
+    if encoded is None:
         raise HTTPException(404, f"No frame available for '{camera_key}'")
-
-    _, jpeg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-    return Response(content=jpeg.tobytes(), media_type="image/jpeg")
+    return Response(content=encoded.data, media_type="image/jpeg")
 
 
 # ------------------------------------------------------------------
@@ -153,44 +148,24 @@ def camera_stream(
     """MJPEG live video stream.
 
     Uses ``multipart/x-mixed-replace`` for browser-native MJPEG rendering
-    (works in ``<img>`` tags without JavaScript).
+    (works in ``<img>`` tags without JavaScript). Each frame is encoded once
+    per quality and shared by every client; slow clients skip frames.
     """
     service = _get_camera_service()
     if camera_key not in service.camera_keys:
         raise HTTPException(404, f"Camera '{camera_key}' not configured")
 
+    encoder = service.jpeg_fanout.encoder(camera_key, quality)
     return StreamingResponse(
-        _mjpeg_generator(service, camera_key, fps, quality),
+        encoder.stream(fps),
         media_type="multipart/x-mixed-replace; boundary=frame",
     )
 
 
-def _mjpeg_generator(
-    service: CameraService,
-    camera_key: str,
-    fps: int,
-    quality: int,
-):
-    """Yield JPEG frames as multipart boundary chunks."""
-    import cv2
-
-    dt = 1.0 / fps
-    encode_params = [cv2.IMWRITE_JPEG_QUALITY, quality]
-
-    while True:
-        start = time.monotonic()
-        frame = service.get_frame(camera_key)
-        if frame is not None:
-            _, jpeg = cv2.imencode(".jpg", frame, encode_params)
-            yield (b"--frame\r\nContent-Type: image/jpeg\r\n\r\n" + jpeg.tobytes() + b"\r\n")
-        else:
-            # Yield a small placeholder so the stream stays alive
-            time.sleep(0.5)
-            continue
-
-        elapsed = time.monotonic() - start
-        if elapsed < dt:
-            time.sleep(dt - elapsed)
+@router.get("/encoders")
+def encoder_stats() -> dict:
+    """Return JPEG encode counts and stream subscribers per camera and quality."""
+    return _get_camera_service().jpeg_fanout.stats()
 
 
 # ------------------------------------------------------------------
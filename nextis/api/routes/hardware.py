@@ -16,20 +16,26 @@ from __future__ import annotations
 import contextlib
 import logging
 import threading
+from collections.abc import Iterator
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from nextis.api.schemas import (
     AddArmRequest,
+    ArmBusStatsResponse,
     ArmStatus,
+    ConnectManyRequest,
     ConnectRequest,
     CreatePairingRequest,
     DiscoveredMotorResponse,
     HardwareStatusResponse,
     MotorDiagnosticsResponse,
+    MotorTrendResponse,
     PairingInfo,
     PortInfoResponse,
     RemovePairingRequest,
+    ScanAllMotorsRequest,
     ScanMotorsRequest,
     UpdateArmRequest,
 )
@@ -125,11 +131,52 @@ def scan_motors_on_port(request: ScanMotorsRequest) -> list[DiscoveredMotorRespo
             motor_type=r.motor_type,
             baud_rate=r.baud_rate,
             model_number=r.model_number,
+            port=r.port,
         )
         for r in results
     ]
 
 
+@router.post("/scan-motors/stream")
+def scan_motors_streaming(request: ScanAllMotorsRequest) -> StreamingResponse:
+    """Scan several ports concurrently, streaming motors as NDJSON lines.
+
+    Defaults to every discovered port not already assigned to an arm.
+    Each line is a ``DiscoveredMotorResponse``; the stream ends when all
+    ports are done.
+    """
+    from nextis.hardware.scanning import iter_scan_motors, scan_ports
+    from nextis.hardware.types import MotorType
+
+    try:
+        motor_types = [MotorType(t) for t in request.motor_types]
+    except ValueError as e:
+        raise HTTPException(400, f"Unknown motor type: {e}") from None
+
+    ports = request.ports
+    if ports is None:
+        configured = {a.port for a in get_registry().arms.values()}
+        ports = [
+            p.port
+            for p in scan_ports(configured_ports=configured)
+            if request.include_in_use or not p.in_use
+        ]
+    targets = [(port, motor_type) for port in ports for motor_type in motor_types]
+
+    def lines() -> Iterator[str]:
+        for motor in iter_scan_motors(targets, request.baud_rates):
+            response = DiscoveredMotorResponse(
+                motor_id=motor.motor_id,
+                motor_type=motor.motor_type,
+                baud_rate=motor.baud_rate,
+                model_number=motor.model_number,
+                port=motor.port,
+            )
+            yield response.model_dump_json(by_alias=True) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.get("/pairings")
 async def list_pairings() -> list[PairingInfo]:
     """List all leader-follower pairings."""
@@ -163,15 +210,20 @@ async def emergency_stop() -> dict[str, str]:
     """
     logger.critical("!!! E-STOP triggered via API !!!")
     try:
-        from nextis.api.routes.teleop import get_teleop_loop
+        from nextis.api.routes.teleop import get_teleop_engine
 
-        loop = get_teleop_loop()
-        if loop and loop.robot:
+        engine = get_teleop_engine()
+        robots = [loop.robot for loop in engine.loops.values() if loop.robot] if engine else []
+        if robots:
             from nextis.control.safety import SafetyLayer
 
             safety = SafetyLayer(robot_lock=threading.Lock())
-            with contextlib.suppress(Exception):
-                safety.emergency_stop(loop.robot)
+            for robot in robots:
+                with contextlib.suppress(Exception):
+                    safety.emergency_stop(robot)
+            # Keep the stopped instances for a warm reconnect
+            released = get_registry().release_after_estop(robots)
+            logger.info("E-STOP: released %s for warm reconnect", released)
         else:
             logger.info("E-STOP: no active robot — mock/idle mode, nothing to disconnect")
     except Exception as exc:
@@ -179,6 +231,22 @@ async def emergency_stop() -> dict[str, str]:
     return {"status": "stopped"}
 
 
+@router.post("/connect-many")
+def connect_many(request: ConnectManyRequest) -> dict[str, dict]:
+    """Connect several arms in parallel (default: every arm in a pairing).
+
+    Arms kept warm by a previous disconnect or E-stop are reused.
+    """
+    reg = get_registry()
+    results = reg.connect_many(request.arm_ids)
+    for arm_id, result in results.items():
+        if result["success"]:
+            _auto_apply_calibration(arm_id)
+    connected = sum(1 for r in results.values() if r["success"])
+    logger.info("Connected %d/%d arms via API", connected, len(results))
+    return {"results": results}
+
+
 # ------------------------------------------------------------------
 # Legacy body-based connect/disconnect (backward compat)
 # ------------------------------------------------------------------
@@ -269,10 +337,13 @@ def connect_arm(arm_id: str) -> dict:
 
 
 @router.post("/arms/{arm_id}/disconnect")
-def disconnect_arm(arm_id: str) -> dict:
-    """Disconnect a single arm by path parameter."""
+def disconnect_arm(arm_id: str, warm: bool = False) -> dict:
+    """Disconnect a single arm by path parameter.
+
+    With ``?warm=true`` the instance is kept so the next connect is fast.
+    """
     reg = get_registry()
-    result = reg.disconnect_arm(arm_id)
+    result = reg.disconnect_arm(arm_id, keep_warm=warm)
     if not result["success"]:
         raise HTTPException(400, result.get("error", "Disconnect failed"))
     logger.info("Arm disconnected via API: %s", arm_id)
@@ -298,9 +369,14 @@ async def clear_home(arm_id: str) -> dict:
 
 
 @router.get("/arms/{arm_id}/motors")
-def get_motor_diagnostics(arm_id: str) -> list[MotorDiagnosticsResponse]:
-    """Read motor diagnostics (position, temp, current, errors)."""
+def get_motor_diagnostics(arm_id: str, live: bool = False) -> list[MotorDiagnosticsResponse]:
+    """Motor diagnostics (position, temp, current, errors).
+
+    Served from the diagnostics sampler's latest sample without touching the
+    bus. ``?live=true`` (or no sample yet) reads the motors directly.
+    """
     from nextis.hardware.diagnostics import read_diagnostics
+    from nextis.state import get_state
 
     reg = get_registry()
     arm = reg.arms.get(arm_id)
@@ -311,7 +387,14 @@ def get_motor_diagnostics(arm_id: str) -> list[MotorDiagnosticsResponse]:
     if instance is None:
         return []  # Not connected — empty diagnostics, no crash
 
-    results = read_diagnostics(instance, arm.motor_type)
+    sampler = get_state().diagnostics_sampler
+    cached = sampler.snapshot(arm_id) if sampler is not None and not live else None
+    if cached is not None:
+        age, results = cached
+    else:
+        age = None
+        with reg.bus_lock(arm_id):
+            results = read_diagnostics(instance, arm.motor_type)
     return [
         MotorDiagnosticsResponse(
             motor_id=r.motor_id,
@@ -323,11 +406,47 @@ def get_motor_diagnostics(arm_id: str) -> list[MotorDiagnosticsResponse]:
             voltage_v=r.voltage_v,
             error_flags=r.error_flags,
             error_description=r.error_description,
+            params=r.params,
+            sample_age_s=age,
         )
         for r in results
     ]
 
 
+@router.get("/arms/{arm_id}/motors/trend", response_model=MotorTrendResponse)
+async def get_motor_trend(arm_id: str, seconds: float = 60.0) -> MotorTrendResponse:
+    """Return the sampled diagnostics of the last ``seconds`` (no bus access)."""
+    from nextis.state import get_state
+
+    reg = get_registry()
+    if arm_id not in reg.arms:
+        raise HTTPException(404, f"Arm '{arm_id}' not found")
+    sampler = get_state().diagnostics_sampler
+    trend = sampler.trend(arm_id, seconds) if sampler is not None else None
+    if trend is None:
+        return MotorTrendResponse(arm_id=arm_id, seconds=seconds)
+    return MotorTrendResponse(
+        arm_id=arm_id,
+        seconds=seconds,
+        age_s=trend["age_s"],
+        motors=trend["motors"],
+    )
+
+
+@router.get("/arms/{arm_id}/bus-stats", response_model=ArmBusStatsResponse)
+async def get_bus_stats(arm_id: str) -> ArmBusStatsResponse:
+    """Return frame/byte counters, round-trip latency and load % per bus."""
+    reg = get_registry()
+    buses = reg.get_bus_stats(arm_id)
+    if buses is None:
+        raise HTTPException(404, f"Arm '{arm_id}' not found")
+    return ArmBusStatsResponse(
+        arm_id=arm_id,
+        connected=reg.get_arm_instance(arm_id) is not None,
+        buses=buses,
+    )
+
+
 @router.get("/arms/{arm_id}/compatible-followers")
 async def compatible_followers(arm_id: str) -> list[ArmStatus]:
     """Return follower arms with matching structural design."""
@@ -45,7 +45,8 @@ async def start_homing(request: HomingStartRequest) -> dict[str, str]:
     """Start homing a follower arm in a background thread.
 
     The arm must be a connected Damiao follower. Returns immediately;
-    homing runs asynchronously for up to ``request.duration`` seconds,
+    homing runs asynchronously until every joint is within
+    ``request.tolerance`` of home (at most ``request.duration`` seconds),
     then disables motors.
     """
     global _homing_thread  # noqa: PLW0603
@@ -84,6 +85,8 @@ async def start_homing(request: HomingStartRequest) -> dict[str, str]:
             "duration": request.duration,
             "homing_vel": request.velocity,
             "cancel_check": _cancel_event.is_set,
+            "max_velocity": request.max_velocity,
+            "tolerance": request.tolerance,
         },
         daemon=True,
         name="HomingLoop",
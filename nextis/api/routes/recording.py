@@ -8,6 +8,7 @@ loop, sampling at 50 Hz.
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from fastapi import APIRouter, HTTPException
 
@@ -58,11 +59,14 @@ async def start_recording(step_id: str, request: RecordingStartRequest) -> dict:
             step_id=step_id,
             camera_keys=camera_keys,
         )
+        # Share the loop's per-tick telemetry instead of reading the bus again
+        loop.telemetry_enabled = True
         recorder.start(
             robot_state_fn=lambda: loop.robot.get_observation(),
             action_fn=lambda: loop.latest_action,
             torque_fn=lambda: loop.robot.get_torques(),
             camera_fn=camera_fn,
+            telemetry_fn=lambda: loop.telemetry,
         )
         state.recorder = recorder
     except RecordingError as e:
@@ -101,6 +105,7 @@ async def stop_recording() -> DemoInfo:
         timestamp=metadata.timestamp,
     )
     state.recorder = None
+    _release_telemetry(state)
     return info
 
 
@@ -116,6 +121,7 @@ async def discard_recording() -> dict[str, str]:
 
     state.recorder.discard()
     state.recorder = None
+    _release_telemetry(state)
     return {"status": "discarded"}
 
 
@@ -161,3 +167,10 @@ async def delete_demo(assembly_id: str, step_id: str, demo_id: str) -> dict:
     for f in matching:
         f.unlink()
     return {"status": "deleted", "demoId": demo_id}
+
+
+def _release_telemetry(state: Any) -> None:
+    """Stop the teleop loop reading telemetry on the recorder's behalf."""
+    loop = state.teleop_loop
+    if loop is not None:
+        loop.telemetry_enabled = False
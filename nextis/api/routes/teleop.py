@@ -1,7 +1,8 @@
 """Teleoperation control routes.
 
-Manages a single TeleopLoop instance stored on SystemState.  Supports
-mock mode for testing without hardware and real mode via arm_registry.
+Manages a TeleopEngine stored on SystemState that runs one TeleopLoop per
+leader→follower pairing under a shared scheduler.  Supports mock mode for
+testing without hardware and real mode via arm_registry.
 """
 
 from __future__ import annotations
@@ -9,16 +10,26 @@ from __future__ import annotations
 import logging
 import threading
 import uuid
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, HTTPException, Query
 
-from nextis.api.schemas import TeleopStartRequest, TeleopState
+from nextis.api.schemas import TeleopMetrics, TeleopStartRequest, TeleopState
+from nextis.control.leader_assist import LeaderAssistService
+from nextis.control.teleop_engine import TeleopEngine
 from nextis.control.teleop_loop import TeleopLoop
+from nextis.errors import CalibrationError
+
+if TYPE_CHECKING:
+    from nextis.hardware.types import ArmDefinition, Pairing
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Dynamixel leader motors kept in CURRENT_POSITION mode for force feedback
+_FORCE_FEEDBACK_MOTORS = ("gripper", "joint_4")
+
 
 # ------------------------------------------------------------------
 # Public accessor (used by recording routes and e-stop)
@@ -26,12 +37,19 @@ router = APIRouter()
 
 
 def get_teleop_loop() -> TeleopLoop | None:
-    """Return the current teleop loop instance, or None."""
+    """Return the primary pairing's teleop loop, or None."""
     from nextis.state import get_state
 
     return get_state().teleop_loop
 
 
+def get_teleop_engine() -> TeleopEngine | None:
+    """Return the current teleop engine, or None."""
+    from nextis.state import get_state
+
+    return get_state().teleop_engine
+
+
 # ------------------------------------------------------------------
 # Routes
 # ------------------------------------------------------------------
@@ -45,44 +63,80 @@ async def start_teleop(
     """Start a teleoperation session.
 
     Args:
-        request: Body with arm selection.
+        request: Body with arm selection. ``leaderAssist`` drives the leaders
+            with gravity/friction assist; ``learnGravity`` additionally
+            refines each leader's gravity model online (implies assist).
         mock: If True, use MockRobot + MockLeader instead of real hardware.
     """
     from nextis.state import get_state
 
     state = get_state()
 
-    if state.teleop_loop is not None and state.teleop_loop.is_running:
+    if state.teleop_engine is not None and state.teleop_engine.is_running:
         raise HTTPException(status_code=409, detail="Teleop session already active")
 
+    use_assist = request.leader_assist or request.learn_gravity
+    stacks: dict[str, tuple] = {}
+    # Leader bus locks shared with the diagnostics sampler (real hardware only)
+    leader_locks: dict[str, Any] = {}
+    assists: dict[str, tuple[dict[str, LeaderAssistService], dict[str, list[str]]]] = {}
     if mock:
-        robot, leader, safety, mapper, gripper_ff, joint_ff = _create_mock_stack()
+        if use_assist:
+            raise HTTPException(status_code=400, detail="Leader assist needs real hardware")
+        stacks["mock"] = _create_mock_stack()
     else:
+        from nextis.api.routes.hardware import get_registry
+
+        registry = get_registry()
         try:
-            robot, leader, safety, mapper, gripper_ff, joint_ff = _create_real_stack(request.arms)
-        except ValueError as e:
+            for pairing in _select_pairings(request.arms, request.all_pairings):
+                pairing_id = f"{pairing.leader_id}->{pairing.follower_id}"
+                stacks[pairing_id] = _create_real_stack(pairing)
+                leader_locks[pairing_id] = registry.bus_lock(pairing.leader_id)
+                if use_assist:
+                    assists[pairing_id] = _create_leader_assist(
+                        registry.arms[pairing.leader_id],
+                        stacks[pairing_id][1],
+                        learn_gravity=request.learn_gravity,
+                    )
+        except (ValueError, CalibrationError) as e:
             raise HTTPException(status_code=400, detail=str(e)) from e
 
-    loop = TeleopLoop(
-        robot=robot,
-        leader=leader,
-        safety=safety,
-        joint_mapper=mapper,
-        gripper_ff=gripper_ff,
-        joint_ff=joint_ff,
-    )
-    loop.start()
-
-    state.teleop_loop = loop
+    loops: dict[str, TeleopLoop] = {}
+    for pairing_id, (robot, leader, safety, mapper, gripper_ff, joint_ff) in stacks.items():
+        services, groups = assists.get(pairing_id, ({}, {}))
+        loop = TeleopLoop(
+            robot=robot,
+            leader=leader,
+            safety=safety,
+            joint_mapper=mapper,
+            leader_assists=services,
+            gripper_ff=gripper_ff,
+            joint_ff=joint_ff,
+            pipelined=request.pipelined,
+            safety_monitor_hz=request.safety_monitor_hz,
+            leader_lock=leader_locks.get(pairing_id),
+            shared_bus=not mock,
+        )
+        if services:
+            loop.assist_groups = groups
+            loop.assist_enabled = True
+        loops[pairing_id] = loop
+    engine = TeleopEngine(loops)
+    engine.start()
+
+    state.teleop_engine = engine
     state.teleop_session_id = str(uuid.uuid4())[:8]
     state.teleop_session_arms = request.arms
     state.teleop_session_mock = mock
 
     logger.info(
-        "Teleop session started: id=%s mock=%s arms=%s",
+        "Teleop session started: id=%s mock=%s arms=%s pairings=%s pipelined=%s",
         state.teleop_session_id,
         mock,
         request.arms,
+        engine.pairing_ids,
+        request.pipelined,
     )
     return {"status": "ok", "sessionId": state.teleop_session_id}
 
@@ -94,7 +148,7 @@ async def stop_teleop() -> dict[str, str]:
 
     state = get_state()
 
-    if state.teleop_loop is None or not state.teleop_loop.is_running:
+    if state.teleop_engine is None or not state.teleop_engine.is_running:
         raise HTTPException(status_code=409, detail="No active teleop session")
 
     # Auto-stop any active recording to prevent orphaned threads.
@@ -106,9 +160,9 @@ async def stop_teleop() -> dict[str, str]:
             pass
         state.recorder = None
 
-    state.teleop_loop.stop()
+    state.teleop_engine.stop()
     old_id = state.teleop_session_id
-    state.teleop_loop = None
+    state.teleop_engine = None
     state.teleop_session_id = None
 
     logger.info("Teleop session stopped: id=%s", old_id)
@@ -122,7 +176,8 @@ async def get_teleop_state() -> TeleopState:
 
     state = get_state()
 
-    if state.teleop_loop is None or not state.teleop_loop.is_running:
+    engine = state.teleop_engine
+    if engine is None or not engine.is_running:
         return TeleopState()
 
     return TeleopState(
@@ -130,7 +185,33 @@ async def get_teleop_state() -> TeleopState:
         arms=state.teleop_session_arms,
         session_id=state.teleop_session_id,
         mock=state.teleop_session_mock,
-        loop_count=state.teleop_loop.loop_count,
+        loop_count=engine.loop_count,
+        pairings=engine.active_pairings,
+    )
+
+
+@router.get("/metrics", response_model=TeleopMetrics)
+async def get_teleop_metrics() -> TeleopMetrics:
+    """Return per-stage latency histograms and overrun counters.
+
+    Returns an empty, inactive payload when no session exists.
+    """
+    from nextis.state import get_state
+
+    engine = get_state().teleop_engine
+    if engine is None:
+        return TeleopMetrics()
+
+    snapshot = engine.get_metrics()
+    pairings = {pid: _to_metrics(m) for pid, m in snapshot["pairings"].items()}
+    # Top level mirrors the primary pairing for single-pairing clients
+    primary = next(iter(pairings.values()))
+    return primary.model_copy(
+        update={
+            "active": snapshot["running"],
+            "loop_count": snapshot["loop_count"],
+            "pairings": pairings,
+        }
     )
 
 
@@ -139,6 +220,27 @@ async def get_teleop_state() -> TeleopState:
 # ------------------------------------------------------------------
 
 
+def _to_metrics(snapshot: dict) -> TeleopMetrics:
+    """Convert a TeleopLoop.get_metrics() snapshot to the response schema."""
+    return TeleopMetrics(
+        active=snapshot["running"],
+        frequency_hz=snapshot["frequency_hz"],
+        period_ms=snapshot["period_ms"],
+        loop_count=snapshot["loop_count"],
+        ticks=snapshot["ticks"],
+        overruns=snapshot["overruns"],
+        overrun_rate=snapshot["overrun_rate"],
+        worst_tick_ms=snapshot["worst_tick_ms"],
+        window=snapshot["window"],
+        stages=snapshot["stages"],
+        scheduler=snapshot["scheduler"],
+        pipelined=snapshot["pipelined"],
+        pipeline=snapshot["pipeline"],
+        safety_monitor=snapshot["safety_monitor"],
+        torque_trend=snapshot["torque_trend"],
+    )
+
+
 def _create_mock_stack() -> tuple:
     """Create MockRobot, MockLeader, SafetyLayer, and JointMapper for mock mode."""
     from nextis.control.joint_mapping import JointMapper, ValueMode
@@ -177,7 +279,7 @@ def _ensure_leader_modes(leader: object, leader_arm: object) -> None:
     # Gripper and joint_4 need CURRENT_POSITION (5) for force feedback:
     # - gripper: allows Goal_Current writes for grip resistance
     # - joint_4: allows virtual spring feedback via Goal_Current + Goal_Position
-    for motor_name in ("gripper", "joint_4"):
+    for motor_name in _FORCE_FEEDBACK_MOTORS:
         if motor_name not in bus.motors:
             continue
         try:
@@ -201,32 +303,89 @@ def _ensure_leader_modes(leader: object, leader_arm: object) -> None:
             logger.warning("Could not verify %s operating mode: %s", motor_name, e)
 
 
-def _create_real_stack(arm_selection: list[str]) -> tuple:
-    """Create real hardware stack from connected arms in the ArmRegistryService.
+def _create_leader_assist(
+    leader_arm: ArmDefinition,
+    leader: Any,
+    learn_gravity: bool = False,
+) -> tuple[dict[str, LeaderAssistService], dict[str, list[str]]]:
+    """Build leader-assist services and joint groups for one leader arm.
+
+    Bi-manual leaders get a ``left`` and ``right`` group, single arms one
+    ``default`` group. Each group's joints come from the arm's
+    ``assist_joints`` config, else every motor not used by force feedback.
+
+    Args:
+        leader_arm: ArmDefinition of the leader.
+        leader: Connected leader instance.
+        learn_gravity: Refine the gravity models online during teleop.
+
+    Returns:
+        Tuple of (arm_key -> service, arm_key -> leader joint names).
+
+    Raises:
+        CalibrationError: If online learning is unsupported for the motor type.
+    """
+    from nextis.config import CALIBRATION_DIR
+
+    sides = [
+        (side, getattr(leader, f"{side}_arm"), f"{side}_")
+        for side in ("left", "right")
+        if hasattr(leader, f"{side}_arm")
+    ] or [("default", leader, "")]
+
+    services: dict[str, LeaderAssistService] = {}
+    groups: dict[str, list[str]] = {}
+    for arm_key, arm, prefix in sides:
+        bus = getattr(arm, "bus", None)
+        if bus is None:
+            continue
+        motors = leader_arm.config.get("assist_joints") or [
+            m for m in bus.motors if m not in _FORCE_FEEDBACK_MOTORS
+        ]
+        arm_id = leader_arm.id if arm_key == "default" else f"{leader_arm.id}_{arm_key}"
+        service = LeaderAssistService(
+            arm_id=arm_id,
+            calibration_path=CALIBRATION_DIR / f"gravity_{arm_id}.json",
+            motor_type=leader_arm.motor_type,
+        )
+        if learn_gravity:
+            service.start_online_learning()
+        services[arm_key] = service
+        groups[arm_key] = [f"{prefix}{m}" for m in motors]
+    logger.info(
+        "Leader assist on %s: %s%s",
+        leader_arm.id,
+        {k: len(v) for k, v in groups.items()},
+        " (learning gravity online)" if learn_gravity else "",
+    )
+    return services, groups
+
+
+def _select_pairings(arm_selection: list[str], all_pairings: bool = False) -> list[Pairing]:
+    """Pick the connected leader-follower pairings to teleoperate.
 
-    Finds a connected leader-follower pairing, retrieves robot and leader
-    instances, and builds the full control stack with joint mapping and
-    force feedback.
+    With ``["default"]`` only the first connected pairing is used unless
+    ``all_pairings`` is set. With explicit arm IDs, every connected pairing
+    touching one of them is used. Pairings that reuse an arm already taken
+    by an earlier pairing are skipped — one bus cannot serve two loops.
 
     Args:
         arm_selection: Arm IDs to use, or ``["default"]`` for first pairing.
+        all_pairings: Use every connected pairing.
 
     Returns:
-        Tuple of (robot, leader, safety, mapper, gripper_ff, joint_ff).
+        List of Pairing objects (never empty).
 
     Raises:
-        ValueError: If no connected pairing found or instances unavailable.
+        ValueError: If no connected pairing found.
     """
     from nextis.api.routes.hardware import get_registry
-    from nextis.control.force_feedback import GripperForceFeedback, JointForceFeedback
-    from nextis.control.joint_mapping import JointMapper
-    from nextis.control.safety import SafetyLayer
-    from nextis.hardware.types import ConnectionStatus, MotorType
+    from nextis.hardware.types import ConnectionStatus
 
     registry = get_registry()
 
-    # ── 1. Find a pairing where both arms are connected ───────────
-    pairing = None
+    selected: list[Pairing] = []
+    claimed: set[str] = set()
     for p in registry.pairings:
         leader_ok = registry.arm_status.get(p.leader_id) == ConnectionStatus.CONNECTED
         follower_ok = registry.arm_status.get(p.follower_id) == ConnectionStatus.CONNECTED
@@ -239,10 +398,15 @@ def _create_real_stack(arm_selection: list[str]) -> tuple:
             and p.follower_id not in arm_selection
         ):
             continue
-        pairing = p
-        break
+        if p.leader_id in claimed or p.follower_id in claimed:
+            logger.warning("Skipping pairing '%s': arm already in use by another pairing", p.name)
+            continue
+        selected.append(p)
+        claimed.update((p.leader_id, p.follower_id))
+        if arm_selection == ["default"] and not all_pairings:
+            break
 
-    if pairing is None:
+    if not selected:
         statuses = {
             aid: registry.arm_status.get(aid, ConnectionStatus.DISCONNECTED).value
             for p in registry.pairings
@@ -253,6 +417,32 @@ def _create_real_stack(arm_selection: list[str]) -> tuple:
             "Connect both leader and follower via POST /hardware/connect first. "
             f"Current statuses: {statuses}"
         )
+    return selected
+
+
+def _create_real_stack(pairing: Pairing) -> tuple:
+    """Create the real hardware stack for one pairing from the ArmRegistryService.
+
+    Retrieves robot and leader instances and builds the full control stack
+    with joint mapping and force feedback. Each pairing gets its own safety
+    layer and force-feedback state.
+
+    Args:
+        pairing: Connected Pairing to build the stack for.
+
+    Returns:
+        Tuple of (robot, leader, safety, mapper, gripper_ff, joint_ff).
+
+    Raises:
+        ValueError: If instances unavailable or the mapping is empty.
+    """
+    from nextis.api.routes.hardware import get_registry
+    from nextis.control.force_feedback import GripperForceFeedback, JointForceFeedback
+    from nextis.control.joint_mapping import JointMapper
+    from nextis.control.safety import SafetyLayer
+    from nextis.hardware.types import MotorType
+
+    registry = get_registry()
 
     leader_arm = registry.arms.get(pairing.leader_id)
     follower_arm = registry.arms.get(pairing.follower_id)
@@ -265,7 +455,7 @@ def _create_real_stack(arm_selection: list[str]) -> tuple:
         follower_arm.motor_type.value if follower_arm else "?",
     )
 
-    # ── 2. Retrieve arm instances ─────────────────────────────────
+    # ── 1. Retrieve arm instances ─────────────────────────────────
     robot = registry.get_arm_instance(pairing.follower_id)
     leader = registry.get_arm_instance(pairing.leader_id)
 
@@ -281,12 +471,13 @@ def _create_real_stack(arm_selection: list[str]) -> tuple:
             "Ensure connect_arm succeeded (check lerobot availability if it failed)."
         )
 
-    # ── 3. Verify leader operating modes ──────────────────────────
+    # ── 2. Verify leader operating modes ──────────────────────────
     if leader_arm:
         _ensure_leader_modes(leader, leader_arm)
 
-    # ── 4. Build control stack ────────────────────────────────────
-    safety = SafetyLayer(robot_lock=threading.Lock())
+    # ── 3. Build control stack ────────────────────────────────────
+    # The follower bus lock is shared with the diagnostics sampler
+    safety = SafetyLayer(robot_lock=registry.bus_lock(pairing.follower_id))
 
     mapper = JointMapper(arm_registry=registry)
     mapper.compute_mappings(
@@ -82,6 +82,11 @@ class TeleopStartRequest(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
     arms: list[str] = Field(default_factory=lambda: ["default"])
+    all_pairings: bool = Field(False, alias="allPairings")
+    pipelined: bool = False
+    safety_monitor_hz: float | None = Field(None, alias="safetyMonitorHz", gt=0)
+    leader_assist: bool = Field(False, alias="leaderAssist")
+    learn_gravity: bool = Field(False, alias="learnGravity")
 
 
 class TeleopState(BaseModel):
@@ -94,6 +99,54 @@ class TeleopState(BaseModel):
     session_id: str | None = Field(None, alias="sessionId")
     mock: bool = False
     loop_count: int = Field(0, alias="loopCount")
+    pairings: list[str] = Field(default_factory=list)
+
+
+class StageLatency(BaseModel):
+    """Latency distribution for one stage of the teleop tick."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    count: int = 0
+    mean_ms: float = Field(0.0, alias="meanMs")
+    p50_ms: float = Field(0.0, alias="p50Ms")
+    p90_ms: float = Field(0.0, alias="p90Ms")
+    p99_ms: float = Field(0.0, alias="p99Ms")
+    max_ms: float = Field(0.0, alias="maxMs")
+
+
+class TeleopWindowStats(BaseModel):
+    """Loop rate and deadline stats over the last reporting window."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    rate_hz: float = Field(0.0, alias="rateHz")
+    ticks: int = 0
+    overruns: int = 0
+    worst_tick_ms: float = Field(0.0, alias="worstTickMs")
+
+
+class TeleopMetrics(BaseModel):
+    """Per-stage latency histograms and overrun accounting for the teleop loop."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    active: bool = False
+    frequency_hz: float = Field(0.0, alias="frequencyHz")
+    period_ms: float = Field(0.0, alias="periodMs")
+    loop_count: int = Field(0, alias="loopCount")
+    ticks: int = 0
+    overruns: int = 0
+    overrun_rate: float = Field(0.0, alias="overrunRate")
+    worst_tick_ms: float = Field(0.0, alias="worstTickMs")
+    window: TeleopWindowStats = Field(default_factory=TeleopWindowStats)
+    stages: dict[str, StageLatency] = Field(default_factory=dict)
+    scheduler: dict[str, float] = Field(default_factory=dict)
+    pipelined: bool = False
+    pipeline: dict[str, StageLatency] = Field(default_factory=dict)
+    safety_monitor: dict[str, Any] = Field(default_factory=dict, alias="safetyMonitor")
+    torque_trend: dict[str, float] = Field(default_factory=dict, alias="torqueTrend")
+    pairings: dict[str, TeleopMetrics] = Field(default_factory=dict)
 
 
 # ------------------------------------------------------------------
@@ -301,6 +354,14 @@ class ConnectRequest(BaseModel):
     arm_id: str = Field(alias="armId")
 
 
+class ConnectManyRequest(BaseModel):
+    """Request to connect several arms in parallel."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    arm_ids: list[str] | None = Field(None, alias="armIds")
+
+
 class AddArmRequest(BaseModel):
     """Request body for adding a new arm to the registry."""
 
@@ -357,6 +418,17 @@ class ScanMotorsRequest(BaseModel):
     baud_rates: list[int] | None = Field(None, alias="baudRates")
 
 
+class ScanAllMotorsRequest(BaseModel):
+    """Request body for a concurrent motor scan across several ports."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    ports: list[str] | None = None
+    motor_types: list[str] = Field(alias="motorTypes")
+    baud_rates: list[int] | None = Field(None, alias="baudRates")
+    include_in_use: bool = Field(False, alias="includeInUse")
+
+
 class PortInfoResponse(BaseModel):
     """A discovered serial port."""
 
@@ -382,6 +454,60 @@ class MotorDiagnosticsResponse(BaseModel):
     voltage_v: float | None = Field(None, alias="voltageV")
     error_flags: int = Field(0, alias="errorFlags")
     error_description: str = Field("", alias="errorDescription")
+    params: dict[str, float | None] = Field(default_factory=dict)
+    sample_age_s: float | None = Field(None, alias="sampleAgeS")
+
+
+class MotorTrendResponse(BaseModel):
+    """Recent diagnostics samples of one arm, oldest first."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    arm_id: str = Field(alias="armId")
+    seconds: float
+    age_s: list[float] = Field(default_factory=list, alias="ageS")
+    motors: dict[str, dict[str, list[float | None]]] = Field(default_factory=dict)
+
+
+class BusWindowStats(BaseModel):
+    """Bus load and frame rates over the last reporting window."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    load_pct: float = Field(0.0, alias="loadPct")
+    frames_tx_per_s: float = Field(0.0, alias="framesTxPerS")
+    frames_rx_per_s: float = Field(0.0, alias="framesRxPerS")
+
+
+class BusStatsResponse(BaseModel):
+    """Traffic counters and utilisation estimate for one motor bus."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    kind: str
+    bitrate: int
+    frames_tx: int = Field(0, alias="framesTx")
+    frames_rx: int = Field(0, alias="framesRx")
+    bytes_tx: int = Field(0, alias="bytesTx")
+    bytes_rx: int = Field(0, alias="bytesRx")
+    parse_errors: int = Field(0, alias="parseErrors")
+    timeouts: int = 0
+    rx_pending_bytes: int = Field(0, alias="rxPendingBytes")
+    rx_overflows: int = Field(0, alias="rxOverflows")
+    load_pct: float = Field(0.0, alias="loadPct")
+    avg_load_pct: float = Field(0.0, alias="avgLoadPct")
+    window: BusWindowStats = Field(default_factory=BusWindowStats)
+    rtt: StageLatency = Field(default_factory=StageLatency)
+
+
+class ArmBusStatsResponse(BaseModel):
+    """Per-bus traffic counters for one arm."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    arm_id: str = Field(alias="armId")
+    connected: bool = False
+    buses: dict[str, BusStatsResponse] = Field(default_factory=dict)
 
 
 class DiscoveredMotorResponse(BaseModel):
@@ -393,6 +519,7 @@ class DiscoveredMotorResponse(BaseModel):
     motor_type: str = Field(alias="motorType")
     baud_rate: int = Field(alias="baudRate")
     model_number: int | None = Field(None, alias="modelNumber")
+    port: str = ""
 
 
 # ------------------------------------------------------------------
@@ -407,8 +534,11 @@ class HomingStartRequest(BaseModel):
 
     arm_id: str = Field(alias="armId")
     home_pos: dict[str, float] | None = Field(None, alias="homePos")
-    duration: float = 10.0
+    duration: float = 10.0  # upper bound; homing ends once home is reached
     velocity: float = 0.05
+    # Peak trajectory velocity (rad/s); derived from ``velocity`` when unset
+    max_velocity: float | None = Field(None, alias="maxVelocity", gt=0)
+    tolerance: float = 0.02
 
 
 # ------------------------------------------------------------------
@@ -416,6 +546,18 @@ class HomingStartRequest(BaseModel):
 # ------------------------------------------------------------------
 
 
+class RangeJointProgress(BaseModel):
+    """Live range discovery progress of one joint (simultaneous mode)."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    min: float | None = None
+    max: float | None = None
+    coverage: float = 0.0
+    samples: int = 0
+    settled: bool = False
+
+
 class CalibrationStatusResponse(BaseModel):
     """Calibration profile status for an arm."""
 
@@ -429,6 +571,9 @@ class CalibrationStatusResponse(BaseModel):
     range_discovery_active: bool = Field(False, alias="rangeDiscoveryActive")
     range_discovery_progress: float = Field(0.0, alias="rangeDiscoveryProgress")
     range_discovery_joint: str | None = Field(None, alias="rangeDiscoveryJoint")
+    range_discovery_joints: dict[str, RangeJointProgress] = Field(
+        default_factory=dict, alias="rangeDiscoveryJoints"
+    )
 
 
 class CalibrationProfileResponse(BaseModel):
@@ -451,6 +596,10 @@ class RangeDiscoveryRequest(BaseModel):
     speed: float = 0.1
     duration_per_joint: float = Field(10.0, alias="durationPerJoint")
     joints: list[str] | None = None
+    mode: str = "sequential"  # or "simultaneous"
+    max_duration: float = Field(60.0, alias="maxDuration")
+    settle_time: float = Field(3.0, alias="settleTime")
+    max_rate_hz: float | None = Field(None, alias="maxRateHz")
 
 
 # ------------------------------------------------------------------
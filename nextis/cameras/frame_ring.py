@@ -0,0 +1,246 @@
+"""Preallocated frame ring with leased read-only views.
+
+A capture thread writes each frame into the next free slot of a small ring
+instead of allocating a new array, then publishes it with a sequence
+number and timestamp. Readers lease the latest slot and get a read-only
+NumPy view of it; the writer never reuses a slot while a lease pins it.
+Readers that need a fresh frame block in :meth:`FrameRing.wait` on a
+condition variable that every commit notifies.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import numpy as np
+
+
+class FrameLease:
+    """Read-only view of one published frame, pinned until released.
+
+    Use as a context manager or call :meth:`release`. The view must not be
+    used after release — copy it if it has to outlive the lease.
+
+    Attributes:
+        frame: Read-only view of the frame.
+        seq: Sequence number of the frame (1 for the first published frame).
+        timestamp: ``time.monotonic()`` at which the frame was published.
+    """
+
+    __slots__ = ("_generation", "_ring", "_slot", "frame", "seq", "timestamp")
+
+    def __init__(
+        self,
+        ring: FrameRing,
+        slot: int,
+        generation: int,
+        frame: np.ndarray,
+        seq: int,
+        timestamp: float,
+    ) -> None:
+        self._ring: FrameRing | None = ring
+        self._slot = slot
+        self._generation = generation
+        self.frame = frame
+        self.seq = seq
+        self.timestamp = timestamp
+
+    def release(self) -> None:
+        """Unpin the slot so the writer may reuse it. Idempotent."""
+        if self._ring is not None:
+            self._ring._unpin(self._slot, self._generation)
+            self._ring = None
+
+    def __enter__(self) -> FrameLease:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
+
+
+class FrameRing:
+    """Fixed set of frame buffers shared by one writer and many readers.
+
+    Buffers are allocated on the first frame (and again if the frame shape
+    or dtype changes). When every other slot is pinned by a lease the
+    incoming frame is dropped and counted.
+
+    Args:
+        slots: Number of frame buffers (at least 2).
+    """
+
+    def __init__(self, slots: int = 4) -> None:
+        if slots < 2:
+            raise ValueError("FrameRing needs at least 2 slots")
+        self._lock = threading.Lock()
+        self._new_frame = threading.Condition(self._lock)
+        self._buffers: list[np.ndarray] = []
+        self._views: list[np.ndarray] = []
+        self._pins = [0] * slots
+        self._slot_seq = [0] * slots
+        self._slot_time = [0.0] * slots
+        self._slots = slots
+        self._generation = 0
+        self._latest = -1
+        self._next = 0
+        self._epoch = 0
+        self.seq = 0
+        self.dropped = 0
+
+    @property
+    def timestamp(self) -> float:
+        """Publish time of the latest frame, or 0.0 if none."""
+        return self._slot_time[self._latest] if self._latest >= 0 else 0.0
+
+    def claim(self) -> tuple[int, np.ndarray | None]:
+        """Reserve the next writable slot.
+
+        Returns:
+            ``(slot, buffer)`` to fill and pass to :meth:`commit`; buffer is
+            None before the first frame. ``(-1, None)`` if every slot is
+            in use.
+        """
+        with self._lock:
+            if not self._buffers:
+                return 0, None
+            for step in range(self._slots):
+                slot = (self._next + step) % self._slots
+                if slot != self._latest and self._pins[slot] == 0:
+                    self._next = (slot + 1) % self._slots
+                    self._slot_seq[slot] = 0  # no longer leasable
+                    return slot, self._buffers[slot]
+            return -1, None
+
+    def commit(self, slot: int, frame: np.ndarray, timestamp: float) -> bool:
+        """Publish ``frame`` in ``slot`` as the latest frame.
+
+        ``frame`` is normally the buffer returned by :meth:`claim`, filled in
+        place; any other array is copied into the slot.
+
+        Returns:
+            False if the frame was dropped (no free slot).
+        """
+        if slot < 0:
+            with self._lock:
+                self.dropped += 1
+            return False
+        if (
+            not self._buffers
+            or self._buffers[0].shape != frame.shape
+            or self._buffers[0].dtype != frame.dtype
+        ):
+            self._allocate(frame)
+        buffer = self._buffers[slot]
+        if frame is not buffer:
+            np.copyto(buffer, frame)
+        with self._lock:
+            self.seq += 1
+            self._slot_seq[slot] = self.seq
+            self._slot_time[slot] = timestamp
+            self._latest = slot
+            self._new_frame.notify_all()
+        return True
+
+    def publish(self, frame: np.ndarray, timestamp: float) -> bool:
+        """Copy ``frame`` into the next free slot and publish it."""
+        slot, _ = self.claim()
+        return self.commit(slot, frame, timestamp)
+
+    def lease(self) -> FrameLease | None:
+        """Pin and return the latest frame, or None if nothing was published."""
+        with self._lock:
+            if self._latest < 0:
+                return None
+            return self._pin(self._latest)
+
+    def wait(self, after_seq: int = 0, timeout: float | None = None) -> FrameLease | None:
+        """Block until a frame newer than ``after_seq`` is published.
+
+        Args:
+            after_seq: Sequence number the caller already has (0 for any frame).
+            timeout: Maximum wait in seconds; None waits indefinitely.
+
+        Returns:
+            Lease on the latest frame, or None on timeout or if the ring is
+            cleared while waiting.
+        """
+        with self._new_frame:
+            epoch = self._epoch
+            if not self._new_frame.wait_for(
+                lambda: self.seq > after_seq or self._epoch != epoch, timeout
+            ):
+                return None
+            if self._epoch != epoch or self._latest < 0:
+                return None
+            return self._pin(self._latest)
+
+    def lease_nearest(self, timestamp: float) -> FrameLease | None:
+        """Pin and return the buffered frame captured closest to ``timestamp``.
+
+        Considers every published slot still in the ring, not just the
+        latest, so frames from several rings can be matched in time.
+        """
+        with self._lock:
+            best, best_dt = -1, float("inf")
+            for slot in range(len(self._buffers)):
+                if self._slot_seq[slot] == 0:
+                    continue
+                dt = abs(self._slot_time[slot] - timestamp)
+                if dt < best_dt:
+                    best, best_dt = slot, dt
+            return self._pin(best) if best >= 0 else None
+
+    def clear(self) -> None:
+        """Forget the buffered frames and wake waiters (leases stay valid)."""
+        with self._lock:
+            self._latest = -1
+            self._slot_seq = [0] * self._slots
+            self._epoch += 1
+            self._new_frame.notify_all()
+
+    def stats(self) -> dict[str, int]:
+        """Sequence number, dropped frames and currently pinned slots."""
+        with self._lock:
+            return {
+                "seq": self.seq,
+                "dropped": self.dropped,
+                "pinned": sum(1 for p in self._pins if p),
+            }
+
+    def _allocate(self, frame: np.ndarray) -> None:
+        """(Re)allocate every slot for ``frame``'s shape and dtype.
+
+        Old buffers stay alive for as long as leases reference them.
+        """
+        buffers = [np.empty_like(frame) for _ in range(self._slots)]
+        views = []
+        for buffer in buffers:
+            view = buffer.view()
+            view.flags.writeable = False
+            views.append(view)
+        with self._lock:
+            self._buffers = buffers
+            self._views = views
+            self._pins = [0] * self._slots
+            self._slot_seq = [0] * self._slots
+            self._generation += 1
+            self._latest = -1
+            self._next = 0
+
+    def _pin(self, slot: int) -> FrameLease:
+        """Lease ``slot``. Caller holds the lock."""
+        self._pins[slot] += 1
+        return FrameLease(
+            self,
+            slot,
+            self._generation,
+            self._views[slot],
+            self._slot_seq[slot],
+            self._slot_time[slot],
+        )
+
+    def _unpin(self, slot: int, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation and self._pins[slot] > 0:
+                self._pins[slot] -= 1
@@ -0,0 +1,183 @@
+"""Encode-once JPEG fan-out for MJPEG streams and snapshots.
+
+One JpegEncoder per (camera, quality) encodes each captured frame at most
+once and caches the bytes keyed by the frame's sequence number. While
+MJPEG clients are subscribed, an asyncio task waits (in a worker thread)
+for each new frame, encodes it and wakes every subscriber; a subscriber that falls behind simply
+gets the newest frame next, so slow clients drop frames instead of
+queueing them or costing extra encodes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nextis.cameras.service import CameraService
+
+logger = logging.getLogger(__name__)
+
+_PART_HEADER = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+
+
+@dataclass
+class EncodedFrame:
+    """A JPEG-encoded camera frame."""
+
+    seq: int
+    timestamp: float
+    data: bytes
+    part: bytes = field(repr=False, default=b"")
+
+    def __post_init__(self) -> None:
+        if not self.part:
+            # multipart/x-mixed-replace chunk, built once for all subscribers
+            self.part = _PART_HEADER + self.data + b"\r\n"
+
+
+class JpegEncoder:
+    """Encodes one camera's frames at one JPEG quality, once per frame.
+
+    Args:
+        service: CameraService providing frame leases.
+        camera_key: Camera to encode.
+        quality: JPEG quality (10-100).
+        wait_timeout: How long the stream task blocks for a new frame before
+            rechecking for subscribers (s).
+    """
+
+    def __init__(
+        self,
+        service: CameraService,
+        camera_key: str,
+        quality: int,
+        wait_timeout: float = 0.25,
+    ) -> None:
+        self.service = service
+        self.camera_key = camera_key
+        self.quality = quality
+        self.wait_timeout = wait_timeout
+        self.encodes: int = 0
+        self._latest: EncodedFrame | None = None
+        self._encode_lock = threading.Lock()
+        self._subscribers = 0
+        self._cond: asyncio.Condition | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def subscribers(self) -> int:
+        """Number of connected stream clients."""
+        return self._subscribers
+
+    def encode_latest(self) -> EncodedFrame | None:
+        """Return the newest frame as JPEG, encoding it only if not cached.
+
+        Thread-safe; concurrent callers for the same frame share one encode.
+        """
+        with self._encode_lock:
+            lease = self.service.lease_frame(self.camera_key)
+            if lease is None:
+                return None
+            with lease:
+                cached = self._latest
+                if cached is not None and cached.seq == lease.seq:
+                    return cached
+                import cv2
+
+                ok, jpeg = cv2.imencode(
+                    ".jpg", lease.frame, [cv2.IMWRITE_JPEG_QUALITY, self.quality]
+                )
+                if not ok:
+                    return cached
+                self._latest = EncodedFrame(lease.seq, lease.timestamp, jpeg.tobytes())
+                self.encodes += 1
+            return self._latest
+
+    async def stream(self, fps: float) -> AsyncIterator[bytes]:
+        """Yield multipart MJPEG chunks at up to ``fps``, newest frame first."""
+        self._subscribers += 1
+        if self._task is None or self._task.done():
+            # New task (and condition) bound to the caller's event loop
+            self._cond = asyncio.Condition()
+            self._task = asyncio.create_task(self._run(), name=f"jpeg-{self.camera_key}")
+        cond = self._cond
+        period = 1.0 / fps
+        last_seq = 0
+        try:
+            while True:
+                async with cond:
+                    await cond.wait_for(
+                        lambda seen=last_seq: self._latest is not None and self._latest.seq > seen
+                    )
+                    frame = self._latest
+                sent = time.monotonic()
+                last_seq = frame.seq
+                yield frame.part
+                delay = period - (time.monotonic() - sent)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        finally:
+            self._subscribers -= 1
+
+    def _encode_next(self, after_seq: int) -> EncodedFrame | None:
+        """Wait for a frame newer than ``after_seq`` and encode it."""
+        lease = self.service.wait_for_frame(self.camera_key, after_seq, self.wait_timeout)
+        if lease is None:
+            return None
+        lease.release()
+        return self.encode_latest()
+
+    async def _run(self) -> None:
+        """Encode new frames and wake subscribers until none are left."""
+        cond = self._cond
+        published = self._latest.seq if self._latest else 0
+        while self._subscribers > 0:
+            started = time.monotonic()
+            try:
+                frame = await asyncio.to_thread(self._encode_next, published)
+            except Exception as exc:
+                logger.warning("JPEG encode failed for '%s': %s", self.camera_key, exc)
+                frame = None
+            if frame is not None and frame.seq > published:
+                published = frame.seq
+                async with cond:
+                    cond.notify_all()
+            elif frame is None and time.monotonic() - started < self.wait_timeout / 2:
+                # Disconnected or unknown camera returns at once: don't spin
+                await asyncio.sleep(self.wait_timeout)
+
+
+class JpegFanout:
+    """Registry of JpegEncoders for one CameraService.
+
+    Args:
+        service: CameraService providing frame leases.
+    """
+
+    def __init__(self, service: CameraService) -> None:
+        self.service = service
+        self._encoders: dict[tuple[str, int], JpegEncoder] = {}
+        self._lock = threading.Lock()
+
+    def encoder(self, camera_key: str, quality: int) -> JpegEncoder:
+        """Return the shared encoder for a camera and quality."""
+        with self._lock:
+            key = (camera_key, quality)
+            enc = self._encoders.get(key)
+            if enc is None:
+                enc = self._encoders[key] = JpegEncoder(self.service, camera_key, quality)
+            return enc
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Encode count and subscribers per ``camera@quality``."""
+        with self._lock:
+            return {
+                f"{cam}@{q}": {"encodes": enc.encodes, "subscribers": enc.subscribers}
+                for (cam, q), enc in self._encoders.items()
+            }
@@ -1,8 +1,17 @@
 """CameraService — threaded camera capture with ZOH frame access.
 
-Each connected camera runs a dedicated capture thread. Readers call
-``get_frame(camera_key)`` to get the latest frame (zero-order hold).
+Each connected camera runs a dedicated capture thread that writes into a
+preallocated FrameRing. Transient readers (encoders, verification) call
+``lease_frame(camera_key)`` for a zero-copy read-only view of the latest
+frame; ``get_frame(camera_key)`` returns a read-only copy that is made at
+most once per captured frame and shared by all callers (zero-order hold).
+Consumers that need fresh data block in ``wait_for_frame`` instead of
+polling, and ``get_synchronized`` returns time-aligned frames across cameras.
 A health monitor thread runs every 5 seconds to detect stale cameras.
+
+With ``shared_memory_prefix`` set, every color frame is also mirrored into
+a per-camera shared-memory segment that other local processes can read
+with :class:`nextis.cameras.shm_bus.SharedFrameReader`.
 """
 
 from __future__ import annotations
@@ -11,12 +20,16 @@ import contextlib
 import logging
 import threading
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
 import numpy as np
 
+from nextis.cameras.frame_ring import FrameLease, FrameRing
+from nextis.cameras.jpeg_fanout import JpegFanout
+from nextis.cameras.shm_bus import SharedFrameWriter, segment_name
 from nextis.errors import CameraError
 
 logger = logging.getLogger(__name__)
@@ -34,6 +47,7 @@ HEALTH_CHECK_INTERVAL_S = 5.0
 STALE_FRAME_THRESHOLD_S = 10.0
 MAX_RECONNECT_ATTEMPTS = 3
 RECONNECT_BACKOFF_BASE_S = 2.0
+FRAME_RING_SLOTS = 4
 
 
 class CameraType(StrEnum):
@@ -69,6 +83,26 @@ class CameraConfig:
     use_depth: bool = False
 
 
+@dataclass
+class SynchronizedFrames:
+    """Frames from several cameras captured close together in time.
+
+    Attributes:
+        frames: camera_key -> read-only frame copy.
+        timestamps: camera_key -> capture time (``time.monotonic()``).
+        seqs: camera_key -> frame sequence number.
+    """
+
+    frames: dict[str, np.ndarray]
+    timestamps: dict[str, float]
+    seqs: dict[str, int]
+
+    @property
+    def skew_s(self) -> float:
+        """Spread between the earliest and latest capture time."""
+        return max(self.timestamps.values()) - min(self.timestamps.values())
+
+
 @dataclass
 class _CameraState:
     """Internal per-camera runtime state."""
@@ -79,9 +113,12 @@ class _CameraState:
     pipeline: Any = None  # RealSense pipeline
     thread: threading.Thread | None = None
     running: bool = False
-    frame: np.ndarray | None = None
-    depth_frame: np.ndarray | None = None
+    ring: FrameRing = field(default_factory=lambda: FrameRing(FRAME_RING_SLOTS))
+    depth_ring: FrameRing = field(default_factory=lambda: FrameRing(FRAME_RING_SLOTS))
+    # Shared read-only copy of the latest frame for get_frame(): (seq, frame)
+    frame_copy: tuple[int, np.ndarray] | None = None
     frame_lock: threading.Lock = field(default_factory=threading.Lock)
+    shm_writer: SharedFrameWriter | None = None
     last_frame_time: float = 0.0
     error: str | None = None
     reconnect_count: int = 0
@@ -93,18 +130,32 @@ class CameraService:
     Thread model:
       - One daemon capture thread per connected camera.
       - One daemon health monitor thread (5s interval).
-      - Frame access via ``get_frame()`` is lock-protected and non-blocking.
+      - Frame access via ``lease_frame()`` / ``get_frame()`` is
+        non-blocking; ``wait_for_frame()`` / ``get_synchronized()`` block
+        on the capture threads' notifications. Capture never waits for
+        readers.
 
     Args:
         camera_configs: List of camera configurations from parsed YAML.
+        shared_memory_prefix: If set, publish frames to shared memory under
+            this segment name prefix.
+        shared_memory_slots: Frame buffers per shared-memory segment.
     """
 
-    def __init__(self, camera_configs: list[CameraConfig] | None = None) -> None:
+    def __init__(
+        self,
+        camera_configs: list[CameraConfig] | None = None,
+        shared_memory_prefix: str | None = None,
+        shared_memory_slots: int = FRAME_RING_SLOTS,
+    ) -> None:
         self._cameras: dict[str, _CameraState] = {}
         self._lock = threading.Lock()
         self._connect_lock = threading.Lock()
         self._health_thread: threading.Thread | None = None
         self._running = False
+        self._jpeg_fanout: JpegFanout | None = None
+        self._shm_prefix = shared_memory_prefix
+        self._shm_slots = shared_memory_slots
 
         if camera_configs:
             for cfg in camera_configs:
@@ -217,10 +268,15 @@ class CameraService:
 
         # Release hardware
         self._release_camera(state)
+        if state.shm_writer is not None:
+            state.shm_writer.close()
+            state.shm_writer = None
 
         state.status = CameraStatus.DISCONNECTED
-        state.frame = None
-        state.depth_frame = None
+        state.ring.clear()
+        state.depth_ring.clear()
+        with state.frame_lock:
+            state.frame_copy = None
         state.error = None
 
     def connect_all(self) -> dict[str, bool]:
@@ -243,25 +299,158 @@ class CameraService:
     # Frame access (ZOH — non-blocking)
     # ------------------------------------------------------------------
 
+    def lease_frame(self, camera_key: str) -> FrameLease | None:
+        """Lease the latest frame without copying. Non-blocking.
+
+        The lease pins the frame's ring slot until released; use it as a
+        context manager and copy the view if it must outlive the lease.
+
+        Args:
+            camera_key: Camera identifier.
+
+        Returns:
+            FrameLease with a read-only BGR ``(H, W, 3)`` view, or ``None``
+            if no frame.
+        """
+        state = self._cameras.get(camera_key)
+        if state is None:
+            return None
+        return state.ring.lease()
+
+    def wait_for_frame(
+        self,
+        camera_key: str,
+        after_seq: int = 0,
+        timeout: float | None = None,
+    ) -> FrameLease | None:
+        """Block until a frame newer than ``after_seq`` is captured.
+
+        Pass the ``seq`` of the previous lease to get each frame exactly
+        once, without duplicates or polling.
+
+        Args:
+            camera_key: Camera identifier.
+            after_seq: Sequence number already consumed (0 for any frame).
+            timeout: Maximum wait in seconds; None waits indefinitely.
+
+        Returns:
+            FrameLease on the new frame (release it promptly), or ``None``
+            on timeout, disconnect, or unknown camera.
+        """
+        state = self._cameras.get(camera_key)
+        if state is None:
+            return None
+        return state.ring.wait(after_seq, timeout)
+
+    def get_synchronized(
+        self,
+        camera_keys: Iterable[str] | None = None,
+        max_skew_ms: float = 20.0,
+        timeout: float = 0.5,
+    ) -> SynchronizedFrames | None:
+        """Get one frame per camera, all captured within ``max_skew_ms``.
+
+        The camera whose latest frame is oldest anchors the set; every other
+        camera contributes the buffered frame closest to it in time. If the
+        spread is too large, waits for the anchor's next frame and retries.
+
+        Args:
+            camera_keys: Cameras to align (default: all connected).
+            max_skew_ms: Maximum spread of capture timestamps.
+            timeout: Maximum time to wait for an aligned set, in seconds.
+
+        Returns:
+            SynchronizedFrames, or ``None`` if no aligned set arrived in time.
+
+        Raises:
+            CameraError: If a camera key is not configured.
+        """
+        keys = list(camera_keys) if camera_keys is not None else self.connected_keys
+        if not keys:
+            return None
+        rings: dict[str, FrameRing] = {}
+        for key in keys:
+            state = self._cameras.get(key)
+            if state is None:
+                raise CameraError(f"Camera '{key}' not configured")
+            rings[key] = state.ring
+
+        max_skew = max_skew_ms / 1000.0
+        deadline = time.monotonic() + timeout
+        while True:
+            anchor = min(keys, key=lambda k: rings[k].timestamp)
+            anchor_seq = rings[anchor].seq
+            leases: dict[str, FrameLease] = {}
+            try:
+                lease = rings[anchor].lease()
+                if lease is not None:
+                    leases[anchor] = lease
+                    anchor_seq = lease.seq
+                    for key in keys:
+                        if key != anchor:
+                            nearest = rings[key].lease_nearest(lease.timestamp)
+                            if nearest is None:
+                                break
+                            leases[key] = nearest
+                if len(leases) == len(keys):
+                    times = [ls.timestamp for ls in leases.values()]
+                    if max(times) - min(times) <= max_skew:
+                        frames = {}
+                        for key, ls in leases.items():
+                            frames[key] = ls.frame.copy()
+                            frames[key].flags.writeable = False
+                        return SynchronizedFrames(
+                            frames=frames,
+                            timestamps={k: ls.timestamp for k, ls in leases.items()},
+                            seqs={k: ls.seq for k, ls in leases.items()},
+                        )
+            finally:
+                for ls in leases.values():
+                    ls.release()
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            newer = rings[anchor].wait(anchor_seq, remaining)
+            if newer is None:
+                return None
+            newer.release()
+
+    def frame_seq(self, camera_key: str) -> int:
+        """Sequence number of the latest captured frame (0 if none yet)."""
+        state = self._cameras.get(camera_key)
+        return state.ring.seq if state is not None else 0
+
     def get_frame(self, camera_key: str) -> np.ndarray | None:
         """Get the latest frame for a camera (ZOH). Non-blocking.
 
+        The frame is copied out of the capture ring once per captured frame
+        and the same read-only array is returned to every caller until the
+        next frame arrives.
+
         Args:
             camera_key: Camera identifier.
 
         Returns:
-            BGR uint8 numpy array ``(H, W, 3)``, or ``None`` if no frame.
+            Read-only BGR uint8 numpy array ``(H, W, 3)``, or ``None`` if no frame.
         """
         state = self._cameras.get(camera_key)
         if state is None:
             return None
-        with state.frame_lock:
-            if state.frame is not None:
-                return state.frame.copy()
-        return None
+        lease = state.ring.lease()
+        if lease is None:
+            return None
+        with lease, state.frame_lock:
+            cached = state.frame_copy
+            if cached is not None and cached[0] == lease.seq:
+                return cached[1]
+            frame = lease.frame.copy()
+            frame.flags.writeable = False
+            state.frame_copy = (lease.seq, frame)
+            return frame
 
     def get_depth_frame(self, camera_key: str) -> np.ndarray | None:
-        """Get the latest depth frame (RealSense only). Non-blocking.
+        """Get a copy of the latest depth frame (RealSense only). Non-blocking.
 
         Returns:
             uint16 numpy array ``(H, W)``, or ``None`` if not available.
@@ -269,24 +458,25 @@ class CameraService:
         state = self._cameras.get(camera_key)
         if state is None:
             return None
-        with state.frame_lock:
-            if state.depth_frame is not None:
-                return state.depth_frame.copy()
-        return None
+        lease = state.depth_ring.lease()
+        if lease is None:
+            return None
+        with lease:
+            return lease.frame.copy()
 
     def get_all_frames(self) -> dict[str, np.ndarray]:
         """Get the latest frame from each connected camera.
 
         Returns:
-            Dict of camera_key -> BGR frame. Only includes cameras with
-            a frame available.
+            Dict of camera_key -> read-only BGR frame (see :meth:`get_frame`).
+            Only includes cameras with a frame available.
         """
         frames: dict[str, np.ndarray] = {}
         for key, state in self._cameras.items():
             if state.status == CameraStatus.CONNECTED:
-                with state.frame_lock:
-                    if state.frame is not None:
-                        frames[key] = state.frame.copy()
+                frame = self.get_frame(key)
+                if frame is not None:
+                    frames[key] = frame
         return frames
 
     # ------------------------------------------------------------------
@@ -312,6 +502,9 @@ class CameraService:
                 "lastFrameAgeS": round(frame_age, 2) if frame_age >= 0 else None,
                 "error": state.error,
                 "reconnectCount": state.reconnect_count,
+                "frameSeq": state.ring.seq,
+                "droppedFrames": state.ring.dropped,
+                "sharedMemory": state.shm_writer.name if state.shm_writer else None,
             }
         return result
 
@@ -336,6 +529,13 @@ class CameraService:
         with self._lock:
             self._cameras.pop(camera_key, None)
 
+    @property
+    def jpeg_fanout(self) -> JpegFanout:
+        """Shared encode-once JPEG encoders for streams and snapshots."""
+        if self._jpeg_fanout is None:
+            self._jpeg_fanout = JpegFanout(self)
+        return self._jpeg_fanout
+
     @property
     def connected_keys(self) -> list[str]:
         """List of camera keys currently connected."""
@@ -511,27 +711,53 @@ class CameraService:
                 time.sleep(sleep_time)
 
     def _read_opencv(self, state: _CameraState) -> None:
-        """Read a frame from an OpenCV camera."""
-        ret, frame = state.capture.read()
+        """Read a frame from an OpenCV camera straight into a ring slot."""
+        slot, buffer = state.ring.claim()
+        if buffer is not None:
+            ret, frame = state.capture.read(buffer)
+        else:
+            ret, frame = state.capture.read()
         if ret and frame is not None:
-            with state.frame_lock:
-                state.frame = frame
-                state.last_frame_time = time.monotonic()
+            now = time.monotonic()
+            state.ring.commit(slot, frame, now)
+            state.last_frame_time = now
+            self._share_frame(state, frame, now)
 
     def _read_realsense(self, state: _CameraState) -> None:
         """Read a frameset from a RealSense pipeline."""
         frames = state.pipeline.wait_for_frames(timeout_ms=1000)
         color = frames.get_color_frame()
         if color:
-            with state.frame_lock:
-                state.frame = np.asanyarray(color.get_data())
-                state.last_frame_time = time.monotonic()
+            # librealsense recycles its frame memory, so copy into the ring
+            now = time.monotonic()
+            image = np.asanyarray(color.get_data())
+            state.ring.publish(image, now)
+            state.last_frame_time = now
+            self._share_frame(state, image, now)
 
         if state.config.use_depth:
             depth = frames.get_depth_frame()
             if depth:
-                with state.frame_lock:
-                    state.depth_frame = np.asanyarray(depth.get_data())
+                state.depth_ring.publish(np.asanyarray(depth.get_data()), time.monotonic())
+
+    def _share_frame(self, state: _CameraState, frame: np.ndarray, timestamp: float) -> None:
+        """Mirror a captured frame into the camera's shared-memory segment."""
+        if self._shm_prefix is None:
+            return
+        writer = state.shm_writer
+        if writer is None or writer.shape != frame.shape or writer.dtype != frame.dtype:
+            # First frame, or the resolution changed: readers re-attach
+            if writer is not None:
+                writer.close()
+                state.shm_writer = None
+            writer = SharedFrameWriter(
+                segment_name(state.config.key, self._shm_prefix),
+                frame.shape,
+                frame.dtype,
+                self._shm_slots,
+            )
+            state.shm_writer = writer
+        writer.publish(frame, timestamp)
 
     # ------------------------------------------------------------------
     # Internal — health monitor
@@ -0,0 +1,353 @@
+"""Shared-memory camera frame bus for out-of-process consumers.
+
+CameraService can mirror each captured frame into a POSIX shared-memory
+segment per camera so that other local processes (training jobs, the
+verifier, vision policies) read live frames without going through the API.
+
+Segment layout::
+
+    header   magic, version, slot count, frame shape/dtype, closed flag,
+             latest seq, latest slot
+    slots    per-slot (seq, timestamp) table
+    data     ``slots`` frame buffers, 64-byte aligned
+
+The writer fills the slot after the latest one, so a reader's zero-copy
+view stays intact for ``slots - 1`` further frames. Each slot acts as a
+seqlock: its seq is zeroed while the frame is written and set to the
+frame's seq once complete, so readers can check that a view is still the
+frame they asked for (:meth:`SharedFrame.valid`) and :meth:`SharedFrameReader.read`
+retries torn copies.
+
+Example (consumer process)::
+
+    reader = SharedFrameReader("top_cam")
+    frame = reader.wait(timeout=1.0)
+    if frame is not None:
+        image = frame.array.copy()
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import logging
+import os
+import struct
+import time
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from nextis.errors import CameraError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFIX = "nextis-cam"
+
+_MAGIC = b"NXCAMBUS"
+_VERSION = 1
+_MAX_DIMS = 4
+# magic, version, slots, ndim, dims[4], dtype, closed, seq, latest slot
+_HEADER = struct.Struct("<8sIII4I8sIQi")
+_SLOT = struct.Struct("<Qd")
+_CLOSED_OFFSET = struct.calcsize("<8sIII4I8s")
+_STATE = struct.Struct("<IQi")  # closed, seq, latest slot
+_DATA_ALIGN = 64
+
+# Names of segments created by writers in this process; readers attaching
+# to one of these must leave its resource-tracker registration alone
+_owned: set[str] = set()
+# Open writers, closed at interpreter exit so readers see the closed flag
+_writers: weakref.WeakSet[SharedFrameWriter] = weakref.WeakSet()
+
+
+def segment_name(camera_key: str, prefix: str = DEFAULT_PREFIX) -> str:
+    """Shared-memory segment name for a camera."""
+    return f"{prefix}_{camera_key}"
+
+
+def _data_offset(slots: int) -> int:
+    end = _HEADER.size + slots * _SLOT.size
+    return -(-end // _DATA_ALIGN) * _DATA_ALIGN
+
+
+class SharedFrameWriter:
+    """Publishes frames of one shape and dtype into a shared-memory ring.
+
+    Creates the segment, replacing a stale one left by a crashed process.
+
+    Args:
+        name: Segment name (see :func:`segment_name`).
+        shape: Frame shape, e.g. ``(480, 640, 3)``.
+        dtype: Frame dtype.
+        slots: Number of frame buffers (at least 2).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        shape: tuple[int, ...],
+        dtype: np.dtype | str = np.uint8,
+        slots: int = 4,
+    ) -> None:
+        if slots < 2:
+            raise ValueError("SharedFrameWriter needs at least 2 slots")
+        if not 1 <= len(shape) <= _MAX_DIMS:
+            raise ValueError(f"Frames must have 1-{_MAX_DIMS} dimensions, got {shape}")
+        self.name = name
+        self.shape = tuple(int(d) for d in shape)
+        self.dtype = np.dtype(dtype)
+        self.slots = slots
+        self.seq = 0
+        self._frame_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        self._offset = _data_offset(slots)
+        size = self._offset + slots * self._frame_bytes
+
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            logger.warning("Replacing stale shared frame segment '%s'", name)
+            stale = shared_memory.SharedMemory(name=name)
+            if stale.size >= _HEADER.size:
+                _STATE.pack_into(stale.buf, _CLOSED_OFFSET, 1, 0, -1)  # detach old readers
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        _owned.add(name)
+        _writers.add(self)
+        dims = (*self.shape, *(0,) * (_MAX_DIMS - len(self.shape)))
+        _HEADER.pack_into(
+            self._shm.buf,
+            0,
+            _MAGIC,
+            _VERSION,
+            slots,
+            len(self.shape),
+            *dims,
+            self.dtype.str.encode(),
+            0,
+            0,
+            -1,
+        )
+        self._buffers = [
+            np.ndarray(
+                self.shape,
+                dtype=self.dtype,
+                buffer=self._shm.buf,
+                offset=self._offset + i * self._frame_bytes,
+            )
+            for i in range(slots)
+        ]
+        self._latest = -1
+
+    def publish(self, frame: np.ndarray, timestamp: float) -> int:
+        """Copy ``frame`` into the next slot and make it the latest.
+
+        Returns:
+            Sequence number of the published frame.
+
+        Raises:
+            ValueError: If the frame's shape or dtype does not match.
+        """
+        if frame.shape != self.shape or frame.dtype != self.dtype:
+            raise ValueError(
+                f"Frame {frame.shape}/{frame.dtype} does not match "
+                f"segment {self.shape}/{self.dtype}"
+            )
+        slot = (self._latest + 1) % self.slots
+        slot_offset = _HEADER.size + slot * _SLOT.size
+        buf = self._shm.buf
+        _SLOT.pack_into(buf, slot_offset, 0, 0.0)  # mark slot as being written
+        np.copyto(self._buffers[slot], frame)
+        self.seq += 1
+        _SLOT.pack_into(buf, slot_offset, self.seq, timestamp)
+        _STATE.pack_into(buf, _CLOSED_OFFSET, 0, self.seq, slot)
+        self._latest = slot
+        return self.seq
+
+    def close(self) -> None:
+        """Mark the segment closed for readers and unlink it. Idempotent."""
+        if self._shm is None:
+            return
+        _STATE.pack_into(self._shm.buf, _CLOSED_OFFSET, 1, self.seq, self._latest)
+        self._buffers = []
+        self._shm.close()
+        with contextlib.suppress(FileNotFoundError):
+            self._shm.unlink()
+        _owned.discard(self.name)
+        _writers.discard(self)
+        self._shm = None
+
+
+@atexit.register
+def _close_writers() -> None:
+    """Close and unlink every writer still open in this process."""
+    for writer in list(_writers):
+        try:
+            writer.close()
+        except Exception as e:
+            logger.warning("Could not close shared frame segment '%s': %s", writer.name, e)
+
+
+class SharedFrame:
+    """Zero-copy view of one frame in a shared-memory segment.
+
+    Attributes:
+        array: Read-only view of the frame. Only meaningful while
+            :meth:`valid` is true; copy it to keep it.
+        seq: Frame sequence number.
+        timestamp: ``time.monotonic()`` at capture, in the writer process
+            (comparable across processes on the same host).
+    """
+
+    __slots__ = ("_reader", "_slot", "array", "seq", "timestamp")
+
+    def __init__(
+        self,
+        reader: SharedFrameReader,
+        slot: int,
+        array: np.ndarray,
+        seq: int,
+        timestamp: float,
+    ) -> None:
+        self._reader = reader
+        self._slot = slot
+        self.array = array
+        self.seq = seq
+        self.timestamp = timestamp
+
+    def valid(self) -> bool:
+        """Whether the writer has not yet started overwriting this frame."""
+        return self._reader._slot_seq(self._slot) == self.seq
+
+
+class SharedFrameReader:
+    """Attaches to a camera's shared-memory segment from any local process.
+
+    Attaching is lazy and automatic: if the camera is not publishing yet,
+    or the writer restarts (e.g. after a resolution change), the next
+    call re-attaches.
+
+    Args:
+        camera_key: Camera to read.
+        prefix: Segment name prefix configured on the API side.
+    """
+
+    def __init__(self, camera_key: str, prefix: str = DEFAULT_PREFIX) -> None:
+        self.name = segment_name(camera_key, prefix)
+        self.shape: tuple[int, ...] = ()
+        self.dtype = np.dtype(np.uint8)
+        self.slots = 0
+        self._shm: shared_memory.SharedMemory | None = None
+        self._views: list[np.ndarray] = []
+
+    @property
+    def attached(self) -> bool:
+        """Whether a segment is currently mapped."""
+        return self._shm is not None
+
+    def latest(self) -> SharedFrame | None:
+        """Zero-copy view of the newest frame, or None if none is available."""
+        if not self._attach():
+            return None
+        for _ in range(3):
+            closed, seq, slot = _STATE.unpack_from(self._shm.buf, _CLOSED_OFFSET)
+            if closed:
+                self.close()
+                return None
+            if slot < 0:
+                return None
+            slot_seq, timestamp = _SLOT.unpack_from(self._shm.buf, _HEADER.size + slot * _SLOT.size)
+            if slot_seq == seq:
+                return SharedFrame(self, slot, self._views[slot], seq, timestamp)
+        return None
+
+    def read(self) -> SharedFrame | None:
+        """Copy of the newest frame, retried until the copy is not torn."""
+        for _ in range(3):
+            frame = self.latest()
+            if frame is None:
+                return None
+            array = frame.array.copy()
+            if frame.valid():
+                frame.array = array
+                return frame
+        return None
+
+    def wait(
+        self,
+        after_seq: int = 0,
+        timeout: float | None = None,
+        poll_interval: float = 0.001,
+    ) -> SharedFrame | None:
+        """Block until a frame newer than ``after_seq`` is published.
+
+        Returns:
+            Zero-copy view of the newest frame, or None on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            frame = self.latest()
+            if frame is not None and frame.seq > after_seq:
+                return frame
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+
+    def close(self) -> None:
+        """Detach from the segment. Idempotent."""
+        if self._shm is None:
+            return
+        self._views = []
+        try:
+            self._shm.close()
+        except BufferError:
+            # A caller still holds a view; leave the mapping to be freed with it
+            self._shm._buf = None
+            self._shm._mmap = None
+        self._shm = None
+
+    def __enter__(self) -> SharedFrameReader:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _attach(self) -> bool:
+        if self._shm is not None:
+            return True
+        try:
+            shm = shared_memory.SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return False
+        if os.name == "posix" and self.name not in _owned:
+            # Readers must not unlink the segment when they exit (Python < 3.13)
+            resource_tracker.unregister(shm._name, "shared_memory")
+
+        header = _HEADER.unpack_from(shm.buf, 0)
+        magic, version, slots, ndim = header[:4]
+        if magic != _MAGIC or version != _VERSION:
+            shm.close()
+            raise CameraError(f"'{self.name}' is not a version {_VERSION} camera frame segment")
+        self.shape = tuple(header[4 : 4 + ndim])
+        self.dtype = np.dtype(header[8].rstrip(b"\x00").decode())
+        self.slots = slots
+        frame_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        offset = _data_offset(slots)
+        views = []
+        for i in range(slots):
+            view = np.ndarray(
+                self.shape, dtype=self.dtype, buffer=shm.buf, offset=offset + i * frame_bytes
+            )
+            view.flags.writeable = False
+            views.append(view)
+        self._views = views
+        self._shm = shm
+        return True
+
+    def _slot_seq(self, slot: int) -> int:
+        if self._shm is None:
+            return -1
+        return _SLOT.unpack_from(self._shm.buf, _HEADER.size + slot * _SLOT.size)[0]
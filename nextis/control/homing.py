@@ -1,7 +1,10 @@
 """Safe return-to-home-position for Damiao arms.
 
-Uses the MIT rate limiter in DamiaoMotorsBus.sync_write() for smooth
-movement. Disables motors when done.
+Streams a minimum-jerk joint trajectory from the current pose to home,
+sized so the joint with the largest displacement peaks at ``max_velocity``,
+and stops as soon as every joint is within tolerance. The MIT rate limiter
+in DamiaoMotorsBus.sync_write() stays active as a backstop. Disables
+motors when done.
 """
 
 from __future__ import annotations
@@ -10,8 +13,82 @@ import logging
 import time
 from typing import Any
 
+import numpy as np
+
+from nextis.control.ticker import RateTicker
+
 logger = logging.getLogger(__name__)
 
+# Peak velocity of a minimum-jerk profile is 1.875x the average velocity
+_MIN_JERK_PEAK = 1.875
+
+# Joint speed (rad/s) the MIT rate limiter allows the slowest motor (J4340P)
+# per unit of velocity_limit: 0.15 allows ~0.8 rad/s
+_LIMITER_RAD_S_PER_VEL = 0.8 / 0.15
+# Share of that speed the trajectory may peak at, so joints keep up with it
+_LIMITER_MARGIN = 0.8
+
+
+def trajectory_velocity(homing_vel: float, max_velocity: float | None = None) -> float:
+    """Peak trajectory velocity (rad/s) that stays under the bus rate limiter.
+
+    Args:
+        homing_vel: Bus ``velocity_limit`` used while homing.
+        max_velocity: Requested peak velocity, or None to derive it.
+
+    Returns:
+        ``max_velocity`` capped to the limiter speed of the slowest motor,
+        or a margin below that speed when none was requested.
+    """
+    limit = homing_vel * _LIMITER_RAD_S_PER_VEL
+    if max_velocity is None:
+        return _LIMITER_MARGIN * limit
+    if max_velocity > limit:
+        logger.warning(
+            "Homing max_velocity %.2f rad/s exceeds the %.2f rad/s rate limit at vel=%.3f",
+            max_velocity,
+            limit,
+            homing_vel,
+        )
+        return limit
+    return max_velocity
+
+
+class MinJerkTrajectory:
+    """Time-parameterized minimum-jerk trajectory between two joint vectors.
+
+    ``q(t) = q0 + (q1 - q0) * (10 s^3 - 15 s^4 + 6 s^5)`` with
+    ``s = t / duration``: zero velocity and acceleration at both ends.
+
+    Args:
+        start: Start joint positions.
+        goal: Goal joint positions.
+        duration: Trajectory duration (seconds).
+    """
+
+    def __init__(self, start: np.ndarray, goal: np.ndarray, duration: float) -> None:
+        self.start = np.asarray(start, dtype=float)
+        self.goal = np.asarray(goal, dtype=float)
+        self.duration = duration
+        self._delta = self.goal - self.start
+
+    @classmethod
+    def sized(
+        cls,
+        start: np.ndarray,
+        goal: np.ndarray,
+        max_velocity: float,
+        min_duration: float = 0.5,
+    ) -> MinJerkTrajectory:
+        """Build a trajectory whose fastest joint peaks at ``max_velocity``."""
+        largest = float(np.max(np.abs(np.asarray(goal) - np.asarray(start)), initial=0.0))
+        return cls(start, goal, max(_MIN_JERK_PEAK * largest / max_velocity, min_duration))
+
+    def sample(self, t: float) -> np.ndarray:
+        """Joint positions at ``t`` seconds (clamped to the goal after the end)."""
+        s = min(max(t / self.duration, 0.0), 1.0)
+        return self.start + self._delta * (s**3 * (10.0 - 15.0 * s + 6.0 * s * s))
+
 
 def homing_loop(
     robot: Any,
@@ -19,11 +96,15 @@ def homing_loop(
     duration: float = 10.0,
     homing_vel: float = 0.05,
     cancel_check: Any | None = None,
-) -> None:
-    """Move robot to home position over duration, then disable motors.
+    max_velocity: float | None = None,
+    tolerance: float = 0.02,
+) -> bool:
+    """Move robot to home position, then disable motors.
 
-    Uses the existing MIT rate limiter in sync_write() for smooth movement.
-    At homing_vel=0.15: J8009P ~1 rad/s, J4340P ~0.8 rad/s.
+    At homing_vel=0.15 the MIT rate limiter in sync_write() allows
+    J8009P ~1 rad/s, J4340P ~0.8 rad/s. The trajectory peak is kept below
+    the slowest motor's limit (see :func:`trajectory_velocity`) so joints
+    track the profile instead of lagging behind it.
 
     Args:
         robot: Connected Damiao follower robot.
@@ -31,31 +112,39 @@ def homing_loop(
         duration: Maximum time to reach home (seconds).
         homing_vel: Velocity limit during homing (rad/s per motor).
         cancel_check: Optional callable returning True to cancel homing.
+        max_velocity: Peak trajectory velocity of the farthest joint (rad/s);
+            None derives it from ``homing_vel``. Capped to the rate limit.
+        tolerance: Per-joint error (radians) at which home counts as reached.
+
+    Returns:
+        True if every joint reached home within tolerance.
     """
     try:
         from lerobot.motors.damiao.damiao import DamiaoMotorsBus
     except ImportError:
         logger.warning("lerobot not available — skipping homing")
-        return
+        return False
 
     bus = getattr(robot, "bus", None)
     if not bus or not isinstance(bus, DamiaoMotorsBus):
         logger.warning("Robot has no Damiao bus — skipping homing")
-        return
+        return False
 
     old_vel = bus.velocity_limit
     bus.velocity_limit = homing_vel
-    logger.info("Homing started (vel=%.3f, duration=%.1fs)", homing_vel, duration)
+    logger.info("Homing started (vel=%.3f, max %.1fs)", homing_vel, duration)
 
+    reached = False
     try:
-        start = time.time()
-        while time.time() - start < duration:
-            if cancel_check and cancel_check():
-                logger.info("Homing cancelled")
-                break
-            bus.sync_write("Goal_Position", home_pos)
-            time.sleep(1.0 / 30)  # 30Hz control
-
+        reached = track_home(
+            robot,
+            bus,
+            home_pos,
+            duration=duration,
+            max_velocity=trajectory_velocity(homing_vel, max_velocity),
+            tolerance=tolerance,
+            cancel_check=cancel_check,
+        )
         bus.velocity_limit = old_vel
     except Exception as e:
         logger.error("Homing error: %s", e)
@@ -69,3 +158,80 @@ def homing_loop(
                 logger.info("Homing complete — motors disabled")
         except Exception:
             pass
+    return reached
+
+
+def track_home(
+    robot: Any,
+    bus: Any,
+    home_pos: dict[str, float],
+    duration: float = 10.0,
+    max_velocity: float = 0.3,
+    tolerance: float = 0.02,
+    frequency: float = 30.0,
+    cancel_check: Any | None = None,
+) -> bool:
+    """Stream a minimum-jerk trajectory to ``home_pos`` until it is reached.
+
+    Setpoints are written with ``bus.sync_write("Goal_Position", ...)`` at
+    ``frequency``. If the current pose cannot be read, the goal itself is
+    streamed (the bus rate limiter shapes the motion) and arrival cannot
+    end homing early.
+
+    Args:
+        robot: Robot providing ``get_cached_positions()`` or ``get_observation()``.
+        bus: Motor bus receiving the setpoints.
+        home_pos: Target joint positions {motor_name: radians}.
+        duration: Maximum time to reach home (seconds).
+        max_velocity: Peak trajectory velocity of the farthest joint (rad/s).
+        tolerance: Per-joint error (radians) at which home counts as reached.
+        frequency: Setpoint rate (Hz).
+        cancel_check: Optional callable returning True to cancel homing.
+
+    Returns:
+        True if every joint reached home within tolerance.
+    """
+    names = list(home_pos)
+    goal = np.array([home_pos[n] for n in names], dtype=float)
+    current = _read_positions(robot, names)
+    trajectory = None
+    if current is not None:
+        trajectory = MinJerkTrajectory.sized(current, goal, max_velocity)
+        logger.info(
+            "Homing trajectory: %.2f rad max displacement over %.2fs",
+            float(np.max(np.abs(goal - current), initial=0.0)),
+            trajectory.duration,
+        )
+
+    ticker = RateTicker(frequency)
+    ticker.start()
+    start = time.monotonic()
+    while (elapsed := time.monotonic() - start) < duration:
+        if cancel_check and cancel_check():
+            logger.info("Homing cancelled")
+            return False
+        if current is not None and np.max(np.abs(current - goal), initial=0.0) < tolerance:
+            logger.info("Home reached after %.2fs", elapsed)
+            return True
+        setpoint = trajectory.sample(elapsed) if trajectory is not None else goal
+        bus.sync_write("Goal_Position", dict(zip(names, setpoint.tolist(), strict=True)))
+        ticker.wait()
+        if trajectory is not None:
+            current = _read_positions(robot, names)
+
+    logger.warning("Homing did not converge within %.1fs", duration)
+    return False
+
+
+def _read_positions(robot: Any, names: list[str]) -> np.ndarray | None:
+    """Current positions of ``names`` from the cached feedback or an observation."""
+    try:
+        if hasattr(robot, "get_cached_positions"):
+            positions = robot.get_cached_positions()
+        else:
+            obs = robot.get_observation()
+            positions = {k.removesuffix(".pos"): v for k, v in obs.items()}
+        return np.array([float(positions[n]) for n in names])
+    except Exception as e:
+        logger.debug("Homing position read failed: %s", e)
+        return None
@@ -2,7 +2,8 @@
 
 Detects when a human operator takes over from an autonomous policy by
 monitoring leader arm velocity. Uses position-delta velocity estimation
-filtered by policy-relevant arms.
+filtered by policy-relevant arms. Callers that already read the leader this
+tick pass a TelemetrySnapshot so the detector does not read it again.
 """
 
 from __future__ import annotations
@@ -11,6 +12,8 @@ import logging
 import time
 from typing import Any
 
+from nextis.control.telemetry import TelemetrySnapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +46,7 @@ class InterventionDetector:
         self,
         leader: Any,
         policy_arms: list[str] | None = None,
+        snapshot: TelemetrySnapshot | None = None,
     ) -> float:
         """Estimate leader arm velocity from position deltas.
 
@@ -53,16 +57,23 @@ class InterventionDetector:
             leader: Connected leader arm with get_action() method.
             policy_arms: List of arm prefixes the policy controls
                 (e.g., ["left", "right"]). None means all arms.
+            snapshot: Telemetry captured this tick. When it carries leader
+                positions they are used instead of reading the leader.
 
         Returns:
             Maximum velocity magnitude across relevant joints, scaled by
             inference rate.
         """
-        if not leader:
+        if snapshot is not None and snapshot.leader_positions:
+            current_pos: dict[str, float] | None = snapshot.leader_positions
+        elif not leader:
             return 0.0
+        else:
+            current_pos = None
 
         try:
-            current_pos = leader.get_action()
+            if current_pos is None:
+                current_pos = leader.get_action()
             if not current_pos:
                 return 0.0
 
@@ -107,6 +118,7 @@ class InterventionDetector:
         self,
         leader: Any,
         policy_arms: list[str] | None = None,
+        snapshot: TelemetrySnapshot | None = None,
     ) -> bool:
         """Check whether a human has taken over from the autonomous policy.
 
@@ -117,11 +129,12 @@ class InterventionDetector:
         Args:
             leader: Connected leader arm with get_action() method.
             policy_arms: List of arm prefixes the policy controls.
+            snapshot: Telemetry captured this tick (see get_leader_velocity).
 
         Returns:
             True if human intervention is detected.
         """
-        velocity = self.get_leader_velocity(leader, policy_arms)
+        velocity = self.get_leader_velocity(leader, policy_arms, snapshot)
 
         if velocity > self.move_threshold:
             self._last_human_move_time = time.time()
@@ -7,6 +7,7 @@ Damiao base/linkN) and value conversion across different motor encodings.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
@@ -45,6 +46,114 @@ class ValueMode(str, Enum):  # noqa: UP042
     INT = "int"  # Legacy Feetech -> Feetech (integer ticks)
 
 
+@dataclass(frozen=True)
+class JointLayout:
+    """Compiled, array-backed form of a JointMapper for the control loop.
+
+    Precomputes everything ``JointMapper.convert_value`` decides per call so
+    a whole arm is converted with one gather and one fused multiply-add:
+    ``follower = leader[source_index] * scale + offset``. Dicts are only
+    touched at the bus boundary (:meth:`gather` and :meth:`to_action`).
+
+    Attributes:
+        leader_keys: Leader observation keys, in leader-vector order. The
+            mapped keys come first, followed by any extra keys requested
+            at compile time (e.g. leader-assist joints).
+        follower_keys: Follower action keys, in follower-vector order.
+        source_index: For each follower joint, its index in the leader vector.
+        scale: Per-follower-joint multiplier.
+        offset: Per-follower-joint additive term.
+        integer: Truncate results toward zero (legacy Feetech tick mode).
+    """
+
+    leader_keys: tuple[str, ...]
+    follower_keys: tuple[str, ...]
+    source_index: np.ndarray
+    scale: np.ndarray
+    offset: np.ndarray
+    integer: bool = False
+
+    @property
+    def num_leader(self) -> int:
+        """Length of the leader vector."""
+        return len(self.leader_keys)
+
+    @property
+    def num_follower(self) -> int:
+        """Length of the follower vector."""
+        return len(self.follower_keys)
+
+    def leader_indices(self, keys: list[str]) -> np.ndarray | None:
+        """Return leader-vector indices for ``keys``, or None if any is absent."""
+        lookup = {k: i for i, k in enumerate(self.leader_keys)}
+        try:
+            return np.array([lookup[k] for k in keys], dtype=np.intp)
+        except KeyError:
+            return None
+
+    def gather(self, obs: dict[str, float], out: np.ndarray, valid: np.ndarray) -> bool:
+        """Copy a leader observation dict into a preallocated leader vector.
+
+        Args:
+            obs: Leader observation {joint_key: value}.
+            out: Leader vector to fill (len ``num_leader``).
+            valid: Boolean mask to fill; False where the key was missing.
+
+        Returns:
+            True if every leader key was present.
+        """
+        complete = True
+        for i, key in enumerate(self.leader_keys):
+            value = obs.get(key)
+            if value is None:
+                valid[i] = False
+                complete = False
+            else:
+                out[i] = value
+                valid[i] = True
+        return complete
+
+    def apply(self, leader_vec: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Convert a leader vector into follower units in place.
+
+        Args:
+            leader_vec: Leader vector (len ``num_leader``).
+            out: Follower vector to write (len ``num_follower``).
+
+        Returns:
+            ``out``, for chaining.
+        """
+        np.take(leader_vec, self.source_index, out=out)
+        out *= self.scale
+        out += self.offset
+        if self.integer:
+            np.trunc(out, out=out)
+        return out
+
+    def to_action(
+        self, follower_vec: np.ndarray, valid: np.ndarray | None = None
+    ) -> dict[str, float]:
+        """Build the follower action dict sent to the bus.
+
+        Args:
+            follower_vec: Follower vector (len ``num_follower``).
+            valid: Optional per-follower-joint mask; masked-out joints are omitted.
+
+        Returns:
+            Action dict {follower_key: value}.
+        """
+        values = follower_vec.tolist()
+        if self.integer:
+            values = [int(v) for v in values]
+        if valid is None:
+            return dict(zip(self.follower_keys, values, strict=True))
+        return {
+            key: value
+            for key, value, ok in zip(self.follower_keys, values, valid.tolist(), strict=True)
+            if ok
+        }
+
+
 class JointMapper:
     """Maps leader arm joints to follower arm joints.
 
@@ -210,6 +319,68 @@ class JointMapper:
         # ValueMode.INT — legacy Feetech
         return int(value)
 
+    def compile(
+        self,
+        extra_leader_keys: list[str] | None = None,
+        leader_start_rad: dict[str, float] | None = None,
+        follower_start_pos: dict[str, float] | None = None,
+        rad_to_percent_scale: dict[str, float] | None = None,
+    ) -> JointLayout:
+        """Precompute index arrays and scale/offset vectors for the current mapping.
+
+        The result is equivalent to calling :meth:`convert_value` for every
+        pair in ``joint_mapping`` with the same arguments. Recompile whenever
+        the mapping or the delta-tracking start state changes.
+
+        Args:
+            extra_leader_keys: Additional leader keys to carry in the leader
+                vector (not mapped to the follower).
+            leader_start_rad: Start positions for delta tracking.
+            follower_start_pos: Follower start positions for delta tracking.
+            rad_to_percent_scale: Per-joint scaling factors.
+
+        Returns:
+            Compiled JointLayout.
+        """
+        leader_keys = list(self.joint_mapping)
+        for key in extra_leader_keys or []:
+            if key not in self.joint_mapping:
+                leader_keys.append(key)
+
+        n = len(self.joint_mapping)
+        scale = np.ones(n, dtype=np.float64)
+        offset = np.zeros(n, dtype=np.float64)
+
+        if self.value_mode == ValueMode.RAD_TO_PERCENT:
+            scales = rad_to_percent_scale or {}
+            for i, (l_key, f_key) in enumerate(self.joint_mapping.items()):
+                if "gripper" in f_key:
+                    scale[i] = 100.0
+                elif f_key in self.leader_cal_ranges:
+                    rmin, rmax = self.leader_cal_ranges[f_key]
+                    k = 200.0 / (rmax - rmin)
+                    scale[i] = 4096.0 / (2 * np.pi) * k
+                    offset[i] = (2048.0 - rmin) * k - 100.0
+                else:
+                    s = scales.get(f_key, 100.0 / np.pi)
+                    scale[i] = s
+                    if (
+                        leader_start_rad
+                        and follower_start_pos
+                        and l_key in leader_start_rad
+                        and f_key in follower_start_pos
+                    ):
+                        offset[i] = follower_start_pos[f_key] - leader_start_rad[l_key] * s
+
+        return JointLayout(
+            leader_keys=tuple(leader_keys),
+            follower_keys=tuple(self.joint_mapping.values()),
+            source_index=np.arange(n, dtype=np.intp),
+            scale=scale,
+            offset=offset,
+            integer=self.value_mode == ValueMode.INT,
+        )
+
     @property
     def has_damiao_follower(self) -> bool:
         """Whether any mapped follower is a Damiao arm."""
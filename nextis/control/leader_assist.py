@@ -2,24 +2,112 @@
 
 Implements a linear regression-based gravity model with four additive
 control terms: gravity compensation, friction assistance, haptic
-reflection, and viscous damping. Calibration data stored as JSON.
+reflection, and viscous damping. Calibration data stored as JSON; at load
+time the per-joint weights are stacked into one matrix so a full-arm
+gravity prediction is a single matrix-vector product.
+
+Two feature sets are supported. The independent model uses
+``[1, sin q_i, cos q_i]``; the coupled model adds ``sin``/``cos`` of the
+cumulative angles ``q_0 + ... + q_k``, which is how link gravity torques
+actually enter a serial chain. Weights are fitted offline with one batched
+least-squares solve, or refined online by recursive least squares (RLS)
+from samples gathered during teleop.
+
+Online samples are labelled from the servo's effort register, which differs
+per motor family (see :data:`EFFORT_REGISTERS`); every reading is converted
+to the same PWM units the model outputs.
 """
 
 from __future__ import annotations
 
+import enum
 import json
 import logging
-import math
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
 
+from nextis.errors import CalibrationError
+from nextis.hardware.types import MotorType
+
 logger = logging.getLogger(__name__)
 
 # Default calibration directory (relative to project root)
 _DEFAULT_CALIBRATION_DIR = Path("configs/calibration")
 
 
+class GravityModel(str, enum.Enum):  # noqa: UP042
+    """Feature set of the gravity regression."""
+
+    INDEPENDENT = "independent"  # [1, sin q_i, cos q_i]
+    COUPLED = "coupled"  # + sin/cos of cumulative angles q_0 + ... + q_k
+
+
+def num_features(model: GravityModel, n_joints: int) -> int:
+    """Length of the feature vector for ``n_joints`` under ``model``."""
+    if model == GravityModel.COUPLED and n_joints > 1:
+        return 1 + 2 * n_joints + 2 * (n_joints - 1)
+    return 1 + 2 * n_joints
+
+
+def decode_load(raw: int) -> float:
+    """Decode a Feetech sign-magnitude ``Present_Load`` (bit 10 = sign).
+
+    Values the bus driver already decoded (negative ints) pass through.
+    """
+    if raw < 0:
+        return float(raw)
+    magnitude = float(raw & 0x3FF)
+    return -magnitude if raw & 0x400 else magnitude
+
+
+def decode_int16(raw: int) -> float:
+    """Decode a Dynamixel two's-complement 16-bit register value."""
+    raw &= 0xFFFF
+    return float(raw - 0x10000 if raw & 0x8000 else raw)
+
+
+@dataclass(frozen=True)
+class EffortRegister:
+    """Register reporting a servo's output effort and its scale to PWM units.
+
+    PWM units are per mille of full duty, the unit of ``write_pwm`` and of
+    the gravity model.
+
+    Attributes:
+        name: Register name passed to ``sync_read``.
+        decode: Raw register value -> signed value in register units.
+        pwm_per_unit: PWM units per register unit.
+    """
+
+    name: str
+    decode: Callable[[int], float]
+    pwm_per_unit: float = 1.0
+
+    def to_pwm(self, raw: int) -> float:
+        """Convert one raw register reading to PWM units."""
+        return self.decode(raw) * self.pwm_per_unit
+
+
+# XL330 stall current at 5 V (mA). At rest there is no back-EMF, so the
+# duty cycle holding a joint is its current over the stall current.
+_XL330_STALL_CURRENT_MA = 1470.0
+
+# Effort register per leader motor family
+EFFORT_REGISTERS: dict[MotorType, EffortRegister] = {
+    # Sign-magnitude, 0.1 % of max output
+    MotorType.STS3215: EffortRegister("Present_Load", decode_load),
+    # Two's complement, 0.1 % of max output
+    MotorType.DYNAMIXEL_XL430: EffortRegister("Present_Load", decode_int16),
+    # Two's complement, 1 mA (the XL330 has no load register)
+    MotorType.DYNAMIXEL_XL330: EffortRegister(
+        "Present_Current", decode_int16, 1000.0 / _XL330_STALL_CURRENT_MA
+    ),
+}
+
+
 class LeaderAssistService:
     """Leader arm transparency and assistance controller.
 
@@ -33,14 +121,18 @@ class LeaderAssistService:
         arm_id: Identifier for this arm (used in calibration filename).
         calibration_path: Explicit path to gravity calibration JSON.
             If None, uses configs/calibration/gravity_{arm_id}.json.
+        motor_type: Leader motor family; selects the effort register
+            online learning reads. Online learning is unavailable without it.
     """
 
     def __init__(
         self,
         arm_id: str = "default",
         calibration_path: Path | str | None = None,
+        motor_type: MotorType | None = None,
     ) -> None:
         self.arm_id = arm_id
+        self.effort_register = EFFORT_REGISTERS.get(motor_type) if motor_type else None
 
         calibration_dir = _DEFAULT_CALIBRATION_DIR
         calibration_dir.mkdir(parents=True, exist_ok=True)
@@ -52,6 +144,9 @@ class LeaderAssistService:
 
         self.gravity_weights: dict[str, list[float]] = {}
         self.is_calibrated: bool = False
+        # Stacked gravity_weights: row i = weights of joint_i (zeros if absent)
+        self._weight_matrix = np.zeros((0, 0))
+        self.model = GravityModel.INDEPENDENT
         self.load_calibration()
 
         # Tunable gains
@@ -67,6 +162,13 @@ class LeaderAssistService:
         self.calibration_mode: bool = False
         self.calibration_data: list[tuple[list[float], list[float]]] = []
 
+        # Online (RLS) refinement state
+        self.online_learning: bool = False
+        self.online_samples: int = 0
+        self.forgetting: float = 0.998
+        self._initial_covariance: float = 100.0
+        self._rls_p: np.ndarray | None = None
+
     def update_gains(
         self,
         k_gravity: float | None = None,
@@ -108,6 +210,7 @@ class LeaderAssistService:
             try:
                 with open(self.calibration_path) as f:
                     self.gravity_weights = json.load(f)
+                self._stack_weights()
                 self.is_calibrated = True
                 logger.info("Loaded gravity calibration from %s", self.calibration_path)
             except Exception as e:
@@ -121,28 +224,86 @@ class LeaderAssistService:
             self.calibration_path.parent.mkdir(parents=True, exist_ok=True)
             with open(self.calibration_path, "w") as f:
                 json.dump(self.gravity_weights, f)
+            self._stack_weights()
             self.is_calibrated = True
             logger.info("Saved gravity calibration to %s", self.calibration_path)
         except Exception as e:
             logger.error("Failed to save calibration: %s", e)
 
-    def _compute_features(self, q_deg: list[float]) -> np.ndarray:
+    def _stack_weights(self) -> None:
+        """Stack ``gravity_weights`` into a (n_joints, n_features) matrix.
+
+        Rows follow ``joint_{i}`` order; joints without weights get a zero
+        row so they contribute no gravity term. The feature model is
+        inferred from the weight length, so older independent-model files
+        load unchanged.
+        """
+        indices = [
+            int(key.removeprefix("joint_"))
+            for key in self.gravity_weights
+            if key.startswith("joint_") and key.removeprefix("joint_").isdigit()
+        ]
+        if not indices:
+            self._weight_matrix = np.zeros((0, 0))
+            return
+        n_joints = max(indices) + 1
+        n_features = max(len(w) for w in self.gravity_weights.values())
+        matrix = np.zeros((n_joints, n_features))
+        for i in indices:
+            w = self.gravity_weights[f"joint_{i}"]
+            matrix[i, : len(w)] = w
+        self._weight_matrix = matrix
+        if n_features == num_features(GravityModel.COUPLED, n_joints):
+            self.model = GravityModel.COUPLED
+        else:
+            self.model = GravityModel.INDEPENDENT
+
+    def _unstack_weights(self) -> None:
+        """Write the weight matrix back into ``gravity_weights``."""
+        self.gravity_weights = {
+            f"joint_{i}": row.tolist() for i, row in enumerate(self._weight_matrix)
+        }
+
+    def _compute_features(
+        self, q_deg: list[float] | np.ndarray, model: GravityModel | None = None
+    ) -> np.ndarray:
         """Compute regression features from joint positions.
 
-        Independent joint approximation: [1, sin(q), cos(q)] per joint.
+        Layout is ``[1, sin q0, cos q0, sin q1, cos q1, ...]``; the coupled
+        model appends ``[sin φ1, cos φ1, ...]`` with ``φk = q0 + ... + qk``.
+        A 2-D input (samples x joints) yields one feature row per sample.
 
         Args:
-            q_deg: Joint angles in degrees.
+            q_deg: Joint angles in degrees, shape (n_joints,) or
+                (n_samples, n_joints).
+            model: Feature set; defaults to the service's current model.
 
         Returns:
-            Feature vector (1 + 2*n_joints,).
+            Feature array of shape (..., num_features(model, n_joints)).
         """
-        q = [math.radians(x) for x in q_deg]
-        feats = [1.0]  # Bias term
-        for val in q:
-            feats.append(math.sin(val))
-            feats.append(math.cos(val))
-        return np.array(feats)
+        model = model or self.model
+        q = np.radians(np.asarray(q_deg, dtype=float))
+        n = q.shape[-1]
+        feats = np.empty((*q.shape[:-1], num_features(model, n)))
+        feats[..., 0] = 1.0  # Bias term
+        feats[..., 1 : 1 + 2 * n : 2] = np.sin(q)
+        feats[..., 2 : 2 + 2 * n : 2] = np.cos(q)
+        if feats.shape[-1] > 1 + 2 * n:
+            phi = np.cumsum(q, axis=-1)[..., 1:]
+            feats[..., 1 + 2 * n :: 2] = np.sin(phi)
+            feats[..., 2 + 2 * n :: 2] = np.cos(phi)
+        return feats
+
+    def _gravity_vector(self, positions_deg: np.ndarray) -> np.ndarray:
+        """Gravity PWM for every joint: one matmul against the weight matrix."""
+        n = positions_deg.size
+        matrix = self._weight_matrix
+        gravity = np.zeros(n)
+        if not self.is_calibrated or matrix.shape[1] != num_features(self.model, n):
+            return gravity
+        rows = min(n, matrix.shape[0])
+        gravity[:rows] = matrix[:rows] @ self._compute_features(positions_deg)
+        return gravity
 
     # --- Calibration Routine ---
 
@@ -164,48 +325,178 @@ class LeaderAssistService:
         self.calibration_data.append((positions_deg, loads_raw))
         logger.info("Recorded calibration sample %d", len(self.calibration_data))
 
-    def compute_weights(self) -> None:
-        """Fit per-joint linear regression: W * features = load.
+    def compute_weights(
+        self,
+        model: GravityModel = GravityModel.INDEPENDENT,
+        lambda_reg: float = 1e-3,
+    ) -> None:
+        """Fit all joints at once: W * features = load.
+
+        Solves the ridge problem for every joint in a single least-squares
+        call by stacking ``sqrt(lambda) * I`` under the feature matrix.
 
-        Uses ridge regression (lambda=1e-3) for numerical stability.
+        Args:
+            model: Feature set to fit. The coupled model is opt-in: it has
+                roughly twice the weights and needs at least as many samples
+                as features.
+            lambda_reg: Ridge regularization for numerical stability.
         """
         if not self.calibration_data:
             logger.error("No calibration data to fit")
             return
+        n_features = num_features(model, len(self.calibration_data[0][0]))
+        if model == GravityModel.COUPLED and len(self.calibration_data) < n_features:
+            logger.error(
+                "Coupled gravity model needs at least %d samples, got %d",
+                n_features,
+                len(self.calibration_data),
+            )
+            return
 
-        logger.info("Computing gravity weights from %d samples", len(self.calibration_data))
-
-        num_joints = len(self.calibration_data[0][1])
-        X: list[np.ndarray] = []
-        Y: list[list[float]] = [[] for _ in range(num_joints)]
-
-        for q, load in self.calibration_data:
-            feat = self._compute_features(q)
-            X.append(feat)
-            for i in range(num_joints):
-                Y[i].append(load[i])
-
-        X_mat = np.array(X)
-        self.gravity_weights = {}
+        logger.info(
+            "Computing %s gravity weights from %d samples",
+            model.value,
+            len(self.calibration_data),
+        )
 
         try:
-            lambda_reg = 1e-3
-            for i in range(num_joints):
-                y_vec = np.array(Y[i])
-                # Ridge regression: W = (X^T X + lambda*I)^-1 X^T y
-                w = (
-                    np.linalg.inv(X_mat.T @ X_mat + lambda_reg * np.eye(X_mat.shape[1]))
-                    @ X_mat.T
-                    @ y_vec
-                )
-                self.gravity_weights[f"joint_{i}"] = w.tolist()
-
+            q = np.array([sample[0] for sample in self.calibration_data], dtype=float)
+            loads = np.array([sample[1] for sample in self.calibration_data], dtype=float)
+            X = self._compute_features(q, model)
+
+            # Ridge as plain least squares: [X; sqrt(l) I] W = [Y; 0]
+            A = np.vstack([X, np.sqrt(lambda_reg) * np.eye(n_features)])
+            B = np.vstack([loads, np.zeros((n_features, loads.shape[1]))])
+            W, *_ = np.linalg.lstsq(A, B, rcond=None)
+
+            self.model = model
+            self._weight_matrix = W.T
+            self._unstack_weights()
+            # Seed RLS with the batch solution's covariance
+            self._rls_p = np.linalg.inv(A.T @ A)
             self.save_calibration()
             self.calibration_mode = False
             logger.info("Gravity calibration complete")
         except Exception as e:
             logger.error("Calibration failed: %s", e)
 
+    # --- Online Refinement ---
+
+    def start_online_learning(
+        self,
+        forgetting: float = 0.998,
+        initial_covariance: float = 100.0,
+    ) -> None:
+        """Refine the gravity weights from teleop samples by RLS.
+
+        Without a prior calibration the coupled model is learned from
+        scratch; gravity compensation switches on once enough samples have
+        been seen to determine every weight.
+
+        Args:
+            forgetting: RLS forgetting factor (0 < f <= 1). Lower values
+                track slow changes (cables, payloads) faster.
+            initial_covariance: Prior variance of the weights when no batch
+                fit is available; larger means the first samples move the
+                weights more.
+
+        Raises:
+            CalibrationError: If the leader's effort register is unknown.
+        """
+        if self.effort_register is None:
+            raise CalibrationError(
+                f"Online gravity learning needs a known leader motor type ({self.arm_id})"
+            )
+        self.forgetting = forgetting
+        self._initial_covariance = initial_covariance
+        self.online_samples = 0
+        self.online_learning = True
+        logger.info("Online gravity learning enabled for %s (f=%.4f)", self.arm_id, forgetting)
+
+    def save_online_weights(self) -> None:
+        """Persist weights refined online (no-op if nothing was learned)."""
+        if self.online_samples and self._weight_matrix.size:
+            self._unstack_weights()
+            self.save_calibration()
+
+    def stop_online_learning(self, save: bool = True) -> None:
+        """Stop online refinement, optionally persisting the learned weights."""
+        self.online_learning = False
+        if save:
+            self.save_online_weights()
+        logger.info(
+            "Online gravity learning stopped for %s after %d samples",
+            self.arm_id,
+            self.online_samples,
+        )
+
+    def observe(self, positions_deg: np.ndarray, loads: np.ndarray) -> None:
+        """Fold one (position, holding load) sample into the weights.
+
+        One RLS step with a covariance shared by all joints (they share the
+        feature vector), costing O(n_features^2).
+
+        Args:
+            positions_deg: Joint angles in degrees.
+            loads: Load (PWM units) needed to hold each joint at rest.
+        """
+        q = np.asarray(positions_deg, dtype=float)
+        y = np.asarray(loads, dtype=float)
+        n = q.size
+        n_features = num_features(self.model, n)
+        if self._weight_matrix.shape != (n, n_features):
+            # Nothing usable to refine — learn the coupled model from scratch
+            self.model = GravityModel.COUPLED
+            n_features = num_features(self.model, n)
+            self._weight_matrix = np.zeros((n, n_features))
+            self._rls_p = None
+            self.is_calibrated = False
+        if self._rls_p is None or self._rls_p.shape[0] != n_features:
+            self._rls_p = np.eye(n_features) * self._initial_covariance
+
+        x = self._compute_features(q)
+        P = self._rls_p
+        lam = self.forgetting
+        px = P @ x
+        gain = px / (lam + x @ px)
+        error = y - self._weight_matrix @ x
+        self._weight_matrix += np.outer(error, gain)
+        P -= np.outer(gain, px)
+        P /= lam
+        # Keep P symmetric against round-off drift
+        P += P.T
+        P *= 0.5
+
+        self.online_samples += 1
+        if not self.is_calibrated and self.online_samples >= n_features:
+            self.is_calibrated = True
+            logger.info("Online gravity model for %s is now active", self.arm_id)
+
+    def observe_effort(
+        self,
+        positions_deg: np.ndarray,
+        effort: np.ndarray,
+        commanded: np.ndarray,
+    ) -> None:
+        """Fold one at-rest sample taken while the assist drives the arm.
+
+        The servo's effort includes the PWM the assist commanded. Only the
+        effort beyond that command says anything about gravity: it is what
+        the current gravity term is missing. Labelling with the raw effort
+        would fit the weights to their own output. Samples where any joint's
+        command hit ``max_pwm`` are skipped.
+
+        Args:
+            positions_deg: Joint angles in degrees.
+            effort: Measured servo effort per joint (PWM units).
+            commanded: Assist PWM written to each joint this tick.
+        """
+        if np.any(np.abs(commanded) >= self.max_pwm):
+            return  # A clipped command hides how much of it was gravity
+        q = np.asarray(positions_deg, dtype=float)
+        gravity = self.k_gravity * self._gravity_vector(q)
+        self.observe(q, gravity + np.asarray(effort, dtype=float) - commanded)
+
     # --- Runtime Control ---
 
     def predict_gravity(self, positions_deg: list[float]) -> list[float]:
@@ -217,30 +508,61 @@ class LeaderAssistService:
         Returns:
             Per-joint gravity compensation PWM values.
         """
-        features = self._compute_features(positions_deg)
-        gravity_pwm: list[float] = []
+        return self._gravity_vector(np.asarray(positions_deg, dtype=float)).tolist()
+
+    def compute_assist_pwm(
+        self,
+        positions_deg: np.ndarray,
+        velocities_deg: np.ndarray,
+        follower_loads: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Compute total assist PWM for a whole arm in one vectorized pass.
+
+        Combines gravity compensation + friction assist + haptic feedback
+        + viscous damping. Output clamped to +/-max_pwm and truncated to
+        integers.
+
+        Args:
+            positions_deg: Joint angles in degrees, in ``joint_{i}`` order.
+            velocities_deg: Joint velocities in deg/s, same order.
+            follower_loads: Optional external forces from the follower arm
+                (for haptics), same order.
+
+        Returns:
+            Integer PWM array, one entry per joint.
+        """
+        positions = np.asarray(positions_deg, dtype=float)
+        vel = np.asarray(velocities_deg, dtype=float)
+
+        # 1. Gravity compensation
+        total = self._gravity_vector(positions) * self.k_gravity
+
+        # 2. Friction assistance (negative damping)
+        if self.k_assist > 0:
+            friction = self.k_assist * 100.0 * np.tanh(vel / self.v_threshold)
+            total += np.where(np.abs(vel) > self.vel_deadband, friction, 0.0)
 
-        for i in range(len(positions_deg)):
-            w_key = f"joint_{i}"
-            val = 0.0
-            if self.is_calibrated and w_key in self.gravity_weights:
-                w = np.array(self.gravity_weights[w_key])
-                val = float(np.dot(w, features))
-            gravity_pwm.append(val)
+        # 3. Haptic feedback (inverted — resist external force)
+        if follower_loads is not None:
+            total -= follower_loads * self.k_haptic
 
-        return gravity_pwm
+        # 4. Viscous damping
+        total -= vel * self.k_damping
+
+        # Clamp to safety limit
+        np.clip(total, -self.max_pwm, self.max_pwm, out=total)
+        return total.astype(np.int64)
 
     def compute_assist_torque(
         self,
         joint_names: list[str],
-        positions_deg: list[float],
-        velocities_deg: list[float],
+        positions_deg: list[float] | np.ndarray,
+        velocities_deg: list[float] | np.ndarray,
         follower_torques: dict[str, float] | list[float] | None = None,
     ) -> dict[str, int]:
         """Compute total assist torque (PWM) for each joint.
 
-        Combines gravity compensation + friction assist + haptic feedback
-        + viscous damping. Output clamped to +/-max_pwm.
+        Dict-based wrapper around :meth:`compute_assist_pwm`.
 
         Args:
             joint_names: Joint name for each index.
@@ -251,38 +573,15 @@ class LeaderAssistService:
         Returns:
             Dict mapping joint_name -> integer PWM value.
         """
-        pwm_values: dict[str, int] = {}
-        features = self._compute_features(positions_deg)
-
-        for i, name in enumerate(joint_names):
-            total_pwm = 0.0
-
-            # 1. Gravity compensation
-            w_key = f"joint_{i}"
-            if self.is_calibrated and w_key in self.gravity_weights:
-                w = np.array(self.gravity_weights[w_key])
-                total_pwm += float(np.dot(w, features)) * self.k_gravity
-
-            # 2. Friction assistance (negative damping)
-            vel = velocities_deg[i]
-            if abs(vel) > self.vel_deadband and self.k_assist > 0:
-                total_pwm += self.k_assist * math.tanh(vel / self.v_threshold) * 100.0
-
-            # 3. Haptic feedback (inverted — resist external force)
-            if follower_torques:
-                f_load = 0.0
-                if isinstance(follower_torques, dict):
-                    if name in follower_torques:
-                        f_load = follower_torques[name]
-                elif i < len(follower_torques):
-                    f_load = follower_torques[i]
-                total_pwm -= f_load * self.k_haptic
-
-            # 4. Viscous damping
-            total_pwm -= vel * self.k_damping
-
-            # Clamp to safety limit
-            total_pwm = max(-self.max_pwm, min(self.max_pwm, total_pwm))
-            pwm_values[name] = int(total_pwm)
-
-        return pwm_values
+        loads: np.ndarray | None = None
+        if follower_torques:
+            loads = np.zeros(len(joint_names))
+            if isinstance(follower_torques, dict):
+                for i, name in enumerate(joint_names):
+                    loads[i] = follower_torques.get(name, 0.0)
+            else:
+                n = min(len(joint_names), len(follower_torques))
+                loads[:n] = follower_torques[:n]
+
+        pwm = self.compute_assist_pwm(positions_deg, velocities_deg, loads)
+        return dict(zip(joint_names, pwm.tolist(), strict=True))
@@ -0,0 +1,88 @@
+"""Single-slot latest-value mailbox for handing data between threads.
+
+A Mailbox holds only the newest value. The writer replaces the slot with a
+``(seq, timestamp, value)`` tuple in one attribute store, which is atomic
+under the GIL, so readers never take a lock and never see a torn update.
+Old values are overwritten, never queued: a slow consumer simply skips
+to the newest sample instead of falling behind.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Generic, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+
+class Envelope(NamedTuple, Generic[T]):
+    """A published value with its sequence number and publish time."""
+
+    seq: int
+    timestamp: float
+    value: T | None
+
+
+class Mailbox(Generic[T]):
+    """Lock-free single-producer latest-value slot.
+
+    Sequence numbers start at 1 for the first published value; ``0`` means
+    nothing has been published yet. A wake-up event lets a consumer block
+    for fresh data instead of polling.
+    """
+
+    def __init__(self) -> None:
+        self._slot: Envelope[T] = Envelope(0, 0.0, None)
+        self._ready = threading.Event()
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the newest value (0 if empty)."""
+        return self._slot.seq
+
+    def publish(self, value: T, timestamp: float | None = None) -> int:
+        """Replace the slot with ``value``. Only one thread may publish.
+
+        Args:
+            value: New value.
+            timestamp: Capture time (``time.perf_counter()``); defaults to now.
+
+        Returns:
+            The new sequence number.
+        """
+        seq = self._slot.seq + 1
+        self._slot = Envelope(seq, time.perf_counter() if timestamp is None else timestamp, value)
+        self._ready.set()
+        return seq
+
+    def latest(self) -> Envelope[T]:
+        """Return the newest envelope (seq 0 / value None if empty)."""
+        return self._slot
+
+    def wait_newer(self, after_seq: int, timeout: float | None = None) -> Envelope[T] | None:
+        """Block until a value newer than ``after_seq`` is published.
+
+        Args:
+            after_seq: Last sequence number the caller has consumed.
+            timeout: Maximum wait (seconds); None waits forever.
+
+        Returns:
+            The newest envelope, or None on timeout.
+        """
+        slot = self._slot
+        if slot.seq > after_seq:
+            return slot
+        self._ready.clear()
+        # Re-check after clearing so a publish between the two isn't missed
+        slot = self._slot
+        if slot.seq > after_seq:
+            return slot
+        if not self._ready.wait(timeout):
+            return None
+        slot = self._slot
+        return slot if slot.seq > after_seq else None
+
+    def wake(self) -> None:
+        """Wake any waiter without publishing (e.g. for shutdown)."""
+        self._ready.set()
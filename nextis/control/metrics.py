@@ -0,0 +1,250 @@
+"""Fixed-memory latency accounting for real-time control loops.
+
+LatencyHistogram is an HDR-style log-linear histogram: values are bucketed
+with a bounded relative error (~3%) into a preallocated counts array, so
+recording is O(1) and memory never grows. LoopMetrics times each stage of a
+control tick into its own histogram and tracks missed deadlines and the
+worst tick per reporting window.
+"""
+
+from __future__ import annotations
+
+import enum
+import threading
+import time
+
+import numpy as np
+
+# 64 linear sub-buckets per power of two → worst-case relative error 1/32.
+_SUB_BITS = 6
+_SUB_COUNT = 1 << _SUB_BITS
+_HALF_COUNT = _SUB_COUNT // 2
+
+
+class TickStage(enum.IntEnum):
+    """Timed stages of a teleop tick, in execution order."""
+
+    LEADER_READ = 0
+    ASSIST = 1
+    MAP = 2
+    BLEND = 3
+    SEND = 4
+    TELEMETRY = 5
+    SAFETY = 6
+    FORCE_FEEDBACK = 7
+    SLEEP_ERROR = 8
+    TICK = 9  # Total work time (excludes sleep)
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations with fixed memory.
+
+    Durations are stored in integer microseconds. Values below 64 µs get
+    exact buckets; above that each power-of-two range is split into 32
+    buckets. Values past ``max_seconds`` land in the top bucket, but the
+    exact maximum is always tracked.
+
+    Args:
+        max_seconds: Largest duration resolved without clamping.
+    """
+
+    def __init__(self, max_seconds: float = 10.0) -> None:
+        max_us = max(int(max_seconds * 1e6), _SUB_COUNT)
+        self._max_index = self._index(max_us)
+        self._counts = np.zeros(self._max_index + 1, dtype=np.int64)
+        self.count: int = 0
+        self.total_us: int = 0
+        self.max_us: int = 0
+
+    @staticmethod
+    def _index(value_us: int) -> int:
+        """Bucket index for a non-negative integer microsecond value."""
+        if value_us < _SUB_COUNT:
+            return value_us
+        shift = value_us.bit_length() - _SUB_BITS
+        return _SUB_COUNT + (shift - 1) * _HALF_COUNT + ((value_us >> shift) - _HALF_COUNT)
+
+    @staticmethod
+    def _lower_bound(index: int) -> int:
+        """Smallest microsecond value that maps to ``index``."""
+        if index < _SUB_COUNT:
+            return index
+        shift = (index - _SUB_COUNT) // _HALF_COUNT + 1
+        mantissa = (index - _SUB_COUNT) % _HALF_COUNT + _HALF_COUNT
+        return mantissa << shift
+
+    def record(self, seconds: float) -> None:
+        """Record one duration (negative values are clamped to zero)."""
+        value_us = int(seconds * 1e6) if seconds > 0 else 0
+        self._counts[min(self._index(value_us), self._max_index)] += 1
+        self.count += 1
+        self.total_us += value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+
+    def percentile(self, pct: float) -> float:
+        """Return the ``pct`` percentile (0-100) in seconds, or 0.0 if empty."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(np.ceil(self.count * pct / 100.0)))
+        index = int(np.searchsorted(np.cumsum(self._counts), rank))
+        if index >= self._max_index:
+            return self.max_us / 1e6
+        # Report the bucket midpoint, never above the observed maximum
+        low = self._lower_bound(index)
+        high = self._lower_bound(index + 1)
+        return min((low + high - 1) / 2.0, self.max_us) / 1e6
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds, or 0.0 if empty."""
+        return self.total_us / self.count / 1e6 if self.count else 0.0
+
+    def reset(self) -> None:
+        """Clear all recorded values."""
+        self._counts[:] = 0
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    def summary(self) -> dict[str, float | int]:
+        """Return count, mean, p50/p90/p99 and max in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean * 1e3, 4),
+            "p50_ms": round(self.percentile(50) * 1e3, 4),
+            "p90_ms": round(self.percentile(90) * 1e3, 4),
+            "p99_ms": round(self.percentile(99) * 1e3, 4),
+            "max_ms": round(self.max_us / 1e3, 4),
+        }
+
+
+class LoopMetrics:
+    """Per-stage latency histograms and deadline accounting for a control loop.
+
+    The loop thread calls :meth:`begin_tick`, :meth:`lap` after each stage
+    and :meth:`end_tick` once the tick's work is done. Stage timings are
+    buffered per tick and committed under a lock, so :meth:`snapshot` can be
+    called from any thread.
+
+    Args:
+        period: Target tick period (seconds); work beyond it is an overrun.
+        window: Reporting window (seconds) for rate and worst-tick tracking.
+    """
+
+    def __init__(self, period: float, window: float = 1.0) -> None:
+        self.period = period
+        self.window = window
+        self._lock = threading.Lock()
+        self._hists = {stage: LatencyHistogram() for stage in TickStage}
+        self._pending: list[float | None] = [None] * len(TickStage)
+        self._tick_start: float = 0.0
+        self._last_mark: float = 0.0
+
+        self.ticks: int = 0
+        self.overruns: int = 0
+        self.worst_tick: float = 0.0
+
+        self._window_start = time.perf_counter()
+        self._window_ticks: int = 0
+        self._window_overruns: int = 0
+        self._window_worst: float = 0.0
+        self.last_window: dict[str, float | int] = {
+            "rate_hz": 0.0,
+            "ticks": 0,
+            "overruns": 0,
+            "worst_tick_ms": 0.0,
+        }
+
+    def begin_tick(self) -> None:
+        """Mark the start of a tick."""
+        self._tick_start = self._last_mark = time.perf_counter()
+
+    def lap(self, stage: TickStage) -> None:
+        """Attribute the time since the previous mark to ``stage``."""
+        now = time.perf_counter()
+        self._pending[stage] = now - self._last_mark
+        self._last_mark = now
+
+    def skip(self) -> None:
+        """Advance the mark without attributing time (untimed bookkeeping)."""
+        self._last_mark = time.perf_counter()
+
+    def end_tick(self) -> float:
+        """Commit the tick's stage timings.
+
+        Returns:
+            Work time of the tick (seconds), for sleep scheduling.
+        """
+        work = time.perf_counter() - self._tick_start
+        pending = self._pending
+        with self._lock:
+            for stage, value in enumerate(pending):
+                if value is not None:
+                    self._hists[stage].record(value)
+                    pending[stage] = None
+            self._hists[TickStage.TICK].record(work)
+            self.ticks += 1
+            self._window_ticks += 1
+            if work > self.period:
+                self.overruns += 1
+                self._window_overruns += 1
+            if work > self.worst_tick:
+                self.worst_tick = work
+            if work > self._window_worst:
+                self._window_worst = work
+        return work
+
+    def record_sleep_error(self, error: float) -> None:
+        """Record how far a sleep overshot (positive) or undershot its target."""
+        with self._lock:
+            self._hists[TickStage.SLEEP_ERROR].record(abs(error))
+
+    def roll_window(self) -> dict[str, float | int] | None:
+        """Close the reporting window if it has elapsed.
+
+        Returns:
+            The finished window's stats, or None if the window is still open.
+        """
+        now = time.perf_counter()
+        elapsed = now - self._window_start
+        if elapsed < self.window:
+            return None
+        with self._lock:
+            self.last_window = {
+                "rate_hz": round(self._window_ticks / elapsed, 2),
+                "ticks": self._window_ticks,
+                "overruns": self._window_overruns,
+                "worst_tick_ms": round(self._window_worst * 1e3, 4),
+            }
+            self._window_start = now
+            self._window_ticks = 0
+            self._window_overruns = 0
+            self._window_worst = 0.0
+            return dict(self.last_window)
+
+    def reset(self) -> None:
+        """Clear all histograms and counters."""
+        with self._lock:
+            for hist in self._hists.values():
+                hist.reset()
+            self.ticks = 0
+            self.overruns = 0
+            self.worst_tick = 0.0
+            self._window_start = time.perf_counter()
+            self._window_ticks = 0
+            self._window_overruns = 0
+            self._window_worst = 0.0
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable view of all counters and histograms."""
+        with self._lock:
+            return {
+                "period_ms": round(self.period * 1e3, 4),
+                "ticks": self.ticks,
+                "overruns": self.overruns,
+                "overrun_rate": round(self.overruns / self.ticks, 5) if self.ticks else 0.0,
+                "worst_tick_ms": round(self.worst_tick * 1e3, 4),
+                "window": dict(self.last_window),
+                "stages": {stage.name.lower(): self._hists[stage].summary() for stage in TickStage},
+            }
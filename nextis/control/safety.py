@@ -103,7 +103,7 @@ class SafetyLayer:
             logger.error("Safety check failed: %s", e)
             return True
 
-    def check_damiao_limits(self, robot: Any) -> bool:
+    def check_damiao_limits(self, robot: Any, torques: dict[str, float] | None = None) -> bool:
         """Check Damiao motor torque limits.
 
         Damiao motors report torque in Nm. Checks against per-motor limits
@@ -111,6 +111,8 @@ class SafetyLayer:
 
         Args:
             robot: Connected robot with get_torques()/get_torque_limits() methods.
+            torques: Torques already read this tick (e.g. from a telemetry
+                snapshot). When omitted they are read from the robot.
 
         Returns:
             True if safe, False if emergency stop was triggered.
@@ -122,7 +124,8 @@ class SafetyLayer:
             return True
 
         try:
-            torques = robot.get_torques()
+            if torques is None:
+                torques = robot.get_torques()
             limits = robot.get_torque_limits()
 
             for motor_name, torque in torques.items():
@@ -189,22 +192,38 @@ class SafetyLayer:
 
     def _discover_motors(self, robot: Any) -> None:
         """Build list of Feetech motors to monitor (skips Damiao buses)."""
-        buses: list = []
-        if hasattr(robot, "left_arm"):
-            buses.append(robot.left_arm.bus)
-        if hasattr(robot, "right_arm"):
-            buses.append(robot.right_arm.bus)
-        if hasattr(robot, "bus"):
-            buses.append(robot.bus)
-
-        for bus in buses:
-            # Skip Damiao CAN buses — they use check_damiao_limits()
-            try:
-                from lerobot.motors.damiao.damiao import DamiaoMotorsBus
-
-                if isinstance(bus, DamiaoMotorsBus):
-                    continue
-            except ImportError:
-                pass
+        for bus, _prefix in feetech_buses(robot):
             for motor_name in bus.motors:
                 self.monitored_motors.append((bus, motor_name))
+
+
+def feetech_buses(robot: Any) -> list[tuple[Any, str]]:
+    """Return the robot's load-reporting (non-Damiao) buses.
+
+    Args:
+        robot: Connected robot instance (single or bi-manual).
+
+    Returns:
+        List of (bus, motor-name prefix) pairs; the prefix is ``"left_"`` /
+        ``"right_"`` for bi-manual arms and empty otherwise.
+    """
+    candidates: list[tuple[Any, str]] = []
+    if hasattr(robot, "left_arm"):
+        candidates.append((robot.left_arm.bus, "left_"))
+    if hasattr(robot, "right_arm"):
+        candidates.append((robot.right_arm.bus, "right_"))
+    if hasattr(robot, "bus"):
+        candidates.append((robot.bus, ""))
+
+    buses: list[tuple[Any, str]] = []
+    for bus, prefix in candidates:
+        # Skip Damiao CAN buses — they use check_damiao_limits()
+        try:
+            from lerobot.motors.damiao.damiao import DamiaoMotorsBus
+
+            if isinstance(bus, DamiaoMotorsBus):
+                continue
+        except ImportError:
+            pass
+        buses.append((bus, prefix))
+    return buses
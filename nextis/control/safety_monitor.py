@@ -0,0 +1,259 @@
+"""Dedicated high-rate safety monitor thread.
+
+SafetyMonitor takes motor load/torque checks off the teleop critical path.
+It samples every monitored motor per cycle — one ``sync_read`` of
+``Present_Load`` per Feetech bus plus one ``get_torques()`` for Damiao
+followers — evaluates thresholds and debounce counters as NumPy arrays, and
+publishes a SafetyViolation through a mailbox. The control loop polls the
+mailbox each tick (an attribute read) and performs the emergency stop.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from nextis.control.mailbox import Mailbox
+from nextis.control.metrics import LatencyHistogram
+from nextis.control.safety import SafetyLayer, feetech_buses
+from nextis.control.ticker import RateTicker
+
+logger = logging.getLogger(__name__)
+
+# Fallback torque limit (Nm) for motors missing from get_torque_limits()
+_DEFAULT_TORQUE_LIMIT = 10.0
+
+
+@dataclass(frozen=True)
+class SafetyViolation:
+    """Motors whose load or torque stayed over limit past the debounce.
+
+    Attributes:
+        timestamp: Detection time (``time.perf_counter()``).
+        motors: Names of the tripped motors.
+        values: Measured load (0-1000) or torque (Nm) per motor.
+        limits: Limit each value was compared against.
+    """
+
+    timestamp: float
+    motors: tuple[str, ...]
+    values: tuple[float, ...]
+    limits: tuple[float, ...]
+
+    def describe(self) -> str:
+        """Human-readable summary for logs."""
+        return ", ".join(
+            f"{m}={v:.2f}/{lim:.2f}"
+            for m, v, lim in zip(self.motors, self.values, self.limits, strict=True)
+        )
+
+
+@dataclass
+class _Channel:
+    """One bulk read: a Feetech bus (loads) or the robot's torques."""
+
+    bus: Any  # None for the torque channel
+    motors: list[str]  # Bus-local motor names
+    span: slice  # Position in the monitor's value vector
+
+
+class SafetyMonitor:
+    """Samples all motor loads/torques at a fixed rate in its own thread.
+
+    Args:
+        robot: Connected follower robot.
+        safety: SafetyLayer supplying thresholds, debounce limit and the bus
+            lock shared with the control loop.
+        frequency: Sampling rate (Hz).
+        torques: Also monitor Damiao torques via ``robot.get_torques()``.
+    """
+
+    def __init__(
+        self,
+        robot: Any,
+        safety: SafetyLayer,
+        frequency: float = 100.0,
+        torques: bool = False,
+    ) -> None:
+        self.robot = robot
+        self.safety = safety
+        self.frequency = frequency
+        self.monitor_torques = torques and hasattr(robot, "get_torques")
+
+        self._channels: list[_Channel] = []
+        self._torque_channel: _Channel | None = None
+        self.motor_names: list[str] = []
+        self._limits = np.zeros(0)
+        self._values = np.zeros(0)
+        self._fresh = np.zeros(0, dtype=bool)
+        self._counts = np.zeros(0, dtype=np.int64)
+
+        self._box: Mailbox[SafetyViolation] = Mailbox()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._sample_hist = LatencyHistogram(max_seconds=1.0)
+        self.samples: int = 0
+        self.read_errors: int = 0
+
+    @property
+    def violation(self) -> SafetyViolation | None:
+        """The published violation, or None while everything is within limits."""
+        return self._box.latest().value
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the sampling thread is active."""
+        return self._running
+
+    def start(self) -> None:
+        """Discover motors, clear state and start the sampling thread."""
+        if self._running:
+            return
+        self._discover()
+        self._box = Mailbox()
+        self._sample_hist.reset()
+        self.samples = 0
+        self.read_errors = 0
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name="SafetyMonitor")
+        self._thread.start()
+        logger.info(
+            "Safety monitor started at %.0fHz over %d motors",
+            self.frequency,
+            len(self.motor_names),
+        )
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._running = False
+        if (
+            self._thread
+            and self._thread.is_alive()
+            and self._thread is not threading.current_thread()
+        ):
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def stats(self) -> dict:
+        """Sampling rate, read time distribution and violation state."""
+        violation = self.violation
+        return {
+            "frequency_hz": self.frequency,
+            "motors": len(self.motor_names),
+            "samples": self.samples,
+            "read_errors": self.read_errors,
+            "sample": self._sample_hist.summary(),
+            "tripped": violation is not None,
+            "violation": violation.describe() if violation else "",
+        }
+
+    # ── Sampling ───────────────────────────────────────────────────
+
+    def _discover(self) -> None:
+        """Build bulk-read channels and the limit vector."""
+        self._channels = []
+        self._torque_channel = None
+        names: list[str] = []
+        limits: list[float] = []
+
+        for bus, prefix in feetech_buses(self.robot):
+            motors = list(bus.motors)
+            if not motors:
+                continue
+            span = slice(len(names), len(names) + len(motors))
+            self._channels.append(_Channel(bus, motors, span))
+            names.extend(f"{prefix}{m}" for m in motors)
+            limits.extend([float(self.safety.load_threshold)] * len(motors))
+
+        if self.monitor_torques:
+            try:
+                motors = list(self.robot.get_torques())
+                torque_limits = self.robot.get_torque_limits()
+            except Exception as e:
+                logger.warning("Safety monitor: torque discovery failed: %s", e)
+                motors, torque_limits = [], {}
+            if motors:
+                span = slice(len(names), len(names) + len(motors))
+                self._torque_channel = _Channel(None, motors, span)
+                names.extend(motors)
+                limits.extend(torque_limits.get(m, _DEFAULT_TORQUE_LIMIT) for m in motors)
+
+        self.motor_names = names
+        self._limits = np.array(limits, dtype=float)
+        self._values = np.zeros(len(names))
+        self._fresh = np.zeros(len(names), dtype=bool)
+        self._counts = np.zeros(len(names), dtype=np.int64)
+
+    def _run(self) -> None:
+        """Sample at ``frequency`` until stopped or a violation is published."""
+        ticker = RateTicker(self.frequency)
+        ticker.start()
+        while self._running:
+            if self.sample() is not None:
+                break
+            ticker.wait()
+        self._running = False
+
+    def sample(self) -> SafetyViolation | None:
+        """Read every channel once and evaluate limits.
+
+        Returns:
+            The violation published by this sample, if any.
+        """
+        start = time.perf_counter()
+        self._fresh[:] = False
+        with self.safety.lock:
+            for channel in self._channels:
+                self._read_loads(channel)
+            if self._torque_channel is not None:
+                self._read_torques(self._torque_channel)
+        self._sample_hist.record(time.perf_counter() - start)
+        self.samples += 1
+        return self._evaluate()
+
+    def _read_loads(self, channel: _Channel) -> None:
+        """One sync-read of Present_Load for a whole Feetech bus."""
+        try:
+            raw = channel.bus.sync_read("Present_Load", channel.motors, normalize=False)
+            self._values[channel.span] = [raw[m] % 1024 for m in channel.motors]
+            self._fresh[channel.span] = True
+        except Exception as e:
+            self.read_errors += 1
+            if self.read_errors % 100 == 1:
+                logger.warning("Safety monitor load read failed: %s", e)
+
+    def _read_torques(self, channel: _Channel) -> None:
+        """Read all Damiao torques in one call."""
+        try:
+            torques = self.robot.get_torques()
+            self._values[channel.span] = [torques.get(m, 0.0) for m in channel.motors]
+            self._fresh[channel.span] = True
+        except Exception as e:
+            self.read_errors += 1
+            if self.read_errors % 100 == 1:
+                logger.warning("Safety monitor torque read failed: %s", e)
+
+    def _evaluate(self) -> SafetyViolation | None:
+        """Vectorized threshold + debounce; publish on trip."""
+        over = np.abs(self._values) > self._limits
+        # Fresh samples count up while over limit and reset otherwise; motors
+        # whose read failed this cycle keep their count
+        self._counts = np.where(self._fresh, (self._counts + 1) * over, self._counts)
+        tripped = np.flatnonzero(self._counts >= self.safety.violation_limit)
+        if tripped.size == 0:
+            return None
+
+        violation = SafetyViolation(
+            timestamp=time.perf_counter(),
+            motors=tuple(self.motor_names[i] for i in tripped),
+            values=tuple(float(v) for v in self._values[tripped]),
+            limits=tuple(float(v) for v in self._limits[tripped]),
+        )
+        self._box.publish(violation, violation.timestamp)
+        logger.error("Safety monitor tripped: %s", violation.describe())
+        return violation
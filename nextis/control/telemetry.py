@@ -0,0 +1,114 @@
+"""Per-tick follower telemetry shared by every consumer of the bus.
+
+Safety, force feedback, recording and intervention detection all need the
+follower's positions and torques. Reading them separately costs one bus
+transaction per consumer per tick; instead the control loop reads a
+TelemetrySnapshot once and hands the same immutable snapshot to all of them.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TelemetrySnapshot:
+    """Follower (and optionally leader) state captured in one read.
+
+    Attributes:
+        timestamp: Capture time (``time.perf_counter()``).
+        positions: Follower joint positions keyed like the observation
+            (``"{motor}.pos"``).
+        velocities: Follower joint velocities, same keys as ``positions``
+            (units per second).
+        torques: Follower motor torques keyed by bare motor name (Nm). Empty
+            if the robot does not report torque.
+        leader_positions: Leader observation from the same tick, if any.
+    """
+
+    timestamp: float
+    positions: dict[str, float]
+    velocities: dict[str, float] = field(default_factory=dict)
+    torques: dict[str, float] = field(default_factory=dict)
+    leader_positions: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was captured."""
+        return time.perf_counter() - self.timestamp
+
+
+class TelemetryReader:
+    """Reads one TelemetrySnapshot per call from a follower robot.
+
+    Positions come from ``get_cached_positions()`` when the robot keeps a
+    cache refreshed by its command replies (Damiao), falling back to
+    ``get_observation()``. Velocities are taken from
+    ``get_cached_velocities()`` if available, otherwise differenced against
+    the previous snapshot.
+
+    Args:
+        robot: Connected follower robot.
+    """
+
+    def __init__(self, robot: Any) -> None:
+        self.robot = robot
+        self._has_cached_positions = hasattr(robot, "get_cached_positions")
+        self._has_cached_velocities = hasattr(robot, "get_cached_velocities")
+        self._has_torques = hasattr(robot, "get_torques")
+        self._previous: TelemetrySnapshot | None = None
+
+    def reset(self) -> None:
+        """Forget the previous snapshot (velocity differencing restarts)."""
+        self._previous = None
+
+    def read(self, leader_obs: dict[str, float] | None = None) -> TelemetrySnapshot:
+        """Read positions, velocities and torques from the follower once.
+
+        Args:
+            leader_obs: Leader observation already read this tick, attached
+                to the snapshot as-is (no extra leader read).
+
+        Returns:
+            A new TelemetrySnapshot.
+        """
+        robot = self.robot
+        if self._has_cached_positions:
+            positions = {f"{k}.pos": float(v) for k, v in robot.get_cached_positions().items()}
+        else:
+            positions = {
+                k: float(v) for k, v in robot.get_observation().items() if k.endswith(".pos")
+            }
+        torques = robot.get_torques() if self._has_torques else {}
+        timestamp = time.perf_counter()
+
+        if self._has_cached_velocities:
+            velocities = {f"{k}.pos": float(v) for k, v in robot.get_cached_velocities().items()}
+        else:
+            velocities = self._difference(positions, timestamp)
+
+        snapshot = TelemetrySnapshot(
+            timestamp=timestamp,
+            positions=positions,
+            velocities=velocities,
+            torques=torques,
+            leader_positions=leader_obs or {},
+        )
+        self._previous = snapshot
+        return snapshot
+
+    def _difference(self, positions: dict[str, float], timestamp: float) -> dict[str, float]:
+        """Finite-difference velocities against the previous snapshot."""
+        previous = self._previous
+        if previous is None:
+            return dict.fromkeys(positions, 0.0)
+        dt = timestamp - previous.timestamp
+        if dt <= 0:
+            return dict(previous.velocities)
+        last = previous.positions
+        return {k: (v - last[k]) / dt if k in last else 0.0 for k, v in positions.items()}
@@ -0,0 +1,230 @@
+"""Multi-pairing teleoperation engine.
+
+Runs several leader→follower TeleopLoops from one shared clock. Each
+pairing keeps its own joint layout, safety layer, force feedback and
+latency metrics; the engine only owns the clock. With more than one
+pairing, each ticks on its own worker thread so a slow or timing-out bus
+on one station never delays control or safety checks on another. A safety
+stop or fault on one pairing stops that pairing alone; the others keep
+running.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from nextis.control.metrics import LatencyHistogram
+from nextis.control.teleop_loop import TeleopLoop
+from nextis.control.ticker import OverrunPolicy, RateTicker
+
+logger = logging.getLogger(__name__)
+
+
+class _PairingWorker:
+    """Worker thread that runs one pairing's tick when the scheduler releases it."""
+
+    def __init__(self, engine: TeleopEngine, pairing_id: str, loop: TeleopLoop) -> None:
+        self.engine = engine
+        self.pairing_id = pairing_id
+        self.loop = loop
+        self.busy = False
+        self.missed: int = 0
+        self._lateness: float | None = None
+        self._go = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name=f"TeleopPairing-{pairing_id}"
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def release(self, lateness: float | None) -> bool:
+        """Start one tick; False if the previous tick is still running."""
+        if self.busy:
+            self.missed += 1
+            return False
+        self._lateness = lateness
+        self.busy = True
+        self._go.set()
+        return True
+
+    def join(self, timeout: float) -> None:
+        self._go.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while self.engine.is_running and self.loop.is_running:
+            if not self._go.wait(timeout=0.1):
+                continue
+            self._go.clear()
+            if not self.busy:
+                continue  # woken by join()
+            try:
+                if self._lateness is not None:
+                    self.loop.record_wake(self._lateness)
+                self.engine._tick_pairing(self.pairing_id, self.loop)
+            finally:
+                self.busy = False
+
+
+class TeleopEngine:
+    """Drives N TeleopLoops from a single absolute-deadline scheduler.
+
+    A single pairing ticks inline on the scheduler thread. With several,
+    the scheduler releases every pairing's worker once per period; a
+    pairing still busy with its previous tick misses that release (counted
+    in ``missed_ticks``) instead of holding up the others.
+
+    Args:
+        loops: Pairing ID -> TeleopLoop. Insertion order is tick order; the
+            first entry is the primary pairing (used by recording).
+        frequency: Shared control frequency (Hz).
+        overrun_policy: How the shared ticker handles missed deadlines.
+    """
+
+    def __init__(
+        self,
+        loops: dict[str, TeleopLoop],
+        frequency: int = 60,
+        overrun_policy: OverrunPolicy = OverrunPolicy.SKIP,
+    ) -> None:
+        if not loops:
+            raise ValueError("TeleopEngine needs at least one pairing")
+        self.loops = loops
+        self.frequency = frequency
+        self.ticker = RateTicker(frequency, policy=overrun_policy)
+        self._tick_hist = LatencyHistogram()
+        self._stats_lock = threading.Lock()
+        self.is_running = False
+        self.loop_count: int = 0
+        self._thread: threading.Thread | None = None
+        self._workers: dict[str, _PairingWorker] = {}
+
+    @property
+    def primary(self) -> TeleopLoop:
+        """The first pairing's loop."""
+        return next(iter(self.loops.values()))
+
+    @property
+    def pairing_ids(self) -> list[str]:
+        """IDs of all pairings managed by this engine."""
+        return list(self.loops)
+
+    @property
+    def active_pairings(self) -> list[str]:
+        """IDs of pairings whose loop is still running."""
+        return [pid for pid, loop in self.loops.items() if loop.is_running]
+
+    def start(self) -> None:
+        """Prepare every pairing and start the scheduler thread."""
+        if self.is_running:
+            logger.warning("Teleop engine already running")
+            return
+
+        for loop in self.loops.values():
+            loop.begin()
+        with self._stats_lock:
+            self._tick_hist.reset()
+        self.loop_count = 0
+        self.is_running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name="TeleopEngine")
+        self._thread.start()
+        logger.info(
+            "Teleop engine started at %dHz with %d pairing(s): %s",
+            self.frequency,
+            len(self.loops),
+            ", ".join(self.loops),
+        )
+
+    def stop(self) -> None:
+        """Stop the scheduler and every pairing."""
+        self.is_running = False
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        for loop in self.loops.values():
+            loop.stop()
+        logger.info("Teleop engine stopped")
+
+    def stop_pairing(self, pairing_id: str) -> None:
+        """Stop a single pairing; the engine keeps running the rest.
+
+        Raises:
+            KeyError: If the pairing is not managed by this engine.
+        """
+        self.loops[pairing_id].stop()
+
+    def _tick_pairing(self, pairing_id: str, loop: TeleopLoop) -> None:
+        """Run one tick of a pairing, stopping it on a safety trip or fault."""
+        tick_start = time.perf_counter()
+        try:
+            if not loop.tick():
+                logger.error("Pairing %s stopped by safety check", pairing_id)
+                loop.finish()
+        except Exception as e:
+            logger.error("Pairing %s failed — stopping it", pairing_id)
+            loop.report_failure(e)
+            loop.finish()
+        with self._stats_lock:
+            self._tick_hist.record(time.perf_counter() - tick_start)
+
+    def _run(self) -> None:
+        """Scheduler loop: tick every running pairing once per period."""
+        ticker = self.ticker
+        if len(self.loops) > 1:
+            self._workers = {
+                pid: _PairingWorker(self, pid, loop) for pid, loop in self.loops.items()
+            }
+            for worker in self._workers.values():
+                worker.start()
+        ticker.start()
+        lateness: float | None = None
+        try:
+            while self.is_running:
+                running = [(pid, loop) for pid, loop in self.loops.items() if loop.is_running]
+                if not running:
+                    logger.info("All teleop pairings stopped — engine exiting")
+                    break
+
+                if self._workers:
+                    for pid, _loop in running:
+                        self._workers[pid].release(lateness)
+                else:
+                    pid, loop = running[0]
+                    if lateness is not None:
+                        loop.record_wake(lateness)
+                    self._tick_pairing(pid, loop)
+
+                self.loop_count += 1
+                lateness = ticker.wait()
+        finally:
+            self.is_running = False
+            for worker in self._workers.values():
+                worker.join(timeout=2.0)
+            for loop in self.loops.values():
+                loop.finish()
+
+    def get_metrics(self) -> dict:
+        """Return shared scheduler stats plus per-pairing loop metrics."""
+        with self._stats_lock:
+            tick = self._tick_hist.summary()
+        scheduler = self.ticker.stats()
+        return {
+            "running": self.is_running,
+            "loop_count": self.loop_count,
+            "frequency_hz": self.frequency,
+            "scheduler": scheduler,
+            "tick": tick,
+            # Pairings share the engine clock, so report its scheduler stats
+            "pairings": {
+                pid: {
+                    **loop.get_metrics(),
+                    "scheduler": scheduler,
+                    "missed_ticks": worker.missed if (worker := self._workers.get(pid)) else 0,
+                }
+                for pid, loop in self.loops.items()
+            },
+        }
@@ -3,6 +3,19 @@
 Composes safety, joint mapping, force feedback, and leader assist into
 a single threaded control loop that reads the leader arm, maps joints,
 blends startup, sends commands to the follower, and applies safety checks.
+
+In pipelined mode the leader read and follower write run on their own I/O
+threads and hand off through latest-value mailboxes, so a slow transaction
+on one bus no longer stalls the other.
+
+Follower telemetry (positions, velocities, torques) is read at most once
+per tick into a TelemetrySnapshot that safety, force feedback and external
+consumers such as the recorder all share.
+
+With a SafetyMonitor attached, load/torque limit checks run on their own
+thread at a higher rate and the tick only polls for a published violation.
+A TorqueTrendPredictor fed from the telemetry snapshot slows the follower
+down when torque is trending toward its limit, ahead of any hard E-stop.
 """
 
 from __future__ import annotations
@@ -16,20 +29,19 @@ from typing import Any
 import numpy as np
 
 from nextis.control.force_feedback import GripperForceFeedback, JointForceFeedback
-from nextis.control.joint_mapping import JointMapper
+from nextis.control.joint_mapping import JointLayout, JointMapper
 from nextis.control.leader_assist import LeaderAssistService
+from nextis.control.mailbox import Mailbox
+from nextis.control.metrics import LatencyHistogram, LoopMetrics, TickStage
 from nextis.control.safety import SafetyLayer
+from nextis.control.safety_monitor import SafetyMonitor
+from nextis.control.telemetry import TelemetryReader, TelemetrySnapshot
+from nextis.control.ticker import OverrunPolicy, RateTicker
+from nextis.control.torque_trend import TorqueTrendPredictor
+from nextis.errors import SafetyError
 
 logger = logging.getLogger(__name__)
 
-# Try to import precise_sleep from lerobot, fallback to time.sleep
-try:
-    from lerobot.utils.robot_utils import precise_sleep
-except ImportError:
-
-    def precise_sleep(dt: float) -> None:
-        time.sleep(max(0, dt))
-
 
 class TeleopLoop:
     """Threaded 60Hz teleoperation control loop.
@@ -47,6 +59,21 @@ class TeleopLoop:
         joint_ff: Optional JointForceFeedback controller.
         frequency: Control loop frequency (Hz).
         blend_duration: Startup blend ramp time (seconds).
+        overrun_policy: How the ticker handles ticks that miss their deadline.
+        pipelined: Run leader reads and follower writes on dedicated I/O
+            threads, handing off through latest-value mailboxes.
+        io_frequency: Leader read rate in pipelined mode (Hz). Defaults to
+            twice the control frequency.
+        max_leader_age: In pipelined mode, leader samples older than this
+            (seconds) are treated as missing and the follower holds.
+        safety_monitor_hz: If set, run a SafetyMonitor thread at this rate
+            instead of the in-tick torque check.
+        predictive_safety: Slow the follower when telemetry torques trend
+            toward their limits (needs a torque-reporting follower).
+        leader_lock: Lock guarding the leader bus, shared with other bus
+            users such as the diagnostics sampler.
+        shared_bus: Other threads (e.g. the diagnostics sampler) use the
+            follower bus through ``safety.lock``, so always guard it.
     """
 
     def __init__(
@@ -60,6 +87,14 @@ class TeleopLoop:
         joint_ff: JointForceFeedback | None = None,
         frequency: int = 60,
         blend_duration: float = 2.0,
+        overrun_policy: OverrunPolicy = OverrunPolicy.SKIP,
+        pipelined: bool = False,
+        io_frequency: float | None = None,
+        max_leader_age: float = 0.1,
+        safety_monitor_hz: float | None = None,
+        predictive_safety: bool = True,
+        leader_lock: Any | None = None,
+        shared_bus: bool = False,
     ) -> None:
         self.robot = robot
         self.leader = leader
@@ -83,18 +118,91 @@ class TeleopLoop:
         self._leader_start_rad: dict[str, float] = {}
         self._rad_to_percent_scale: dict[str, float] = {}
         self.loop_count: int = 0
+        self._last_work: float | None = None
+
+        # Compiled joint layout and preallocated per-tick vectors
+        self._layout: JointLayout | None = None
+        self._leader_vec = np.zeros(0)
+        self._leader_valid = np.zeros(0, dtype=bool)
+        self._follower_vec = np.zeros(0)
+        self._follower_valid = np.zeros(0, dtype=bool)
+        self._blend_start_vec = np.zeros(0)
+        self._blend_start_mask = np.zeros(0)
+        self._blend_scratch = np.zeros(0)
 
         # Leader assist state
         self.assist_enabled = False
         self.assist_groups: dict[str, list[str]] = {}
-        self._last_leader_pos: dict[str, float] = {}
-        self._leader_vel_filtered: dict[str, float] = {}
+        # All assist groups are concatenated into one "assist vector" so the
+        # velocity filter runs once per tick; each group owns a slice of it.
+        self._assist_slices: list[tuple[str, slice]] = []
+        self._assist_index = np.zeros(0, dtype=np.intp)
+        self._assist_starts = np.zeros(0, dtype=np.intp)
+        self._assist_lengths = np.zeros(0, dtype=np.intp)
+        self._assist_last = np.zeros(0)
+        self._assist_vel = np.zeros(0)
+        self._assist_has_last = np.zeros(0, dtype=bool)
         self._alpha_vel: float = 0.2
+        # Online gravity learning: sample leader loads every N ticks at rest
+        self.assist_sample_interval: int = 10
+
+        # Absolute-deadline scheduler + per-stage latency accounting
+        self.ticker = RateTicker(frequency, policy=overrun_policy)
+        self.metrics = LoopMetrics(period=self.dt)
+
+        # Pipelined I/O: leader reader → control tick → follower writer
+        self.pipelined = pipelined
+        self.io_frequency = io_frequency or 2.0 * frequency
+        self.max_leader_age = max_leader_age
+        self._io_threads: list[threading.Thread] = []
+        self._leader_box: Mailbox[dict[str, float]] = Mailbox()
+        self._action_box: Mailbox[dict[str, float]] = Mailbox()
+        self._leader_sample_time: float = 0.0
+        self._pipeline_hists: dict[str, LatencyHistogram] = {
+            name: LatencyHistogram()
+            for name in ("leader_read", "leader_age", "follower_write", "end_to_end")
+        }
+        # Off-tick safety sampling (loads/torques) on a dedicated thread
+        self.safety_monitor: SafetyMonitor | None = None
+        if safety_monitor_hz:
+            self.safety_monitor = SafetyMonitor(
+                robot,
+                safety,
+                frequency=safety_monitor_hz,
+                torques=joint_mapper.has_damiao_follower,
+            )
+
+        # Predictive slowdown: speed scale applied to each tick's step toward
+        # the target, driven by the torque trend of the telemetry snapshot
+        self.predictive_safety = predictive_safety
+        self.torque_trend: TorqueTrendPredictor | None = None
+        self._speed_scale: float = 1.0
+        self._last_sent_vec = np.zeros(0)
+        self._has_last_sent = False
+
+        # Bus guards serialize other threads (I/O, safety monitor, diagnostics
+        # sampler) against in-tick bus access. No-ops when the loop is the
+        # only bus user.
+        if leader_lock is not None:
+            self._leader_guard: Any = leader_lock
+        else:
+            self._leader_guard = threading.Lock() if pipelined else contextlib.nullcontext()
+        if pipelined or self.safety_monitor or shared_bus:
+            self._follower_guard: Any = safety.lock
+        else:
+            self._follower_guard = contextlib.nullcontext()
 
         # Force feedback options
         self.force_feedback_enabled = True
         self.joint_ff_enabled = True
 
+        # Per-tick follower telemetry. Always read for Damiao followers (safety
+        # and force feedback consume it); set telemetry_enabled to also read it
+        # for external consumers such as the recorder.
+        self.telemetry_enabled = False
+        self._telemetry_reader = TelemetryReader(robot) if robot else None
+        self._telemetry_box: Mailbox[TelemetrySnapshot] = Mailbox()
+
         # Shared action state (for external consumers like recording)
         self._latest_action: dict[str, float] = {}
         self._action_lock = threading.Lock()
@@ -109,109 +217,310 @@ class TeleopLoop:
             logger.warning("Teleop loop already running")
             return
 
+        self.begin()
+        self._thread = threading.Thread(target=self._loop, daemon=True, name="TeleopLoop")
+        self._thread.start()
+        logger.info(
+            "Teleop loop started at %dHz%s",
+            self.frequency,
+            f" (pipelined, leader I/O {self.io_frequency:.0f}Hz)" if self.pipelined else "",
+        )
+
+    def begin(self) -> None:
+        """Reset loop state and start I/O threads, without a control thread.
+
+        ``start()`` calls this before spawning its own thread; an external
+        scheduler (TeleopEngine) calls it and then drives :meth:`tick`.
+        """
         self.is_running = True
-        self._blend_start_time = None
+        self._blend_start_time = time.time()
+        self._layout = None
         self._follower_start_pos = {}
         self._leader_start_rad = {}
         self._rad_to_percent_scale = {}
         self.loop_count = 0
-
-        self._thread = threading.Thread(target=self._loop, daemon=True, name="TeleopLoop")
-        self._thread.start()
-        logger.info("Teleop loop started at %dHz", self.frequency)
+        self._last_work = None
+        self.torque_trend = None
+        self._speed_scale = 1.0
+        self._has_last_sent = False
+        self.metrics.reset()
+        self._telemetry_box = Mailbox()
+        if self._telemetry_reader:
+            self._telemetry_reader.reset()
+        self._compile_layout()
+
+        if self.safety_monitor:
+            self.safety_monitor.start()
+
+        if self.pipelined:
+            self._leader_box = Mailbox()
+            self._action_box = Mailbox()
+            for hist in self._pipeline_hists.values():
+                hist.reset()
+            self._io_threads = [
+                threading.Thread(target=self._leader_io_loop, daemon=True, name="TeleopLeaderIO"),
+                threading.Thread(
+                    target=self._follower_io_loop, daemon=True, name="TeleopFollowerIO"
+                ),
+            ]
+            for io_thread in self._io_threads:
+                io_thread.start()
 
     def stop(self) -> None:
-        """Stop the teleoperation loop and wait for thread to exit."""
+        """Stop the teleoperation loop and wait for all threads to exit."""
         self.is_running = False
+        self._action_box.wake()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
             self._thread = None
+        for io_thread in self._io_threads:
+            if io_thread.is_alive():
+                io_thread.join(timeout=2.0)
+        self._io_threads = []
+        if self.safety_monitor:
+            self.safety_monitor.stop()
+        for service in self.leader_assists.values():
+            if service.online_learning:
+                service.save_online_weights()
         logger.info("Teleop loop stopped")
 
+    def get_metrics(self) -> dict:
+        """Snapshot of per-stage latency histograms and overrun counters."""
+        snapshot = self.metrics.snapshot()
+        snapshot["running"] = self.is_running
+        snapshot["loop_count"] = self.loop_count
+        snapshot["frequency_hz"] = self.frequency
+        snapshot["scheduler"] = self.ticker.stats()
+        snapshot["pipelined"] = self.pipelined
+        snapshot["pipeline"] = (
+            {name: hist.summary() for name, hist in self._pipeline_hists.items()}
+            if self.pipelined
+            else {}
+        )
+        snapshot["safety_monitor"] = self.safety_monitor.stats() if self.safety_monitor else {}
+        snapshot["torque_trend"] = self.torque_trend.stats() if self.torque_trend else {}
+        return snapshot
+
     @property
     def latest_action(self) -> dict[str, float]:
         """Thread-safe copy of the latest follower action dict."""
         with self._action_lock:
             return self._latest_action.copy()
 
+    @property
+    def telemetry(self) -> TelemetrySnapshot | None:
+        """Most recent follower telemetry snapshot, or None if none was read.
+
+        Snapshots are immutable, so callers may keep the reference.
+        """
+        return self._telemetry_box.latest().value
+
     # ── Main Loop ──────────────────────────────────────────────────
 
     def _loop(self) -> None:
         """Core 60Hz control loop."""
         logger.info("Control loop running at %dHz", self.frequency)
-        self._blend_start_time = time.time()
-
-        perf_start = time.time()
+        ticker = self.ticker
+        ticker.start()
 
         try:
             while self.is_running:
-                loop_start = time.perf_counter()
-
-                # 1. Read leader state
-                obs = self._read_leader()
-                if obs is None:
-                    continue
-
-                # 2. Apply leader assist (gravity comp, friction, haptics)
-                if self.leader_assists and self.assist_enabled:
-                    self._apply_leader_assist(obs)
-
-                # 3. Map leader joints → follower joints
-                leader_action = self._map_joints(obs)
-
-                if self.loop_count == 0:
-                    logger.debug(
-                        "First frame: %d mapped joints from %d obs keys",
-                        len(leader_action),
-                        len(obs),
-                    )
+                if not self.tick():
+                    break
+                self.record_wake(ticker.wait())
 
-                # 4. Startup blend: ramp from follower's current position
-                if self._blend_start_time and leader_action:
-                    leader_action = self._apply_startup_blend(leader_action, obs)
+            logger.info("Teleop loop exited normally")
 
-                # 5. Send action to follower
-                if leader_action and self.robot:
-                    self._send_action(leader_action)
+        except Exception as e:
+            self.report_failure(e)
+        finally:
+            self.finish()
+            logger.info("Teleop loop cleanup complete")
 
-                # 6. Safety checks
-                if leader_action and self.robot:
-                    if not self._check_safety():
-                        break
+    def tick(self) -> bool:
+        """Run one control tick: read → assist → map → blend → send → telemetry → safety → FF.
 
-                    # 7. Force feedback
-                    if self.force_feedback_enabled and obs:
-                        self._apply_force_feedback(obs)
+        Does not wait; the caller owns the schedule.
 
-                # 8. Cache latest action for external consumers
-                if leader_action:
-                    with self._action_lock:
-                        self._latest_action = leader_action.copy()
+        Returns:
+            False if a safety check requires the loop to stop.
+        """
+        metrics = self.metrics
+        metrics.begin_tick()
+        layout = self._layout
+        self._last_work = None
+
+        # 1. Read leader state (dict → leader vector at the bus boundary)
+        if self.pipelined:
+            obs = self._take_leader()
+        else:
+            with self._leader_guard:
+                obs = self._read_leader()
+        if obs is None:
+            return True
+        layout.gather(obs, self._leader_vec, self._leader_valid)
+        metrics.lap(TickStage.LEADER_READ)
+
+        # 2. Apply leader assist (gravity comp, friction, haptics)
+        if self.leader_assists and self.assist_enabled:
+            with self._leader_guard:
+                self._apply_leader_assist()
+            metrics.lap(TickStage.ASSIST)
+
+        # 3. Map leader joints → follower joints
+        complete = self._map_joints()
+        has_action = complete or bool(self._follower_valid.any())
+        metrics.lap(TickStage.MAP)
+
+        if self.loop_count == 0:
+            logger.debug(
+                "First frame: %d mapped joints from %d obs keys",
+                int(np.count_nonzero(self._follower_valid)),
+                len(obs),
+            )
 
-                # 9. Performance logging (every 1s)
-                self.loop_count += 1
-                if self.loop_count % self.frequency == 0:
-                    now = time.time()
-                    real_hz = self.frequency / (now - perf_start)
-                    logger.info("Teleop rate: %.1fHz", real_hz)
-                    perf_start = now
+        # 4. Startup blend: ramp from follower's current position
+        if self._blend_start_time and has_action:
+            self._apply_startup_blend()
+            metrics.lap(TickStage.BLEND)
+        else:
+            metrics.skip()
+
+        # Predictive slowdown: only cover part of the step toward the target
+        if has_action:
+            if self._speed_scale < 1.0 and self._has_last_sent:
+                scratch = self._blend_scratch
+                np.subtract(self._follower_vec, self._last_sent_vec, out=scratch)
+                scratch *= self._speed_scale - 1.0
+                self._follower_vec += scratch
+            np.copyto(self._last_sent_vec, self._follower_vec)
+            self._has_last_sent = True
+
+        # Follower vector → action dict at the bus boundary
+        leader_action: dict[str, float] = {}
+        if has_action:
+            leader_action = layout.to_action(
+                self._follower_vec, None if complete else self._follower_valid
+            )
 
-                # 10. Sleep for remaining frame time
-                elapsed = time.perf_counter() - loop_start
-                precise_sleep(self.dt - elapsed)
+        # 5. Send action to follower
+        if leader_action and self.robot:
+            if self.pipelined:
+                self._action_box.publish(leader_action, self._leader_sample_time)
+            else:
+                with self._follower_guard:
+                    self._send_action(leader_action)
+            metrics.lap(TickStage.SEND)
+
+        if leader_action and self.robot:
+            # 6. Read follower telemetry once for every consumer this tick
+            snapshot: TelemetrySnapshot | None = None
+            if self.telemetry_enabled or self.joint_mapper.has_damiao_follower:
+                snapshot = self._read_telemetry(obs)
+                metrics.lap(TickStage.TELEMETRY)
+
+            # 7. Safety checks (hard limits, then torque trend)
+            if not self._check_safety(snapshot):
+                return False
+            if snapshot is not None and snapshot.torques and self.predictive_safety:
+                self._update_torque_trend(snapshot)
+            metrics.lap(TickStage.SAFETY)
+
+            # 8. Force feedback
+            if self.force_feedback_enabled and obs:
+                self._apply_force_feedback(obs, snapshot)
+                metrics.lap(TickStage.FORCE_FEEDBACK)
+
+        # 9. Publish latest action for external consumers (fresh dict per tick)
+        if leader_action:
+            with self._action_lock:
+                self._latest_action = leader_action
+
+        # 10. Commit stage timings; log window stats (every 1s)
+        self.loop_count += 1
+        self._last_work = metrics.end_tick()
+        window = metrics.roll_window()
+        if window is not None:
+            logger.info(
+                "Teleop rate: %.1fHz (worst tick %.2fms, %d overruns)",
+                window["rate_hz"],
+                window["worst_tick_ms"],
+                window["overruns"],
+            )
+        return True
 
-            logger.info("Teleop loop exited normally")
+    def record_wake(self, lateness: float) -> None:
+        """Record the scheduler's wake-up error after a completed tick.
 
-        except OSError as e:
-            if e.errno == 5:
-                logger.error("Hardware disconnected: %s", e)
+        Ticks that overran are excluded; their lateness is the overrun,
+        not sleep error.
+        """
+        if self._last_work is not None and self._last_work <= self.dt:
+            self.metrics.record_sleep_error(lateness)
+
+    def report_failure(self, error: Exception) -> None:
+        """Log an exception that terminated the loop."""
+        if isinstance(error, OSError):
+            if error.errno == 5:
+                logger.error("Hardware disconnected: %s", error)
             else:
-                logger.error("OSError in teleop loop: %s", e)
-        except Exception as e:
-            logger.error("Teleop loop failed: %s", e, exc_info=True)
-        finally:
-            self.is_running = False
-            logger.info("Teleop loop cleanup complete")
+                logger.error("OSError in teleop loop: %s", error)
+        else:
+            logger.error("Teleop loop failed: %s", error, exc_info=True)
+
+    def finish(self) -> None:
+        """Mark the loop stopped and wake the follower I/O thread."""
+        self.is_running = False
+        self._action_box.wake()
+        if self.safety_monitor:
+            self.safety_monitor.stop()
+
+    # ── Pipelined I/O ──────────────────────────────────────────────
+
+    def _leader_io_loop(self) -> None:
+        """Read the leader at io_frequency and publish to the leader mailbox."""
+        ticker = RateTicker(self.io_frequency)
+        ticker.start()
+        read_hist = self._pipeline_hists["leader_read"]
+        while self.is_running:
+            read_start = time.perf_counter()
+            with self._leader_guard:
+                obs = self._read_leader()
+            if obs is not None:
+                self._leader_box.publish(obs, read_start)
+            read_hist.record(time.perf_counter() - read_start)
+            ticker.wait()
+
+    def _follower_io_loop(self) -> None:
+        """Send each new action from the action mailbox to the follower."""
+        write_hist = self._pipeline_hists["follower_write"]
+        e2e_hist = self._pipeline_hists["end_to_end"]
+        seq = 0
+        while self.is_running:
+            envelope = self._action_box.wait_newer(seq, timeout=0.1)
+            if envelope is None or envelope.value is None:
+                continue
+            seq = envelope.seq
+            write_start = time.perf_counter()
+            with self._follower_guard:
+                self._send_action(envelope.value)
+            done = time.perf_counter()
+            write_hist.record(done - write_start)
+            e2e_hist.record(done - envelope.timestamp)
+
+    def _take_leader(self) -> dict[str, float] | None:
+        """Return the newest leader sample from the mailbox, or None if stale."""
+        envelope = self._leader_box.latest()
+        if envelope.value is None:
+            return None
+        age = time.perf_counter() - envelope.timestamp
+        self._pipeline_hists["leader_age"].record(age)
+        if age > self.max_leader_age:
+            if self.loop_count % 60 == 0:
+                logger.warning("Leader sample stale (%.0fms) — holding follower", age * 1e3)
+            return None
+        self._leader_sample_time = envelope.timestamp
+        return envelope.value
 
     # ── Leader Read ────────────────────────────────────────────────
 
@@ -248,59 +557,94 @@ class TeleopLoop:
 
         return None
 
-    # ── Joint Mapping ──────────────────────────────────────────────
-
-    def _map_joints(self, obs: dict[str, float]) -> dict[str, float]:
-        """Map leader observation to follower action using JointMapper.
+    # ── Joint Layout ───────────────────────────────────────────────
 
-        Args:
-            obs: Leader observation dict.
+    def _compile_layout(self) -> None:
+        """Compile the joint mapper and (re)allocate per-tick vectors.
 
-        Returns:
-            Follower action dict {follower_key: converted_value}.
+        Called on start and again once delta-tracking start state has been
+        captured, so the hot path never touches mapping dicts.
         """
-        action: dict[str, float] = {}
-        mapper = self.joint_mapper
+        extra_keys = [
+            f"{name}.pos" for joint_names in self.assist_groups.values() for name in joint_names
+        ]
+        layout = self.joint_mapper.compile(
+            extra_leader_keys=extra_keys,
+            leader_start_rad=self._leader_start_rad,
+            follower_start_pos=self._follower_start_pos,
+            rad_to_percent_scale=self._rad_to_percent_scale,
+        )
+        previous = self._layout
+        self._layout = layout
+        if previous is not None and previous.leader_keys == layout.leader_keys:
+            return
 
-        for l_key, f_key in mapper.joint_mapping.items():
-            if l_key in obs:
-                action[f_key] = mapper.convert_value(
-                    value=obs[l_key],
-                    follower_key=f_key,
-                    leader_key=l_key,
-                    leader_start_rad=self._leader_start_rad,
-                    follower_start_pos=self._follower_start_pos,
-                    rad_to_percent_scale=self._rad_to_percent_scale,
-                )
+        n_leader, n_follower = layout.num_leader, layout.num_follower
+        self._leader_vec = np.zeros(n_leader)
+        self._leader_valid = np.zeros(n_leader, dtype=bool)
+        self._follower_vec = np.zeros(n_follower)
+        self._follower_valid = np.zeros(n_follower, dtype=bool)
+        self._blend_start_vec = np.zeros(n_follower)
+        self._blend_start_mask = np.zeros(n_follower)
+        self._blend_scratch = np.zeros(n_follower)
+        self._last_sent_vec = np.zeros(n_follower)
+        self._has_last_sent = False
+
+        self._assist_slices = []
+        group_indices: list[np.ndarray] = []
+        offset = 0
+        for arm_key, joint_names in self.assist_groups.items():
+            if arm_key not in self.leader_assists or not joint_names:
+                continue
+            idx = layout.leader_indices([f"{name}.pos" for name in joint_names])
+            if idx is None:
+                continue
+            self._assist_slices.append((arm_key, slice(offset, offset + idx.size)))
+            group_indices.append(idx)
+            offset += idx.size
+        self._assist_index = (
+            np.concatenate(group_indices) if group_indices else np.zeros(0, dtype=np.intp)
+        )
+        self._assist_starts = np.array([sl.start for _, sl in self._assist_slices], dtype=np.intp)
+        self._assist_lengths = np.array([len(idx) for idx in group_indices], dtype=np.intp)
+        self._assist_last = np.zeros(offset)
+        self._assist_vel = np.zeros(offset)
+        self._assist_has_last = np.zeros(offset, dtype=bool)
+
+    # ── Joint Mapping ──────────────────────────────────────────────
 
-        return action
+    def _map_joints(self) -> bool:
+        """Map the leader vector into the follower vector.
+
+        Returns:
+            True if every mapped leader joint was present this tick.
+        """
+        layout = self._layout
+        layout.apply(self._leader_vec, self._follower_vec)
+        np.take(self._leader_valid, layout.source_index, out=self._follower_valid)
+        return bool(self._follower_valid.all())
 
     # ── Startup Blend ──────────────────────────────────────────────
 
-    def _apply_startup_blend(
-        self,
-        leader_action: dict[str, float],
-        obs: dict[str, float],
-    ) -> dict[str, float]:
+    def _apply_startup_blend(self) -> None:
         """Ramp from follower's current position to leader target.
 
         Captures follower start position on first frame, then linearly
-        blends from start to leader target over blend_duration seconds.
-
-        Args:
-            leader_action: Mapped follower action dict.
-            obs: Raw leader observation (for delta-tracking capture).
-
-        Returns:
-            Blended action dict.
+        blends the follower vector in place from start to leader target
+        over blend_duration seconds.
         """
         mapper = self.joint_mapper
+        layout = self._layout
+        captured = False
 
         # First frame: capture leader start positions for delta tracking
-        if not self._leader_start_rad and mapper.value_mode.value == "rad_to_percent" and obs:
+        if not self._leader_start_rad and mapper.value_mode.value == "rad_to_percent":
             self._leader_start_rad = {
-                l_key: obs[l_key] for l_key in mapper.joint_mapping if l_key in obs
+                l_key: float(self._leader_vec[i])
+                for i, l_key in enumerate(layout.leader_keys[: layout.num_follower])
+                if self._leader_valid[i]
             }
+            captured = bool(self._leader_start_rad)
             logger.info(
                 "Delta tracking: captured %d leader start positions",
                 len(self._leader_start_rad),
@@ -309,7 +653,8 @@ class TeleopLoop:
         # First frame: capture follower's actual position
         if not self._follower_start_pos and self.robot:
             try:
-                fobs = self.robot.get_observation()
+                with self._follower_guard:
+                    fobs = self.robot.get_observation()
                 self._follower_start_pos = {k: v for k, v in fobs.items() if k.endswith(".pos")}
                 logger.info(
                     "Startup blend: captured %d follower positions",
@@ -325,6 +670,11 @@ class TeleopLoop:
                         "Startup blend: using bus fallback (%d joints)",
                         len(self._follower_start_pos),
                     )
+            for i, f_key in enumerate(layout.follower_keys):
+                start = self._follower_start_pos.get(f_key)
+                self._blend_start_mask[i] = start is not None
+                self._blend_start_vec[i] = start if start is not None else 0.0
+            captured = captured or bool(self._follower_start_pos)
 
         # Compute per-joint rad→percent scale factors from follower calibration
         if (
@@ -346,28 +696,29 @@ class TeleopLoop:
                 "Per-joint scales: %s",
                 {k: f"{v:.1f}" for k, v in self._rad_to_percent_scale.items()},
             )
+            captured = True
+
+        # Start state feeds the delta-tracking offsets — recompile from next tick
+        if captured and mapper.value_mode.value == "rad_to_percent":
+            self._compile_layout()
 
         # Compute blend alpha
         elapsed = time.time() - self._blend_start_time
         alpha = min(1.0, elapsed / self._blend_duration)
 
         if alpha < 1.0 and self._follower_start_pos:
-            blended = {}
-            for key, target in leader_action.items():
-                if key in self._follower_start_pos:
-                    start = self._follower_start_pos[key]
-                    blended[key] = start + alpha * (target - start)
-                else:
-                    blended[key] = target
-            return blended
+            # target += (alpha - 1) * (target - start), only where a start exists
+            scratch = self._blend_scratch
+            np.subtract(self._follower_vec, self._blend_start_vec, out=scratch)
+            scratch *= (alpha - 1.0) * self._blend_start_mask
+            self._follower_vec += scratch
+            return
 
         # Blend complete — clear blend state
         if alpha >= 1.0 and self._blend_start_time:
             self._blend_start_time = None
             logger.info("Startup blend complete")
 
-        return leader_action
-
     # ── Send Action ────────────────────────────────────────────────
 
     def _send_action(self, action: dict[str, float]) -> None:
@@ -382,14 +733,40 @@ class TeleopLoop:
             if self.loop_count % 60 == 0:
                 logger.error("Send action failed: %s", e)
 
+    # ── Telemetry ──────────────────────────────────────────────────
+
+    def _read_telemetry(self, obs: dict[str, float]) -> TelemetrySnapshot | None:
+        """Read follower telemetry once and publish it for other consumers.
+
+        Args:
+            obs: Leader observation of this tick, attached to the snapshot.
+
+        Returns:
+            The new snapshot, or None if the read failed.
+        """
+        try:
+            with self._follower_guard:
+                snapshot = self._telemetry_reader.read(obs)
+        except Exception as e:
+            if self.loop_count % 60 == 0:
+                logger.warning("Telemetry read failed: %s", e)
+            return None
+        self._telemetry_box.publish(snapshot, snapshot.timestamp)
+        return snapshot
+
     # ── Safety ─────────────────────────────────────────────────────
 
-    def _check_safety(self) -> bool:
+    def _check_safety(self, snapshot: TelemetrySnapshot | None = None) -> bool:
         """Run safety checks. Returns False if loop should stop.
 
         Checks:
         - CAN bus death (every frame)
-        - Damiao torque limits (every 6th frame ≈ 10Hz)
+        - Safety monitor violation, if a monitor thread is attached
+        - Otherwise Damiao torque limits (every 6th frame ≈ 10Hz), from the
+          tick's telemetry snapshot when one was read
+
+        Args:
+            snapshot: This tick's follower telemetry, if read.
         """
         # CAN bus death detection
         if hasattr(self.robot, "bus") and getattr(self.robot.bus, "_can_bus_dead", False):
@@ -397,10 +774,29 @@ class TeleopLoop:
             self.is_running = False
             return False
 
+        # Monitor thread samples limits off-tick; just poll its mailbox
+        if self.safety_monitor:
+            violation = self.safety_monitor.violation
+            if violation is None:
+                return True
+            logger.error("Safety limit exceeded (%s) — emergency stop", violation.describe())
+            self.is_running = False
+            try:
+                with self._follower_guard:
+                    self.safety.emergency_stop(self.robot)
+            except SafetyError:
+                pass  # Expected: emergency_stop always raises after disconnecting
+            return False
+
         # Damiao torque limits (every 6th frame to keep within frame budget)
         if self.joint_mapper.has_damiao_follower and self.loop_count % 6 == 3:
             try:
-                if not self.safety.check_damiao_limits(self.robot):
+                if snapshot is not None:
+                    safe = self.safety.check_damiao_limits(self.robot, torques=snapshot.torques)
+                else:
+                    with self._follower_guard:
+                        safe = self.safety.check_damiao_limits(self.robot)
+                if not safe:
                     logger.error("Damiao torque limit exceeded — emergency stop")
                     self.is_running = False
                     return False
@@ -410,27 +806,47 @@ class TeleopLoop:
 
         return True
 
+    def _update_torque_trend(self, snapshot: TelemetrySnapshot) -> None:
+        """Feed the tick's torques to the trend predictor; set the speed scale."""
+        trend = self.torque_trend
+        if trend is None:
+            names = list(snapshot.torques)
+            try:
+                limits = self.robot.get_torque_limits()
+            except Exception as e:
+                logger.warning("Torque trend disabled — no torque limits: %s", e)
+                self.predictive_safety = False
+                return
+            trend = TorqueTrendPredictor(names, np.array([limits.get(n, 10.0) for n in names]))
+            self.torque_trend = trend
+
+        torques = np.array([snapshot.torques.get(n, 0.0) for n in trend.names])
+        self._speed_scale = trend.update(snapshot.timestamp, torques)
+
     # ── Force Feedback ─────────────────────────────────────────────
 
-    def _apply_force_feedback(self, obs: dict[str, float]) -> None:
+    def _apply_force_feedback(
+        self, obs: dict[str, float], snapshot: TelemetrySnapshot | None
+    ) -> None:
         """Apply gripper and joint force feedback to the leader arm.
 
         Args:
             obs: Leader observation dict (for joint positions).
+            snapshot: This tick's follower telemetry (torques, positions).
         """
         if not self.joint_mapper.has_damiao_follower:
             return
-        if not self.leader or self.loop_count == 0:
+        if not self.leader or self.loop_count == 0 or snapshot is None:
             return
 
         # Gripper force feedback
         if self.gripper_ff:
             try:
-                torques = self.robot.get_torques()
-                raw_torque = torques.get("gripper", 0.0)
+                raw_torque = snapshot.torques.get("gripper", 0.0)
                 goal_current = self.gripper_ff.update(raw_torque)
 
-                self.leader.bus.write("Goal_Current", "gripper", goal_current, normalize=False)
+                with self._leader_guard:
+                    self.leader.bus.write("Goal_Current", "gripper", goal_current, normalize=False)
 
                 if self.loop_count % 60 == 0:
                     logger.debug(
@@ -446,8 +862,7 @@ class TeleopLoop:
         # Joint force feedback (virtual spring)
         if self.joint_ff and self.joint_ff_enabled:
             try:
-                cached = self.robot.get_cached_positions()
-                follower_pos = cached.get("link3")
+                follower_pos = snapshot.positions.get("link3.pos")
                 leader_pos = obs.get("joint_4.pos")
 
                 if follower_pos is not None and leader_pos is not None:
@@ -459,10 +874,13 @@ class TeleopLoop:
                         leader_pos, follower_pos, homing_offset
                     )
 
-                    self.leader.bus.write(
-                        "Goal_Position", "joint_4", int(raw_ticks), normalize=False
-                    )
-                    self.leader.bus.write("Goal_Current", "joint_4", goal_current, normalize=False)
+                    with self._leader_guard:
+                        self.leader.bus.write(
+                            "Goal_Position", "joint_4", int(raw_ticks), normalize=False
+                        )
+                        self.leader.bus.write(
+                            "Goal_Current", "joint_4", goal_current, normalize=False
+                        )
 
                     if self.loop_count % 60 == 0:
                         logger.debug(
@@ -478,66 +896,85 @@ class TeleopLoop:
 
     # ── Leader Assist ──────────────────────────────────────────────
 
-    def _apply_leader_assist(self, obs: dict[str, float]) -> None:
+    def _apply_leader_assist(self) -> None:
         """Apply gravity compensation and friction assist to leader arm.
 
-        Iterates over pre-computed assist groups, estimates velocity via
-        EMA filtering, and writes PWM values to the leader bus.
-
-        Args:
-            obs: Leader observation dict.
+        Gathers every assist group's joints into one vector, updates the
+        EMA velocity estimate for all of them at once, then computes and
+        writes PWM per group (one weight-matrix product per arm).
         """
-        for arm_key, joint_names in self.assist_groups.items():
-            service = self.leader_assists.get(arm_key)
-            if not service:
-                continue
-
-            positions: list[float] = []
-            velocities: list[float] = []
-            valid = True
-
-            for fullname in joint_names:
-                pos_key = f"{fullname}.pos"
-                if pos_key not in obs:
-                    valid = False
-                    break
-
-                deg = obs[pos_key]
-                positions.append(deg)
-
-                # EMA velocity estimate
-                raw_vel = 0.0
-                if fullname in self._last_leader_pos:
-                    delta = deg - self._last_leader_pos[fullname]
-                    raw_vel = delta / self.dt
-
-                prev_vel = self._leader_vel_filtered.get(fullname, 0.0)
-                filtered_vel = self._alpha_vel * raw_vel + (1 - self._alpha_vel) * prev_vel
-                self._leader_vel_filtered[fullname] = filtered_vel
-                velocities.append(filtered_vel)
-                self._last_leader_pos[fullname] = deg
+        if not self._assist_slices:
+            return
 
-            if not valid:
+        positions = self._leader_vec[self._assist_index]
+        # A group with any missing joint is skipped this tick (state untouched)
+        group_ok = np.logical_and.reduceat(
+            self._leader_valid[self._assist_index], self._assist_starts
+        )
+        joint_ok = np.repeat(group_ok, self._assist_lengths)
+
+        # EMA velocity estimate (zero raw velocity on a joint's first sample)
+        alpha = self._alpha_vel
+        raw_vel = (positions - self._assist_last) / self.dt
+        raw_vel *= self._assist_has_last
+        velocities = alpha * raw_vel + (1 - alpha) * self._assist_vel
+        np.copyto(self._assist_vel, velocities, where=joint_ok)
+        np.copyto(self._assist_last, positions, where=joint_ok)
+        self._assist_has_last |= joint_ok
+
+        for (arm_key, sl), ok in zip(self._assist_slices, group_ok, strict=True):
+            if not ok:
                 continue
-
             try:
-                # Compute haptic forces from follower loads
-                haptic_forces: dict[str, float] = {}
-                # (Haptics require follower gravity models — skipped in v2 MVP)
-
-                pwm_dict = service.compute_assist_torque(
-                    joint_names,
-                    positions,
-                    velocities,
-                    follower_torques=haptic_forces,
+                # Haptics require follower gravity models — skipped in v2 MVP
+                pwm = self.leader_assists[arm_key].compute_assist_pwm(
+                    positions[sl], self._assist_vel[sl]
                 )
+                names = self.assist_groups[arm_key]
+                self._write_leader_pwm(arm_key, dict(zip(names, pwm.tolist(), strict=True)))
 
-                if pwm_dict:
-                    self._write_leader_pwm(arm_key, pwm_dict)
+                if (
+                    self.leader_assists[arm_key].online_learning
+                    and self.loop_count % self.assist_sample_interval == 0
+                ):
+                    self._sample_gravity(arm_key, names, positions[sl], self._assist_vel[sl], pwm)
 
             except Exception as e:
                 logger.error("Leader assist error (%s): %s", arm_key, e)
 
+    def _sample_gravity(
+        self,
+        arm_key: str,
+        joint_names: list[str],
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        commanded: np.ndarray,
+    ) -> None:
+        """Feed an at-rest effort sample to the group's online gravity model.
+
+        Only samples where every joint is below the velocity deadband are
+        used: at rest the holding effort is the gravity torque. The effort
+        register and its units come from the leader's motor type, and the
+        assist PWM commanded this tick is subtracted by the service.
+        """
+        service = self.leader_assists[arm_key]
+        register = service.effort_register
+        if register is None or np.abs(velocities).max() > service.vel_deadband:
+            return
+        bus, prefix = self._leader_arm_bus(arm_key)
+        motors = [name.removeprefix(prefix) for name in joint_names]
+        raw = bus.sync_read(register.name, motors, normalize=False)
+        effort = np.array([register.to_pwm(int(raw[motor])) for motor in motors])
+        service.observe_effort(positions, effort, commanded)
+
+    def _leader_arm_bus(self, arm_key: str) -> tuple[Any, str]:
+        """Return the leader bus for ``arm_key`` and its joint-name prefix."""
+        if arm_key == "left" and hasattr(self.leader, "left_arm"):
+            return self.leader.left_arm.bus, "left_"
+        if arm_key == "right" and hasattr(self.leader, "right_arm"):
+            return self.leader.right_arm.bus, "right_"
+        return self.leader.bus, ""
+
     def _write_leader_pwm(self, arm_key: str, pwm_dict: dict[str, int]) -> None:
         """Write PWM values to the leader arm bus.
 
@@ -548,11 +985,7 @@ class TeleopLoop:
             arm_key: Arm identifier ("left", "right", or "default").
             pwm_dict: Joint name -> PWM value mapping.
         """
-        if arm_key == "left" and hasattr(self.leader, "left_arm"):
-            local_pwm = {k.replace("left_", ""): v for k, v in pwm_dict.items()}
-            self.leader.left_arm.bus.write_pwm(local_pwm)
-        elif arm_key == "right" and hasattr(self.leader, "right_arm"):
-            local_pwm = {k.replace("right_", ""): v for k, v in pwm_dict.items()}
-            self.leader.right_arm.bus.write_pwm(local_pwm)
-        else:
-            self.leader.bus.write_pwm(pwm_dict)
+        bus, prefix = self._leader_arm_bus(arm_key)
+        if prefix:
+            pwm_dict = {k.replace(prefix, ""): v for k, v in pwm_dict.items()}
+        bus.write_pwm(pwm_dict)
@@ -0,0 +1,150 @@
+"""Drift-free fixed-rate scheduling for control loops.
+
+RateTicker schedules ticks against absolute monotonic deadlines
+(``origin + n * period``) rather than sleeping ``period - elapsed`` after
+each tick, so an overrun never shifts later ticks. Waiting is hybrid: the
+thread sleeps until shortly before the deadline, then spins for the last
+stretch to land within microseconds of it.
+"""
+
+from __future__ import annotations
+
+import enum
+import logging
+import threading
+import time
+
+from nextis.control.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class OverrunPolicy(str, enum.Enum):  # noqa: UP042
+    """What to do when a tick finishes after the next deadline."""
+
+    SKIP = "skip"  # Drop missed deadlines, realign to the next one in the future
+    CATCH_UP = "catch_up"  # Run missed ticks back to back (bounded by max_catch_up)
+
+
+class RateTicker:
+    """Absolute-deadline ticker with hybrid sleep-then-spin waiting.
+
+    Typical use::
+
+        ticker = RateTicker(60.0)
+        ticker.start()
+        while running:
+            do_work()
+            ticker.wait()
+
+    Args:
+        frequency: Tick rate (Hz).
+        policy: Overrun handling policy.
+        spin_threshold: Final stretch before a deadline (seconds) that is
+            busy-waited instead of slept. 0 disables spinning.
+        max_catch_up: Under CATCH_UP, the most missed ticks that will be run
+            back to back before the ticker resynchronizes.
+    """
+
+    def __init__(
+        self,
+        frequency: float,
+        policy: OverrunPolicy = OverrunPolicy.SKIP,
+        spin_threshold: float = 0.001,
+        max_catch_up: int = 3,
+    ) -> None:
+        if frequency <= 0:
+            raise ValueError(f"Ticker frequency must be positive, got {frequency}")
+        self.frequency = frequency
+        self.period = 1.0 / frequency
+        self.policy = policy
+        self.spin_threshold = spin_threshold
+        self.max_catch_up = max_catch_up
+
+        self._lock = threading.Lock()
+        self._jitter = LatencyHistogram(max_seconds=1.0)
+        self._origin: float = 0.0
+        self._tick_index: int = 0
+        self._deadline: float = 0.0
+        self.last_lateness: float = 0.0
+        self.ticks: int = 0
+        self.overruns: int = 0
+        self.skipped: int = 0
+
+    @property
+    def deadline(self) -> float:
+        """Absolute ``time.perf_counter()`` time of the next tick."""
+        return self._deadline
+
+    def start(self) -> None:
+        """Anchor the schedule at now and clear statistics."""
+        with self._lock:
+            self._jitter.reset()
+            self.ticks = 0
+            self.overruns = 0
+            self.skipped = 0
+            self.last_lateness = 0.0
+        self._origin = time.perf_counter()
+        self._tick_index = 1
+        self._deadline = self._origin + self.period
+
+    def wait(self) -> float:
+        """Block until the next deadline and advance the schedule.
+
+        Returns:
+            Lateness of this wake-up: seconds between the deadline and the
+            actual return (includes the overrun if work ran past it).
+        """
+        if self._tick_index == 0:
+            self.start()
+
+        deadline = self._deadline
+        now = time.perf_counter()
+        overrun = now > deadline
+        if not overrun:
+            self._sleep_until(deadline)
+            now = time.perf_counter()
+        lateness = now - deadline
+
+        skipped = 0
+        if overrun:
+            # Grid deadlines after this one that have already passed
+            behind = int(lateness // self.period)
+            if self.policy == OverrunPolicy.SKIP or behind >= self.max_catch_up:
+                # Realign to the first deadline strictly in the future
+                skipped = behind
+            # CATCH_UP within budget: keep the grid, next deadline may already be due
+        self._tick_index += 1 + skipped
+        self._deadline = self._origin + self._tick_index * self.period
+
+        with self._lock:
+            self.ticks += 1
+            self.last_lateness = lateness
+            self._jitter.record(lateness)
+            if overrun:
+                self.overruns += 1
+                self.skipped += skipped
+        return lateness
+
+    def _sleep_until(self, deadline: float) -> None:
+        """Sleep until ``spin_threshold`` before ``deadline``, then spin."""
+        remaining = deadline - time.perf_counter() - self.spin_threshold
+        if remaining > 0:
+            time.sleep(remaining)
+        while time.perf_counter() < deadline:
+            pass
+
+    def stats(self) -> dict[str, float | int]:
+        """Return wake-up jitter statistics and overrun counters."""
+        with self._lock:
+            summary = self._jitter.summary()
+            return {
+                "frequency_hz": self.frequency,
+                "ticks": self.ticks,
+                "overruns": self.overruns,
+                "skipped": self.skipped,
+                "jitter_mean_ms": summary["mean_ms"],
+                "jitter_p50_ms": summary["p50_ms"],
+                "jitter_p99_ms": summary["p99_ms"],
+                "jitter_max_ms": summary["max_ms"],
+            }
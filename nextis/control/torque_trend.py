@@ -0,0 +1,139 @@
+"""Predictive torque-trend safety for the follower arm.
+
+The hard safety layer only reacts once torque has been over its limit for
+several samples, and then disconnects the robot. TorqueTrendPredictor looks
+ahead instead: it keeps a short ring buffer of per-joint torque, fits a
+least-squares slope to each joint, and extrapolates the time until |torque|
+reaches its limit. When that time drops below a horizon the control loop
+slows the follower down, often enough to stay clear of the E-stop.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class TorqueTrendPredictor:
+    """Ring-buffered torque slope fit with time-to-limit speed scaling.
+
+    Args:
+        names: Motor names, in the order torques are passed to :meth:`update`.
+        limits: Per-motor torque limits (Nm), same order.
+        window: Number of samples in the slope fit.
+        horizon: Time-to-limit (seconds) at which slowdown starts. The speed
+            scale is ``time_to_limit / horizon``, clamped to ``[min_scale, 1]``.
+        min_scale: Slowest allowed speed scale (the E-stop remains the
+            backstop beyond this).
+        recovery_rate: Maximum increase of the speed scale per update, so
+            the follower ramps back up instead of jumping to the target.
+        min_samples: Samples required before a slope is trusted.
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        limits: np.ndarray,
+        window: int = 12,
+        horizon: float = 0.3,
+        min_scale: float = 0.2,
+        recovery_rate: float = 0.05,
+        min_samples: int = 4,
+    ) -> None:
+        self.names = list(names)
+        self.limits = np.asarray(limits, dtype=float)
+        self.window = window
+        self.horizon = horizon
+        self.min_scale = min_scale
+        self.recovery_rate = recovery_rate
+        self.min_samples = max(2, min(min_samples, window))
+
+        n = len(self.names)
+        self._times = np.zeros(window)
+        self._torques = np.zeros((window, n))
+        self._index = 0
+        self._count = 0
+
+        self.scale: float = 1.0
+        self.time_to_limit = np.full(n, np.inf)
+        self.slowdowns: int = 0
+        self.min_scale_seen: float = 1.0
+
+    def reset(self) -> None:
+        """Clear the buffer and restore full speed."""
+        self._index = 0
+        self._count = 0
+        self.scale = 1.0
+        self.time_to_limit[:] = np.inf
+        self.slowdowns = 0
+        self.min_scale_seen = 1.0
+
+    def update(self, timestamp: float, torques: np.ndarray) -> float:
+        """Add one torque sample and return the speed scale to apply.
+
+        Args:
+            timestamp: Sample time (seconds, monotonic).
+            torques: Per-motor torque (Nm), in ``names`` order.
+
+        Returns:
+            Speed scale in ``[min_scale, 1]``.
+        """
+        i = self._index
+        self._times[i] = timestamp
+        self._torques[i] = torques
+        self._index = (i + 1) % self.window
+        self._count = min(self._count + 1, self.window)
+
+        n = self._count
+        if n < self.min_samples:
+            return self.scale
+
+        # Least-squares slope for every joint at once. Sample order does not
+        # matter, so the ring buffer is used as-is; with centred times the
+        # fit reduces to one vector-matrix product.
+        times = self._times[:n]
+        tc = times - times.mean()
+        denom = tc @ tc
+        if denom <= 0.0:
+            return self.scale
+        slope = (tc @ self._torques[:n]) / denom
+
+        torques = np.asarray(torques, dtype=float)
+        headroom = self.limits - np.abs(torques)
+        rate = slope * np.sign(torques)  # d|torque|/dt
+        ttl = self.time_to_limit
+        np.divide(headroom, rate, out=ttl, where=rate > 0.0)
+        ttl[rate <= 0.0] = np.inf
+        ttl[headroom <= 0.0] = 0.0
+
+        target = float(np.clip(ttl.min() / self.horizon, self.min_scale, 1.0))
+        previous = self.scale
+        if target < previous:
+            self.scale = target
+        else:
+            self.scale = min(target, previous + self.recovery_rate)
+
+        if self.scale < 1.0 <= previous:
+            self.slowdowns += 1
+            joint = int(np.argmin(ttl))
+            logger.warning(
+                "Torque trend: %s reaches limit in %.0fms — slowing follower to %.0f%%",
+                self.names[joint],
+                ttl[joint] * 1e3,
+                self.scale * 100,
+            )
+        self.min_scale_seen = min(self.min_scale_seen, self.scale)
+        return self.scale
+
+    def stats(self) -> dict[str, float | int]:
+        """Current scale, nearest time-to-limit and slowdown counters."""
+        nearest = float(self.time_to_limit.min()) if self.time_to_limit.size else float("inf")
+        return {
+            "speed_scale": round(self.scale, 4),
+            "min_speed_scale": round(self.min_scale_seen, 4),
+            "time_to_limit_ms": round(nearest * 1e3, 1) if np.isfinite(nearest) else -1.0,
+            "slowdowns": self.slowdowns,
+        }
@@ -9,12 +9,19 @@ from __future__ import annotations
 
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from nextis.hardware.connection import create_arm_instance
+from nextis.hardware.bus_stats import BusStats, instrument_arm
+from nextis.hardware.connection import (
+    create_arm_instance,
+    read_torque,
+    reconnect_arm_instance,
+    set_torque,
+)
 from nextis.hardware.types import (
     ArmDefinition,
     ArmRole,
@@ -48,6 +55,12 @@ class ArmRegistryService:
         self.pairings: list[Pairing] = []
         self.arm_instances: dict[str, Any] = {}
         self.arm_status: dict[str, ConnectionStatus] = {}
+        self.bus_stats: dict[str, dict[str, BusStats]] = {}
+        # Disconnected instances kept for warm reconnect:
+        # arm_id -> (port, instance, per-bus torque state when parked)
+        self._warm: dict[str, tuple[str, Any, list[dict[str, int] | None] | None]] = {}
+        # Per-arm bus locks shared by the teleop loop and the diagnostics sampler
+        self._bus_locks: dict[str, threading.Lock] = {}
         self._lock = threading.Lock()
         self._config_data: dict = {}
 
@@ -191,6 +204,25 @@ class ArmRegistryService:
         arm_dict["status"] = self.arm_status.get(arm_id, ConnectionStatus.DISCONNECTED).value
         return arm_dict
 
+    def get_bus_stats(self, arm_id: str) -> dict[str, dict] | None:
+        """Return traffic counters for each bus of a connected arm.
+
+        Returns None if the arm is unknown; an empty dict if it is not
+        connected or its buses could not be instrumented.
+        """
+        if arm_id not in self.arms:
+            return None
+        return {name: stats.snapshot() for name, stats in self.bus_stats.get(arm_id, {}).items()}
+
+    def bus_lock(self, arm_id: str) -> threading.Lock:
+        """Return the lock serializing access to an arm's bus.
+
+        The same lock is returned for the lifetime of the registry, so every
+        bus user of an arm (control loop, diagnostics sampler) shares it.
+        """
+        with self._lock:
+            return self._bus_locks.setdefault(arm_id, threading.Lock())
+
     def get_leaders(self) -> list[dict]:
         """Return all leader arms."""
         return [a for a in self.get_all_arms() if a["role"] == "leader"]
@@ -321,6 +353,8 @@ class ArmRegistryService:
         del self.arms[arm_id]
         del self.arm_status[arm_id]
         self.arm_instances.pop(arm_id, None)
+        self.bus_stats.pop(arm_id, None)
+        self.drop_warm(arm_id)
 
         self._save_config()
         return {"success": True}
@@ -328,25 +362,36 @@ class ArmRegistryService:
     # --- Connection Management ---
 
     def connect_arm(self, arm_id: str) -> dict:
-        """Connect a specific arm by creating the appropriate hardware instance."""
+        """Connect a specific arm by creating the appropriate hardware instance.
+
+        An instance kept from a warm disconnect on the same port is reused
+        (see :func:`reconnect_arm_instance`); a new one is created only if
+        there is none or reusing it fails.
+        """
         if arm_id not in self.arms:
             return {"success": False, "error": f"Arm '{arm_id}' not found"}
 
         arm = self.arms[arm_id]
         if not arm.enabled:
             return {"success": False, "error": f"Arm '{arm_id}' is disabled"}
+        if arm_id in self.arm_instances:
+            return {"success": True, "status": "connected"}
 
         self.arm_status[arm_id] = ConnectionStatus.CONNECTING
 
         try:
-            instance = create_arm_instance(arm)
+            instance = self._reuse_warm(arm)
+            warm = instance is not None
+            if instance is None:
+                instance = create_arm_instance(arm)
             if instance:
                 self.arm_instances[arm_id] = instance
+                self.bus_stats[arm_id] = instrument_arm(instance, arm)
                 self.arm_status[arm_id] = ConnectionStatus.CONNECTED
                 if hasattr(instance, "is_calibrated"):
                     arm.calibrated = instance.is_calibrated
-                logger.info("Connected arm: %s (%s)", arm.name, arm_id)
-                return {"success": True, "status": "connected"}
+                logger.info("Connected arm: %s (%s)%s", arm.name, arm_id, " [warm]" if warm else "")
+                return {"success": True, "status": "connected", "warm": warm}
             else:
                 self.arm_status[arm_id] = ConnectionStatus.ERROR
                 return {"success": False, "error": "Failed to create arm instance"}
@@ -355,24 +400,131 @@ class ArmRegistryService:
             logger.error("Failed to connect arm %s: %s", arm_id, e)
             return {"success": False, "error": str(e)}
 
-    def disconnect_arm(self, arm_id: str) -> dict:
-        """Disconnect a specific arm."""
+    def connect_many(
+        self, arm_ids: list[str] | None = None, max_workers: int | None = None
+    ) -> dict[str, dict]:
+        """Connect several arms in parallel, one worker thread per arm.
+
+        Arms are on separate ports, so their bus setup and calibration
+        reads overlap instead of running back to back.
+
+        Args:
+            arm_ids: Arms to connect. Defaults to every arm in a pairing.
+            max_workers: Thread pool size. Defaults to one per arm.
+
+        Returns:
+            Arm ID -> :meth:`connect_arm` result.
+        """
+        if arm_ids is None:
+            arm_ids = []
+            for p in self.pairings:
+                arm_ids.extend(a for a in (p.leader_id, p.follower_id) if a not in arm_ids)
+        if not arm_ids:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers or len(arm_ids), thread_name_prefix="arm-connect"
+        ) as pool:
+            futures = {arm_id: pool.submit(self.connect_arm, arm_id) for arm_id in arm_ids}
+            return {arm_id: f.result() for arm_id, f in futures.items()}
+
+    def disconnect_arm(self, arm_id: str, keep_warm: bool = False) -> dict:
+        """Disconnect a specific arm.
+
+        Args:
+            arm_id: Arm to disconnect.
+            keep_warm: Keep the instance for a fast reconnect. Its torque is
+                disabled with the port left open where the bus supports it;
+                otherwise it is disconnected but still kept.
+        """
         if arm_id not in self.arms:
             return {"success": False, "error": f"Arm '{arm_id}' not found"}
 
-        if arm_id in self.arm_instances:
-            try:
-                instance = self.arm_instances[arm_id]
-                if hasattr(instance, "disconnect"):
-                    instance.disconnect()
-                del self.arm_instances[arm_id]
-            except Exception as e:
-                logger.error("Error disconnecting arm %s: %s", arm_id, e)
+        instance = self.arm_instances.pop(arm_id, None)
+        if instance is not None:
+            if keep_warm:
+                self._park(arm_id, instance)
+            else:
+                self._close(arm_id, instance)
+        if not keep_warm:
+            self.drop_warm(arm_id)
+        self.bus_stats.pop(arm_id, None)
 
         self.arm_status[arm_id] = ConnectionStatus.DISCONNECTED
-        logger.info("Disconnected arm: %s", arm_id)
+        logger.info("Disconnected arm: %s%s", arm_id, " (kept warm)" if keep_warm else "")
         return {"success": True, "status": "disconnected"}
 
+    def disconnect_all(self) -> None:
+        """Disconnect every arm and close all warm instances."""
+        for arm_id in list(self.arm_instances):
+            self.disconnect_arm(arm_id)
+        for arm_id in list(self._warm):
+            self.drop_warm(arm_id)
+
+    def release_after_estop(self, instances: list[Any]) -> list[str]:
+        """Mark arms stopped by an E-stop as disconnected, keeping them warm.
+
+        The E-stop has already disconnected the instances; keeping them
+        lets the next connect reopen the port in place with the existing
+        calibration instead of rebuilding the arm.
+
+        Returns:
+            IDs of the arms released.
+        """
+        released: list[str] = []
+        for arm_id, instance in list(self.arm_instances.items()):
+            if any(instance is stopped for stopped in instances):
+                self.arm_instances.pop(arm_id, None)
+                self.bus_stats.pop(arm_id, None)
+                self._warm[arm_id] = (self.arms[arm_id].port, instance, None)
+                self.arm_status[arm_id] = ConnectionStatus.DISCONNECTED
+                released.append(arm_id)
+        return released
+
+    def drop_warm(self, arm_id: str) -> None:
+        """Close and forget the warm instance of an arm, if any."""
+        entry = self._warm.pop(arm_id, None)
+        if entry is not None:
+            self._close(arm_id, entry[1])
+
+    def _park(self, arm_id: str, instance: Any) -> None:
+        """Record torque state, disable torque (or disconnect), keep the instance warm."""
+        torque = None
+        with self.bus_lock(arm_id):
+            parked = getattr(instance, "is_connected", False)
+            if parked:
+                torque = read_torque(instance)
+                parked = set_torque(instance, enabled=False)
+        if not parked:
+            self._close(arm_id, instance)
+            torque = None
+        self._warm[arm_id] = (self.arms[arm_id].port, instance, torque)
+
+    def _reuse_warm(self, arm: ArmDefinition) -> Any | None:
+        """Return the arm's warm instance brought back online, or None."""
+        entry = self._warm.pop(arm.id, None)
+        if entry is None:
+            return None
+        port, instance, torque = entry
+        if port != arm.port:
+            self._close(arm.id, instance)
+            return None
+        try:
+            return reconnect_arm_instance(arm, instance, torque)
+        except Exception as e:
+            logger.warning("Warm reconnect of %s failed, reconnecting cold: %s", arm.id, e)
+            self._close(arm.id, instance)
+            return None
+
+    @staticmethod
+    def _close(arm_id: str, instance: Any) -> None:
+        """Disconnect an instance if it is still connected."""
+        if not getattr(instance, "is_connected", True) or not hasattr(instance, "disconnect"):
+            return
+        try:
+            instance.disconnect()
+        except Exception as e:
+            logger.error("Error disconnecting arm %s: %s", arm_id, e)
+
     # --- Persistence ---
 
     def _save_config(self) -> None:
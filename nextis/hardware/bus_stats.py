@@ -0,0 +1,379 @@
+"""Bus traffic counters and utilisation estimates for motor buses.
+
+Wraps the byte-level I/O of a connected arm's buses and counts what goes
+over the wire:
+
+- Damiao CAN: ``vendor/dm_can.MotorControl.serial_`` is replaced by an
+  :class:`InstrumentedTransport`; each bridge frame is one CAN frame.
+- Feetech / Dynamixel (lerobot ``MotorsBus``): the SDK ``port_handler``
+  and ``packet_handler`` methods are wrapped in place, so every sync read
+  and write is counted without touching lerobot.
+
+Bus load is the fraction of wall time the wire would be busy carrying the
+counted traffic: ``CAN_FRAME_BITS`` per CAN frame at the CAN bitrate, or
+10 bits per byte (8N1) at the serial baud rate. Round-trip latency is the
+time from a request to the first reply that follows it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from nextis.control.metrics import LatencyHistogram
+from nextis.hardware.can_transport import BRIDGE_RX_LENGTH, BRIDGE_TX_LENGTH, CAN_FRAME_BITS
+from nextis.hardware.types import ArmDefinition, MotorType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAN_BITRATE = 1_000_000
+SERIAL_BITS_PER_BYTE = 10  # start + 8 data + stop
+
+# Dynamixel / Feetech SDK communication results
+_COMM_SUCCESS = 0
+_COMM_RX_TIMEOUT = -3001
+_COMM_RX_CORRUPT = -3002
+
+
+class BusStats:
+    """Thread-safe traffic counters for one bus.
+
+    Either ``frame_bits`` (fixed-size frames, CAN) or ``byte_bits``
+    (byte stream, UART) sets how counted traffic converts to wire time.
+
+    Args:
+        kind: Bus kind reported in snapshots (``"can"`` or ``"serial"``).
+        bitrate: Wire bit rate (bits/s).
+        frame_bits: Wire bits per frame, or None to count bytes.
+        byte_bits: Wire bits per byte when ``frame_bits`` is None.
+        window: Reporting window (seconds) for the recent load and rates.
+        probe: Optional callable returning extra driver counters
+            (``parse_errors``, ``rx_pending_bytes``, ...) merged into snapshots.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        bitrate: int,
+        frame_bits: int | None = None,
+        byte_bits: int = SERIAL_BITS_PER_BYTE,
+        window: float = 1.0,
+        probe: Callable[[], dict[str, int]] | None = None,
+    ) -> None:
+        self.kind = kind
+        self.bitrate = bitrate
+        self.frame_bits = frame_bits
+        self.byte_bits = byte_bits
+        self.window = window
+        self.probe = probe
+        self._lock = threading.Lock()
+        self._rtt = LatencyHistogram(max_seconds=1.0)
+        self._request_at: float | None = None
+        self._started = time.perf_counter()
+
+        self.frames_tx: int = 0
+        self.frames_rx: int = 0
+        self.bytes_tx: int = 0
+        self.bytes_rx: int = 0
+        self.parse_errors: int = 0
+        self.timeouts: int = 0
+        self._wire_bits: int = 0
+
+        self._window_start = self._started
+        self._window_bits: int = 0
+        self._window_tx: int = 0
+        self._window_rx: int = 0
+        self.last_window: dict[str, float] = {
+            "load_pct": 0.0,
+            "frames_tx_per_s": 0.0,
+            "frames_rx_per_s": 0.0,
+        }
+
+    def _bits(self, frames: int, nbytes: int) -> int:
+        if self.frame_bits is not None:
+            return frames * self.frame_bits
+        return nbytes * self.byte_bits
+
+    def record_tx(self, frames: int, nbytes: int, request: bool = True) -> None:
+        """Count an outgoing write; a request starts a round-trip measurement."""
+        now = time.perf_counter()
+        bits = self._bits(frames, nbytes)
+        with self._lock:
+            self.frames_tx += frames
+            self.bytes_tx += nbytes
+            self._wire_bits += bits
+            self._window_bits += bits
+            self._window_tx += frames
+            if request and frames and self._request_at is None:
+                self._request_at = now
+            self._roll(now)
+
+    def record_rx(self, frames: int, nbytes: int, reply: bool = True) -> None:
+        """Count incoming data; a reply completes the pending round trip."""
+        now = time.perf_counter()
+        bits = self._bits(frames, nbytes)
+        with self._lock:
+            self.frames_rx += frames
+            self.bytes_rx += nbytes
+            self._wire_bits += bits
+            self._window_bits += bits
+            self._window_rx += frames
+            if reply and frames and self._request_at is not None:
+                self._rtt.record(now - self._request_at)
+                self._request_at = None
+            self._roll(now)
+
+    def record_error(self, timeout: bool = False) -> None:
+        """Count a malformed reply, or a reply that never came."""
+        with self._lock:
+            if timeout:
+                self.timeouts += 1
+                self._request_at = None
+            else:
+                self.parse_errors += 1
+
+    def _roll(self, now: float) -> None:
+        """Close the reporting window if it has elapsed (lock held)."""
+        elapsed = now - self._window_start
+        if elapsed < self.window:
+            return
+        self.last_window = {
+            "load_pct": round(100.0 * self._window_bits / self.bitrate / elapsed, 3),
+            "frames_tx_per_s": round(self._window_tx / elapsed, 2),
+            "frames_rx_per_s": round(self._window_rx / elapsed, 2),
+        }
+        self._window_start = now
+        self._window_bits = 0
+        self._window_tx = 0
+        self._window_rx = 0
+
+    def reset(self) -> None:
+        """Clear all counters and the latency histogram (probe counters are not reset)."""
+        with self._lock:
+            self._rtt.reset()
+            self._request_at = None
+            self.frames_tx = self.frames_rx = 0
+            self.bytes_tx = self.bytes_rx = 0
+            self.parse_errors = self.timeouts = 0
+            self._wire_bits = 0
+            self._started = self._window_start = time.perf_counter()
+            self._window_bits = self._window_tx = self._window_rx = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON-serializable view of the counters."""
+        extra: dict[str, int] = {}
+        if self.probe is not None:
+            try:
+                extra = self.probe()
+            except Exception as e:
+                logger.debug("Bus stats probe failed: %s", e)
+        now = time.perf_counter()
+        with self._lock:
+            self._roll(now)
+            elapsed = max(now - self._started, 1e-9)
+            snap: dict[str, Any] = {
+                "kind": self.kind,
+                "bitrate": self.bitrate,
+                "frames_tx": self.frames_tx,
+                "frames_rx": self.frames_rx,
+                "bytes_tx": self.bytes_tx,
+                "bytes_rx": self.bytes_rx,
+                "parse_errors": self.parse_errors,
+                "timeouts": self.timeouts,
+                "rx_pending_bytes": 0,
+                "rx_overflows": 0,
+                "load_pct": self.last_window["load_pct"],
+                "avg_load_pct": round(100.0 * self._wire_bits / self.bitrate / elapsed, 3),
+                "window": dict(self.last_window),
+                "rtt": self._rtt.summary(),
+            }
+        snap["parse_errors"] += extra.pop("parse_errors", 0)
+        snap.update(extra)
+        return snap
+
+
+# ── CAN (dm_can) ────────────────────────────────────────────────
+
+
+class InstrumentedTransport:
+    """Counting wrapper around a dm_can serial device or CAN transport.
+
+    Args:
+        inner: Transport to wrap (pyserial-like or a ``CanTransport``).
+        stats: Counters to update.
+    """
+
+    def __init__(self, inner: Any, stats: BusStats) -> None:
+        self.inner = inner
+        self.stats = stats
+
+    @property
+    def is_open(self) -> bool:
+        return self.inner.is_open
+
+    def open(self) -> None:
+        self.inner.open()
+
+    def close(self) -> None:
+        self.inner.close()
+
+    def write(self, data: bytes | bytearray) -> int:
+        self.stats.record_tx(len(data) // BRIDGE_TX_LENGTH, len(data))
+        return self.inner.write(data)
+
+    def read_all(self) -> bytes:
+        data = self.inner.read_all()
+        if data:
+            self.stats.record_rx(len(data) // BRIDGE_RX_LENGTH, len(data))
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+
+def instrument_motor_control(control: Any, bitrate: int = DEFAULT_CAN_BITRATE) -> BusStats:
+    """Route a MotorControl's I/O through an :class:`InstrumentedTransport`.
+
+    Idempotent: an already instrumented control keeps its counters.
+
+    Args:
+        control: ``vendor/dm_can.MotorControl`` instance.
+        bitrate: CAN bitrate (bits/s) for the load estimate.
+
+    Returns:
+        The bus's counters.
+    """
+    if isinstance(control.serial_, InstrumentedTransport):
+        return control.serial_.stats
+
+    def probe() -> dict[str, int]:
+        return {
+            "parse_errors": control.rx_discarded,
+            "rx_pending_bytes": control.rx_pending_bytes,
+            "rx_overflows": control.rx_overflows,
+        }
+
+    stats = BusStats("can", bitrate, frame_bits=CAN_FRAME_BITS, probe=probe)
+    control.serial_ = InstrumentedTransport(control.serial_, stats)
+    return stats
+
+
+# ── Serial (Feetech / Dynamixel SDK) ────────────────────────────
+
+
+def instrument_serial_bus(bus: Any) -> BusStats | None:
+    """Wrap a lerobot MotorsBus's SDK port and packet handlers in place.
+
+    Args:
+        bus: Bus exposing ``port_handler`` and ``packet_handler``.
+
+    Returns:
+        The bus's counters, or None if the bus has no SDK handlers.
+    """
+    port = getattr(bus, "port_handler", None)
+    packets = getattr(bus, "packet_handler", None)
+    if port is None or packets is None:
+        return None
+    existing = getattr(port, "_nextis_bus_stats", None)
+    if existing is not None:
+        return existing
+
+    baudrate = _port_baudrate(port)
+
+    def probe() -> dict[str, int]:
+        return {"rx_pending_bytes": int(port.getBytesAvailable())}
+
+    stats = BusStats("serial", baudrate, probe=probe)
+    write_port = port.writePort
+    read_port = port.readPort
+    tx_packet = packets.txPacket
+    rx_packet = packets.rxPacket
+
+    def writePort(packet: Any) -> Any:  # noqa: N802 — SDK method name
+        stats.record_tx(0, len(packet), request=False)
+        return write_port(packet)
+
+    def readPort(length: int) -> Any:  # noqa: N802
+        data = read_port(length)
+        if data:
+            stats.record_rx(0, len(data), reply=False)
+        return data
+
+    def txPacket(port_handler: Any, txpacket: Any) -> Any:  # noqa: N802
+        result = tx_packet(port_handler, txpacket)
+        stats.record_tx(1, 0)
+        return result
+
+    def rxPacket(port_handler: Any, *args: Any) -> Any:  # noqa: N802
+        out = rx_packet(port_handler, *args)
+        result = out[1] if isinstance(out, tuple) and len(out) > 1 else _COMM_SUCCESS
+        if result == _COMM_SUCCESS:
+            stats.record_rx(1, 0)
+        elif result == _COMM_RX_TIMEOUT:
+            stats.record_error(timeout=True)
+        elif result == _COMM_RX_CORRUPT:
+            stats.record_error()
+        return out
+
+    port.writePort = writePort
+    port.readPort = readPort
+    packets.txPacket = txPacket
+    packets.rxPacket = rxPacket
+    port._nextis_bus_stats = stats
+    return stats
+
+
+def _port_baudrate(port: Any) -> int:
+    """Baud rate of an SDK PortHandler (1 Mbaud if unknown)."""
+    for attr in ("getBaudRate", "baudrate"):
+        value = getattr(port, attr, None)
+        if callable(value):
+            value = value()
+        if isinstance(value, int) and value > 0:
+            return value
+    return 1_000_000
+
+
+# ── Arm-level entry point ───────────────────────────────────────
+
+
+def instrument_arm(instance: Any, arm: ArmDefinition) -> dict[str, BusStats]:
+    """Attach traffic counters to every bus of a connected arm.
+
+    Never raises; buses that cannot be instrumented are skipped.
+
+    Args:
+        instance: Connected lerobot Robot or Teleoperator.
+        arm: Its definition; ``config["can_bitrate"]`` overrides the CAN
+            bitrate (default 1 Mbit/s).
+
+    Returns:
+        Bus name (``"can"``, ``"bus"``, ``"left"``, ``"right"``) -> counters.
+    """
+    buses: dict[str, BusStats] = {}
+    try:
+        if arm.motor_type == MotorType.DAMIAO:
+            from nextis.hardware.diagnostics import find_motor_control
+
+            control = find_motor_control(instance)
+            if control is not None:
+                bitrate = int(arm.config.get("can_bitrate", DEFAULT_CAN_BITRATE))
+                buses["can"] = instrument_motor_control(control, bitrate)
+            return buses
+
+        for name in ("left", "right"):
+            side = getattr(instance, f"{name}_arm", None)
+            if side is not None and hasattr(side, "bus"):
+                stats = instrument_serial_bus(side.bus)
+                if stats is not None:
+                    buses[name] = stats
+        if hasattr(instance, "bus"):
+            stats = instrument_serial_bus(instance.bus)
+            if stats is not None:
+                buses["bus"] = stats
+    except Exception as e:
+        logger.warning("Could not instrument buses of %s: %s", arm.id, e)
+    return buses
@@ -5,21 +5,27 @@ the new AURA split-file format (zeros.json, ranges.json, inversions.json,
 gravity.json) and the legacy Nextis_Bridge monolithic format for backward
 compatibility.
 
-Interactive calibration routines (zero recording, range discovery) are NOT
-included here -- those require hardware and a human operator.
+Range discovery runs in a background thread while a human operator moves
+the arm; the simultaneous mode samples every joint at once into a
+``RangeAccumulator``.
 """
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import shutil
 import threading
 import time
+from contextlib import AbstractContextManager
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from nextis.control.ticker import RateTicker
 from nextis.errors import CalibrationError
 
 logger = logging.getLogger(__name__)
@@ -383,19 +389,38 @@ class CalibrationManager:
         speed: float = 0.1,
         duration_per_joint: float = 10.0,
         joints: list[str] | None = None,
+        simultaneous: bool = False,
+        max_duration: float = 60.0,
+        settle_time: float = 3.0,
+        max_rate_hz: float | None = None,
+        bus_lock: threading.Lock | None = None,
     ) -> None:
         """Start passive range discovery in a background thread.
 
         The user physically moves the arm through its range of motion while
-        positions are recorded at 10 Hz. Min/max per joint are saved as the
-        ranges profile.
+        positions are recorded. Min/max per joint are saved as the ranges
+        profile.
+
+        Sequential mode records one joint after another at 10 Hz for
+        ``duration_per_joint`` each. Simultaneous mode records every joint at
+        once at the arm's read rate and finishes as soon as every joint has
+        been moved and no joint's range has grown for ``settle_time`` seconds
+        (or after ``max_duration``). If any joint was never moved through a
+        range, discovery ends in the error phase and nothing is saved.
 
         Args:
             arm_id: Arm identifier.
             robot_instance: Connected robot instance (must support ``get_observation``).
             speed: Unused — kept for API compatibility.
-            duration_per_joint: Seconds to record per joint (or total if discovering all).
+            duration_per_joint: Seconds to record per joint (sequential mode).
             joints: Specific joints to discover, or ``None`` for all.
+            simultaneous: Record all joints at once with early exit.
+            max_duration: Upper bound on simultaneous discovery (seconds).
+            settle_time: Seconds without range growth before finishing early.
+            max_rate_hz: Cap on the simultaneous read rate; ``None`` reads
+                back to back.
+            bus_lock: Lock held around every bus read, shared with other
+                users of the arm's bus (e.g. the diagnostics sampler).
 
         Raises:
             CalibrationError: If discovery is already running for this arm.
@@ -409,11 +434,26 @@ class CalibrationManager:
                 "progress": 0.0,
                 "current_joint": None,
                 "error": None,
+                "mode": "simultaneous" if simultaneous else "sequential",
             }
 
+        if simultaneous:
+            target: Any = self._simultaneous_range_loop
+            args: tuple = (
+                arm_id,
+                robot_instance,
+                joints,
+                max_duration,
+                settle_time,
+                max_rate_hz,
+                bus_lock,
+            )
+        else:
+            target = self._range_discovery_loop
+            args = (arm_id, robot_instance, duration_per_joint, joints, bus_lock)
         thread = threading.Thread(
-            target=self._range_discovery_loop,
-            args=(arm_id, robot_instance, duration_per_joint, joints),
+            target=target,
+            args=args,
             daemon=True,
             name=f"RangeDiscovery-{arm_id}",
         )
@@ -429,21 +469,14 @@ class CalibrationManager:
         robot_instance: Any,
         duration_per_joint: float,
         joints: list[str] | None,
+        bus_lock: threading.Lock | None = None,
     ) -> None:
         """Background loop: read positions at 10 Hz and record min/max."""
+        lock = bus_lock or contextlib.nullcontext()
         try:
-            # Determine joint names from a single observation
-            obs = robot_instance.get_observation()
-            all_joints = [k for k in obs if k.endswith(".pos") or "position" in k.lower()]
-            if not all_joints:
-                # Try direct motor names
-                all_joints = list(getattr(robot_instance, "motor_names", []))
-            if not all_joints:
-                raise CalibrationError("Could not determine joint names from robot")
-
-            target_joints = joints if joints else all_joints
-            mins: dict[str, float] = {}
-            maxs: dict[str, float] = {}
+            target_joints = joints if joints else _discover_joints(robot_instance, lock)
+            acc = RangeAccumulator(target_joints)
+            values = np.full(len(target_joints), np.nan)
 
             for i, joint in enumerate(target_joints):
                 with _range_discovery_lock:
@@ -457,47 +490,272 @@ class CalibrationManager:
                 samples = int(duration_per_joint * 10)
                 for _ in range(samples):
                     try:
-                        obs = robot_instance.get_observation()
+                        with lock:
+                            obs = robot_instance.get_observation()
                         val = obs.get(joint)
                         if val is not None:
-                            fval = float(val)
-                            mins[joint] = min(mins.get(joint, fval), fval)
-                            maxs[joint] = max(maxs.get(joint, fval), fval)
+                            values[i] = float(val)
+                            acc.add(values, time.perf_counter())
+                            values[i] = np.nan
                     except Exception:
                         pass
                     time.sleep(0.1)
 
-            # Build and save ranges
-            ranges: dict[str, dict[str, float]] = {}
-            for joint in target_joints:
-                if joint in mins and joint in maxs:
-                    ranges[joint] = {"min": mins[joint], "max": maxs[joint]}
-
-            try:
-                profile = self.load(arm_id)
-            except CalibrationError:
-                profile = CalibrationProfile(arm_id=arm_id)
-            profile.ranges = ranges
-            self.save(profile)
-
-            with _range_discovery_lock:
-                _range_discovery_state[arm_id] = {
+            self._finish_range_discovery(arm_id, acc)
+
+        except Exception as exc:
+            _fail_range_discovery(arm_id, exc)
+
+    def _simultaneous_range_loop(
+        self,
+        arm_id: str,
+        robot_instance: Any,
+        joints: list[str] | None,
+        max_duration: float,
+        settle_time: float,
+        max_rate_hz: float | None,
+        bus_lock: threading.Lock | None = None,
+    ) -> None:
+        """Background loop: sample all joints at once until their ranges settle."""
+        lock = bus_lock or contextlib.nullcontext()
+        try:
+            target_joints = joints if joints else _discover_joints(robot_instance, lock)
+            acc = RangeAccumulator(target_joints)
+            values = np.full(len(target_joints), np.nan)
+            ticker = RateTicker(max_rate_hz) if max_rate_hz else None
+            start = time.perf_counter()
+            next_publish = start
+            if ticker:
+                ticker.start()
+
+            while True:
+                now = time.perf_counter()
+                try:
+                    with lock:
+                        obs = robot_instance.get_observation()
+                    for i, joint in enumerate(target_joints):
+                        val = obs.get(joint)
+                        values[i] = np.nan if val is None else float(val)
+                    acc.add(values, now)
+                except Exception as exc:
+                    logger.debug("Range discovery read failed: %s", exc)
+
+                elapsed = now - start
+                done = elapsed >= max_duration or (
+                    elapsed >= settle_time and acc.settled(now, settle_time)
+                )
+                if done or now >= next_publish:
+                    next_publish = now + 0.1
+                    with _range_discovery_lock:
+                        _range_discovery_state[arm_id].update(
+                            {
+                                "progress": acc.progress(now, settle_time),
+                                "elapsed": round(elapsed, 2),
+                                "rate_hz": round(acc.total_samples / elapsed, 1)
+                                if elapsed
+                                else 0.0,
+                                "joints": acc.joint_status(now, settle_time),
+                            }
+                        )
+                if done:
+                    break
+                if ticker:
+                    ticker.wait()
+
+            self._finish_range_discovery(arm_id, acc)
+
+        except Exception as exc:
+            _fail_range_discovery(arm_id, exc)
+
+    def _finish_range_discovery(self, arm_id: str, acc: RangeAccumulator) -> None:
+        """Save discovered ranges into the arm's profile and mark discovery complete.
+
+        Raises:
+            CalibrationError: If any sampled joint was not moved through its
+                range. Nothing is saved, so stored ranges stay intact.
+        """
+        unmoved = acc.unmoved()
+        if unmoved:
+            raise CalibrationError(
+                f"No range of motion recorded for {', '.join(unmoved)} on '{arm_id}'; "
+                "stored ranges left unchanged"
+            )
+        ranges = acc.ranges()
+        try:
+            profile = self.load(arm_id)
+        except CalibrationError:
+            profile = CalibrationProfile(arm_id=arm_id)
+        profile.ranges = ranges
+        self.save(profile)
+
+        with _range_discovery_lock:
+            _range_discovery_state[arm_id].update(
+                {
                     "phase": "complete",
                     "progress": 1.0,
                     "current_joint": None,
                     "error": None,
                 }
-            logger.info("Range discovery complete for '%s': %d joints", arm_id, len(ranges))
+            )
+        logger.info("Range discovery complete for '%s': %d joints", arm_id, len(ranges))
 
-        except Exception as exc:
-            logger.error("Range discovery failed for '%s': %s", arm_id, exc)
-            with _range_discovery_lock:
-                _range_discovery_state[arm_id] = {
-                    "phase": "error",
-                    "progress": 0.0,
-                    "current_joint": None,
-                    "error": str(exc),
-                }
+
+# ---------------------------------------------------------------------------
+# Range accumulation (simultaneous discovery)
+# ---------------------------------------------------------------------------
+
+
+class RangeAccumulator:
+    """Running min/max and position histograms for many joints at once.
+
+    Each joint's histogram spans its current [min, max] in ``bins`` equal
+    bins and is re-binned when the range grows. Coverage is the fraction of
+    bins visited.
+
+    Args:
+        joints: Joint names, in the order of the sample vectors.
+        bins: Histogram bins per joint.
+        tolerance: Growth smaller than this fraction of the joint's span
+            does not count as the range still growing (encoder noise).
+        min_coverage: Coverage a joint needs before it counts as moved; a
+            static joint jittering between a few encoder ticks stays below.
+    """
+
+    def __init__(
+        self,
+        joints: list[str],
+        bins: int = 32,
+        tolerance: float = 0.02,
+        min_coverage: float = 0.25,
+    ) -> None:
+        n = len(joints)
+        self.joints = list(joints)
+        self.bins = bins
+        self.tolerance = tolerance
+        self.min_coverage = min_coverage
+        self.mins = np.full(n, np.inf)
+        self.maxs = np.full(n, -np.inf)
+        self.hist = np.zeros((n, bins), dtype=np.int64)
+        self.samples = np.zeros(n, dtype=np.int64)
+        self.last_growth = np.zeros(n)
+        self.total_samples = 0
+        self._rows = np.arange(n)
+
+    def add(self, values: np.ndarray, now: float) -> None:
+        """Accumulate one sample vector; NaN entries are skipped."""
+        ok = ~np.isnan(values)
+        if not ok.any():
+            return
+        v = np.where(ok, values, 0.0)
+        new_min = np.where(ok, np.minimum(self.mins, v), self.mins)
+        new_max = np.where(ok, np.maximum(self.maxs, v), self.maxs)
+
+        seen = self.samples > 0
+        changed = ok & seen & ((new_min < self.mins) | (new_max > self.maxs))
+        if changed.any():
+            growth = (self.mins - new_min) + (new_max - self.maxs)
+            grew = changed & (growth > self.tolerance * (new_max - new_min))
+            self.last_growth[grew] = now
+            self._rebin(np.flatnonzero(changed), new_min, new_max)
+        first = ok & ~seen
+        self.last_growth[first] = now
+        self.mins, self.maxs = new_min, new_max
+
+        span = self.maxs - self.mins
+        pos = np.zeros(len(v))
+        np.divide((v - self.mins) * self.bins, span, out=pos, where=span > 0)
+        idx = np.clip(pos.astype(np.intp), 0, self.bins - 1)
+        self.hist[self._rows[ok], idx[ok]] += 1
+        self.samples += ok
+        self.total_samples += 1
+
+    def _rebin(self, rows: np.ndarray, new_min: np.ndarray, new_max: np.ndarray) -> None:
+        """Map the histograms of ``rows`` onto their grown ranges."""
+        old_span = (self.maxs - self.mins)[rows, None]
+        centers = self.mins[rows, None] + (np.arange(self.bins) + 0.5) * old_span / self.bins
+        new_span = (new_max - new_min)[rows, None]
+        idx = np.clip(
+            ((centers - new_min[rows, None]) * self.bins / new_span).astype(np.intp),
+            0,
+            self.bins - 1,
+        )
+        rebinned = np.zeros((len(rows), self.bins), dtype=np.int64)
+        np.add.at(rebinned, (np.arange(len(rows))[:, None], idx), self.hist[rows])
+        self.hist[rows] = rebinned
+
+    def coverage(self) -> np.ndarray:
+        """Fraction of histogram bins visited per joint (0 for a single point)."""
+        spread = self.maxs > self.mins
+        return np.where(spread, (self.hist > 0).sum(axis=1) / self.bins, 0.0)
+
+    def moved(self) -> np.ndarray:
+        """Per-joint flag: the joint reached ``min_coverage`` of its span."""
+        return self.coverage() >= self.min_coverage
+
+    def unmoved(self) -> list[str]:
+        """Joints that were sampled but never moved through a range."""
+        stuck = (self.samples > 0) & ~self.moved()
+        return [joint for i, joint in enumerate(self.joints) if stuck[i]]
+
+    def settled(self, now: float, settle_time: float) -> bool:
+        """True once every joint has moved and none grew for ``settle_time``."""
+        return bool(self.moved().all() and (now - self.last_growth >= settle_time).all())
+
+    def progress(self, now: float, settle_time: float) -> float:
+        """Overall progress: fraction of the settle time elapsed on the slowest joint."""
+        if not self.moved().all():
+            return 0.0
+        return float(np.clip((now - self.last_growth) / settle_time, 0.0, 1.0).min())
+
+    def joint_status(self, now: float, settle_time: float) -> dict[str, dict[str, Any]]:
+        """Per-joint min/max, coverage, sample count and settled flag."""
+        coverage = self.coverage()
+        moved = coverage >= self.min_coverage
+        status: dict[str, dict[str, Any]] = {}
+        for i, joint in enumerate(self.joints):
+            has = bool(self.samples[i])
+            status[joint] = {
+                "min": float(self.mins[i]) if has else None,
+                "max": float(self.maxs[i]) if has else None,
+                "coverage": round(float(coverage[i]), 3),
+                "samples": int(self.samples[i]),
+                "settled": bool(moved[i]) and now - self.last_growth[i] >= settle_time,
+            }
+        return status
+
+    def ranges(self) -> dict[str, dict[str, float]]:
+        """Discovered ``{joint: {"min", "max"}}`` for joints with samples."""
+        return {
+            joint: {"min": float(self.mins[i]), "max": float(self.maxs[i])}
+            for i, joint in enumerate(self.joints)
+            if self.samples[i]
+        }
+
+
+def _discover_joints(
+    robot_instance: Any, lock: AbstractContextManager[Any] | None = None
+) -> list[str]:
+    """Determine joint names from a single observation."""
+    with lock or contextlib.nullcontext():
+        obs = robot_instance.get_observation()
+    all_joints = [k for k in obs if k.endswith(".pos") or "position" in k.lower()]
+    if not all_joints:
+        # Try direct motor names
+        all_joints = list(getattr(robot_instance, "motor_names", []))
+    if not all_joints:
+        raise CalibrationError("Could not determine joint names from robot")
+    return all_joints
+
+
+def _fail_range_discovery(arm_id: str, exc: Exception) -> None:
+    logger.error("Range discovery failed for '%s': %s", arm_id, exc)
+    with _range_discovery_lock:
+        _range_discovery_state[arm_id] = {
+            "phase": "error",
+            "progress": 0.0,
+            "current_joint": None,
+            "error": str(exc),
+        }
 
 
 # ---------------------------------------------------------------------------
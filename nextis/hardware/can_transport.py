@@ -0,0 +1,463 @@
+"""Pluggable CAN transports for Damiao motors.
+
+``vendor/dm_can.MotorControl`` speaks the USB-CAN serial bridge protocol:
+30-byte transmit frames and 16-byte receive frames over a pyserial-like
+object (``is_open``/``open``/``close``/``write``/``read_all``). Every
+transport here exposes that same interface, so MotorControl and the Damiao
+scanner work unchanged over:
+
+- ``SerialBridgeTransport`` — the USB-CAN bridge on a serial port.
+- ``SocketCanTransport`` — a Linux SocketCAN interface; bridge frames are
+  translated to and from raw CAN frames.
+- ``SimulatedCanBus`` — an in-process bus of simulated Damiao motors with
+  configurable latency, bitrate and frame loss, for tests and benchmarks
+  without hardware.
+
+Use :func:`create_transport` to pick a backend from a port string.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import random
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+import numpy as np
+
+from nextis.vendor.dm_can import (
+    DM_variable,
+    MotorControl,
+    find_frames,
+    float_to_uint,
+    is_in_ranges,
+    uint_to_float,
+)
+
+logger = logging.getLogger(__name__)
+
+BRIDGE_TX_LENGTH = 30
+BRIDGE_RX_LENGTH = 16
+PARAM_CAN_ID = 0x7FF  # Damiao parameter / management frames
+
+# Bits on the wire for a standard CAN frame with 8 data bytes, including
+# typical bit stuffing and the interframe space
+CAN_FRAME_BITS = 130
+
+_SOCKETCAN_FORMAT = "=IB3x8s"
+_CAN_EFF_MASK = 0x1FFFFFFF
+
+
+class CanTransport(Protocol):
+    """Byte-stream interface MotorControl expects from its serial device."""
+
+    is_open: bool
+
+    def open(self) -> None: ...
+
+    def close(self) -> None: ...
+
+    def write(self, data: bytes | bytearray) -> int: ...
+
+    def read_all(self) -> bytes: ...
+
+
+# ── Bridge frame codec ───────────────────────────────────────────
+
+
+def encode_tx(can_id: int, data: bytes) -> bytes:
+    """Build one 30-byte bridge transmit frame."""
+    frame = MotorControl.send_data_frame.copy()
+    frame[13] = can_id & 0xFF
+    frame[14] = (can_id >> 8) & 0xFF
+    frame[21:29] = np.frombuffer(bytes(data).ljust(8, b"\x00")[:8], np.uint8)
+    return frame.tobytes()
+
+
+def param_request(slave_id: int, rid: int, op: int = 0x33, value: bytes = b"") -> bytes:
+    """Bridge frame for a parameter read (``0x33``) or write (``0x55``)."""
+    header = bytes([slave_id & 0xFF, (slave_id >> 8) & 0xFF, op, rid])
+    return encode_tx(PARAM_CAN_ID, header + value)
+
+
+def decode_tx(data: bytes | bytearray) -> list[tuple[int, bytes]]:
+    """Split a bridge write into ``(can_id, payload)`` pairs."""
+    frames: list[tuple[int, bytes]] = []
+    i = 0
+    n = len(data)
+    while i + BRIDGE_TX_LENGTH <= n:
+        if data[i] == 0x55 and data[i + 1] == 0xAA:
+            can_id = data[i + 13] | (data[i + 14] << 8)
+            frames.append((can_id, bytes(data[i + 21 : i + 29])))
+            i += BRIDGE_TX_LENGTH
+        else:
+            i += 1
+    return frames
+
+
+def encode_rx(can_id: int, data: bytes) -> bytes:
+    """Build one 16-byte bridge receive frame (CMD 0x11)."""
+    return (
+        bytes([0xAA, 0x11, 0x08])
+        + can_id.to_bytes(4, "little")
+        + bytes(data).ljust(8, b"\x00")[:8]
+        + b"\x55"
+    )
+
+
+# ── Serial bridge ───────────────────────────────────────────────
+
+
+class SerialBridgeTransport:
+    """USB-CAN serial bridge (the adapter dm_can was written for).
+
+    Args:
+        port: Serial device path (e.g. ``/dev/ttyACM0``).
+        baudrate: Serial baud rate of the bridge.
+    """
+
+    def __init__(self, port: str, baudrate: int = 921_600) -> None:
+        self.port = port
+        self.baudrate = baudrate
+        self._serial: Any = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._serial is not None and self._serial.is_open
+
+    def open(self) -> None:
+        if self.is_open:
+            return
+        import serial
+
+        self._serial = serial.Serial(self.port, self.baudrate, timeout=0)
+
+    def close(self) -> None:
+        if self._serial is not None:
+            self._serial.close()
+        self._serial = None
+
+    def write(self, data: bytes | bytearray) -> int:
+        return self._serial.write(data)
+
+    def read_all(self) -> bytes:
+        return self._serial.read_all() or b""
+
+
+# ── SocketCAN ───────────────────────────────────────────────────
+
+
+class SocketCanTransport:
+    """Linux SocketCAN interface presented as a serial bridge.
+
+    Args:
+        interface: CAN interface name (e.g. ``can0``).
+    """
+
+    def __init__(self, interface: str) -> None:
+        self.interface = interface
+        self._socket: Any = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._socket is not None
+
+    def open(self) -> None:
+        if self._socket is not None:
+            return
+        import socket
+
+        s = socket.socket(socket.AF_CAN, socket.SOCK_RAW, socket.CAN_RAW)
+        try:
+            s.bind((self.interface,))
+        except OSError:
+            s.close()
+            raise
+        s.setblocking(False)
+        self._socket = s
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+        self._socket = None
+
+    def write(self, data: bytes | bytearray) -> int:
+        for can_id, payload in decode_tx(data):
+            self._socket.send(struct.pack(_SOCKETCAN_FORMAT, can_id, 8, payload))
+        return len(data)
+
+    def read_all(self) -> bytes:
+        out = bytearray()
+        frame_size = struct.calcsize(_SOCKETCAN_FORMAT)
+        while True:
+            try:
+                raw = self._socket.recv(frame_size)
+            except (BlockingIOError, InterruptedError):
+                break
+            can_id, dlc, payload = struct.unpack(_SOCKETCAN_FORMAT, raw)
+            out += encode_rx(can_id & _CAN_EFF_MASK, payload[:dlc])
+        return bytes(out)
+
+
+# ── Simulated bus ───────────────────────────────────────────────
+
+
+@dataclass
+class SimulatedMotor:
+    """State of one simulated Damiao motor.
+
+    Attributes:
+        slave_id: CAN ID the motor listens on.
+        master_id: CAN ID its replies are sent with.
+        motor_type: ``DM_Motor_Type`` index (selects the MIT limits).
+        q: Position (rad); follows the commanded position.
+        dq: Velocity (rad/s).
+        tau: Torque (Nm).
+        enabled: Whether the motor is enabled.
+        params: Register values by RID.
+    """
+
+    slave_id: int
+    master_id: int
+    motor_type: int = 0
+    q: float = 0.0
+    dq: float = 0.0
+    tau: float = 0.0
+    enabled: bool = False
+    params: dict[int, float] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        q_max, dq_max, tau_max = MotorControl.Limit_Param[self.motor_type]
+        defaults = {
+            DM_variable.MST_ID: self.master_id,
+            DM_variable.ESC_ID: self.slave_id,
+            DM_variable.CTRL_MODE: 1,
+            DM_variable.PMAX: q_max,
+            DM_variable.VMAX: dq_max,
+            DM_variable.TMAX: tau_max,
+            DM_variable.hw_ver: 1,
+            DM_variable.sw_ver: 1,
+        }
+        for rid, value in defaults.items():
+            self.params.setdefault(int(rid), value)
+
+
+class SimulatedCanBus:
+    """In-process CAN bus of simulated Damiao motors behind a bridge interface.
+
+    Frames occupy the bus for ``CAN_FRAME_BITS / bitrate`` seconds each and
+    are serialized (one frame on the wire at a time). A motor answers
+    ``latency`` seconds after a request finishes arriving. Requests and
+    replies are independently dropped with probability ``loss``.
+
+    Args:
+        motors: Motors on the bus.
+        latency: Motor response time (seconds).
+        bitrate: CAN bitrate (bits/s).
+        loss: Per-frame drop probability.
+        seed: RNG seed for reproducible loss.
+    """
+
+    def __init__(
+        self,
+        motors: list[SimulatedMotor],
+        latency: float = 0.0002,
+        bitrate: int = 1_000_000,
+        loss: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self.motors = {m.slave_id: m for m in motors}
+        self.latency = latency
+        self.bitrate = bitrate
+        self.loss = loss
+        self.is_open = False
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._pending: list[tuple[float, int, bytes]] = []  # (ready_at, order, rx frame)
+        self._order = 0
+        self._bus_free = 0.0
+        self._busy_time = 0.0
+        self._started = time.perf_counter()
+        self.frames_tx = 0
+        self.frames_rx = 0
+        self.frames_lost = 0
+
+    @property
+    def frame_time(self) -> float:
+        """Seconds one frame occupies the bus."""
+        return CAN_FRAME_BITS / self.bitrate
+
+    def open(self) -> None:
+        self.is_open = True
+
+    def close(self) -> None:
+        self.is_open = False
+
+    def write(self, data: bytes | bytearray) -> int:
+        now = time.perf_counter()
+        with self._lock:
+            for can_id, payload in decode_tx(data):
+                self.frames_tx += 1
+                arrived = self._occupy(now)
+                if self._rng.random() < self.loss:
+                    self.frames_lost += 1
+                    continue
+                reply = self._handle(can_id, payload)
+                if reply is None:
+                    continue
+                sent = self._occupy(arrived + self.latency)
+                if self._rng.random() < self.loss:
+                    self.frames_lost += 1
+                    continue
+                heapq.heappush(self._pending, (sent, self._order, reply))
+                self._order += 1
+        return len(data)
+
+    def read_all(self) -> bytes:
+        now = time.perf_counter()
+        out = bytearray()
+        with self._lock:
+            while self._pending and self._pending[0][0] <= now:
+                out += heapq.heappop(self._pending)[2]
+                self.frames_rx += 1
+        return bytes(out)
+
+    def utilization(self) -> float:
+        """Fraction of wall time the bus was busy since creation."""
+        elapsed = max(time.perf_counter() - self._started, 1e-9)
+        return min(self._busy_time / elapsed, 1.0)
+
+    def _occupy(self, earliest: float) -> float:
+        """Reserve the wire for one frame; return when it finishes."""
+        start = max(earliest, self._bus_free)
+        self._bus_free = start + self.frame_time
+        self._busy_time += self.frame_time
+        return self._bus_free
+
+    def _handle(self, can_id: int, data: bytes) -> bytes | None:
+        """Apply a request to the addressed motor and build its reply."""
+        if can_id == PARAM_CAN_ID:
+            motor = self.motors.get(data[0] | (data[1] << 8))
+            if motor is None:
+                return None
+            op = data[2]
+            if op == 0xCC:
+                return self._feedback(motor)
+            if op not in (0x33, 0x55):
+                return None  # 0xAA save: no reply
+            rid = data[3]
+            if op == 0x55:
+                fmt = "<I" if is_in_ranges(rid) else "<f"
+                motor.params[rid] = struct.unpack(fmt, data[4:8])[0]
+            value = motor.params.get(rid, 0)
+            fmt = "<I" if is_in_ranges(rid) else "<f"
+            body = struct.pack(fmt, int(value) if fmt == "<I" else float(value))
+            return encode_rx(motor.master_id, bytes([data[0], data[1], op, rid]) + body)
+
+        motor = self.motors.get(can_id & 0xFF)
+        mode = can_id & 0xF00
+        if motor is None:
+            return None
+        if data[:7] == b"\xff" * 7:
+            if data[7] == 0xFC:
+                motor.enabled = True
+            elif data[7] == 0xFD:
+                motor.enabled = False
+            elif data[7] == 0xFE:
+                motor.q = 0.0
+            return self._feedback(motor)
+        if mode == 0x000 and motor.enabled:
+            q_max, dq_max, tau_max = MotorControl.Limit_Param[motor.motor_type]
+            motor.q = float(uint_to_float((data[0] << 8) | data[1], -q_max, q_max, 16))
+            motor.dq = float(uint_to_float((data[2] << 4) | (data[3] >> 4), -dq_max, dq_max, 12))
+            tau = ((data[6] & 0xF) << 8) | data[7]
+            motor.tau = float(uint_to_float(tau, -tau_max, tau_max, 12))
+        elif mode in (0x100, 0x300) and motor.enabled:
+            motor.q = struct.unpack("<f", data[0:4])[0]
+        elif mode == 0x200 and motor.enabled:
+            motor.dq = struct.unpack("<f", data[0:4])[0]
+        return self._feedback(motor)
+
+    def _feedback(self, motor: SimulatedMotor) -> bytes:
+        """MIT feedback frame for the motor's current state."""
+        q_max, dq_max, tau_max = MotorControl.Limit_Param[motor.motor_type]
+        q = int(float_to_uint(min(max(motor.q, -q_max), q_max), -q_max, q_max, 16))
+        dq = int(float_to_uint(min(max(motor.dq, -dq_max), dq_max), -dq_max, dq_max, 12))
+        tau = int(float_to_uint(min(max(motor.tau, -tau_max), tau_max), -tau_max, tau_max, 12))
+        status = 1 if motor.enabled else 0
+        data = bytes(
+            [
+                (motor.slave_id & 0x0F) | (status << 4),
+                q >> 8,
+                q & 0xFF,
+                dq >> 4,
+                ((dq & 0xF) << 4) | (tau >> 8),
+                tau & 0xFF,
+                25,  # MOS temperature (°C)
+                25,  # rotor temperature (°C)
+            ]
+        )
+        return encode_rx(motor.master_id, data)
+
+
+# ── Factory ─────────────────────────────────────────────────────
+
+
+def create_transport(port: str, **kwargs: Any) -> CanTransport:
+    """Pick a transport for a port string.
+
+    - ``sim`` or ``sim:N`` — SimulatedCanBus with N motors (default 7),
+      slave IDs 1..N and master IDs 0x11..; extra kwargs go to the bus.
+    - ``/dev/...`` or ``COM...`` — SerialBridgeTransport.
+    - Anything else (``can0``, ``vcan0``) — SocketCanTransport.
+    """
+    if port == "sim" or port.startswith("sim:"):
+        count = int(port.split(":", 1)[1]) if ":" in port else 7
+        motors = [SimulatedMotor(slave_id=i, master_id=0x10 + i) for i in range(1, count + 1)]
+        return SimulatedCanBus(motors, **kwargs)
+    if port.startswith("/dev/") or port.upper().startswith("COM"):
+        return SerialBridgeTransport(port, **kwargs)
+    return SocketCanTransport(port)
+
+
+def collect_frames(
+    transport: CanTransport,
+    timeout: float,
+    done: Any = None,
+    poll_interval: float = 0.0005,
+) -> np.ndarray:
+    """Read bridge receive frames until ``timeout`` or ``done(frames)`` is true.
+
+    Args:
+        transport: Open transport.
+        timeout: Maximum wait (seconds).
+        done: Optional predicate on the frames collected so far.
+        poll_interval: Sleep between empty reads (seconds).
+
+    Returns:
+        ``(N, 16)`` uint8 array of complete frames.
+    """
+    deadline = time.perf_counter() + timeout
+    buf = b""
+    chunks: list[np.ndarray] = []
+    while True:
+        data = transport.read_all()
+        if data:
+            buf += data
+            frames, consumed = find_frames(buf)
+            buf = buf[consumed:]
+            if len(frames):
+                chunks.append(frames)
+                if done is not None and done(np.concatenate(chunks)):
+                    break
+        if time.perf_counter() >= deadline:
+            break
+        if not data:
+            time.sleep(poll_interval)
+    if not chunks:
+        return np.zeros((0, BRIDGE_RX_LENGTH), np.uint8)
+    return np.concatenate(chunks)
@@ -8,6 +8,7 @@ config and class.  Passes ``calibration_dir`` so lerobot uses the project's
 from __future__ import annotations
 
 import logging
+import time
 from pathlib import Path
 from typing import Any
 
@@ -68,6 +69,127 @@ def create_arm_instance(arm: ArmDefinition) -> Any:
     return None
 
 
+def reconnect_arm_instance(
+    arm: ArmDefinition,
+    instance: Any,
+    torque: list[dict[str, int] | None] | None = None,
+) -> Any:
+    """Bring a previously created instance back online without rebuilding it.
+
+    A parked instance (port still open, torque off) gets back the torque
+    state recorded by :func:`read_torque` when it was parked. A closed one
+    (e.g. after an E-stop) is reconnected in place, keeping its config and
+    in-memory calibration.
+
+    Args:
+        arm: Arm definition the instance was created for.
+        instance: Instance returned earlier by :func:`create_arm_instance`.
+        torque: Per-bus torque state recorded before parking.
+
+    Returns:
+        The same instance, connected.
+
+    Raises:
+        HardwareError: If the instance cannot be brought back.
+    """
+    try:
+        if getattr(instance, "is_connected", False):
+            if not restore_torque(arm, instance, torque):
+                raise HardwareError(f"Cannot restore torque on {arm.id}")
+        elif arm.motor_type == MotorType.DAMIAO:
+            instance.connect()
+        else:
+            instance.connect(calibrate=False)
+    except HardwareError:
+        raise
+    except Exception as e:
+        raise HardwareError(f"Warm reconnect of {arm.id} failed: {e}") from e
+    return instance
+
+
+def _buses(instance: Any) -> list[Any]:
+    """Motor buses of a single or bi-manual instance."""
+    buses = [
+        getattr(getattr(instance, f"{side}_arm", None), "bus", None) for side in ("left", "right")
+    ]
+    buses.append(getattr(instance, "bus", None))
+    return [b for b in buses if b is not None]
+
+
+def set_torque(instance: Any, enabled: bool) -> bool:
+    """Enable or disable torque on every bus of an instance, leaving ports open.
+
+    Args:
+        instance: Connected lerobot Robot or Teleoperator (single or bi-manual).
+        enabled: Target torque state.
+
+    Returns:
+        True if every bus supports and accepted the change.
+    """
+    buses = _buses(instance)
+    method = "enable_torque" if enabled else "disable_torque"
+    if not buses or not all(hasattr(b, method) for b in buses):
+        return False
+    try:
+        for bus in buses:
+            getattr(bus, method)()
+    except Exception as e:
+        logger.warning("Could not %s: %s", method.replace("_", " "), e)
+        return False
+    return True
+
+
+def read_torque(instance: Any) -> list[dict[str, int] | None]:
+    """Read each bus's per-motor ``Torque_Enable`` state.
+
+    Returns:
+        One entry per bus (same order as :func:`restore_torque` expects):
+        motor name -> 0/1, or None where the bus cannot report it.
+    """
+    states: list[dict[str, int] | None] = []
+    for bus in _buses(instance):
+        try:
+            raw = bus.sync_read("Torque_Enable", normalize=False)
+            states.append({name: int(value) for name, value in raw.items()})
+        except Exception:
+            states.append(None)
+    return states
+
+
+def restore_torque(
+    arm: ArmDefinition,
+    instance: Any,
+    torque: list[dict[str, int] | None] | None,
+) -> bool:
+    """Re-enable exactly the motors that had torque when the arm was parked.
+
+    Buses without a recorded state are re-enabled on followers and left
+    off on leaders, which are moved by hand.
+
+    Returns:
+        True if every bus accepted the change.
+    """
+    buses = _buses(instance)
+    if not buses:
+        return False
+    try:
+        for i, bus in enumerate(buses):
+            state = torque[i] if torque is not None and i < len(torque) else None
+            if state is None:
+                if arm.role != ArmRole.LEADER:
+                    bus.enable_torque()
+                continue
+            enabled = [name for name, value in state.items() if value]
+            if len(enabled) == len(state):
+                bus.enable_torque()
+            elif enabled:
+                bus.enable_torque(enabled)
+    except Exception as e:
+        logger.warning("Could not restore torque on %s: %s", arm.id, e)
+        return False
+    return True
+
+
 # ---------------------------------------------------------------------------
 # Private helpers — one per motor family
 # ---------------------------------------------------------------------------
@@ -136,9 +258,54 @@ def _create_damiao(arm: ArmDefinition, cal_dir: Path) -> Any | None:
     )
     robot = DamiaoFollowerRobot(config)
     robot.connect()
+    _check_damiao_params(arm, robot)
     return robot
 
 
+def _check_damiao_params(arm: ArmDefinition, robot: Any) -> None:
+    """Verify each motor's MIT limits match the driver's table.
+
+    Reads PMAX/VMAX/TMAX from every motor in one pipelined burst. A mismatch
+    means every command and feedback value is scaled wrongly, so it is
+    logged loudly; a missing reply is logged as a warning. Never raises.
+    """
+    from nextis.hardware.diagnostics import find_motor_control
+    from nextis.vendor.dm_can import DM_variable
+
+    control = find_motor_control(robot)
+    if control is None:
+        return
+    rids = (DM_variable.PMAX, DM_variable.VMAX, DM_variable.TMAX)
+    motors = list({id(m): m for m in control.motors_map.values()}.values())
+    try:
+        start = time.perf_counter()
+        values = control.read_params(motors, rids)
+        elapsed_ms = (time.perf_counter() - start) * 1e3
+    except Exception as e:
+        logger.warning("Damiao parameter check failed on %s: %s", arm.id, e)
+        return
+
+    for motor in motors:
+        read = values.get(motor.SlaveID, {})
+        expected = control.Limit_Param[motor.MotorType]
+        for rid, limit in zip(rids, expected, strict=True):
+            value = read.get(int(rid))
+            if value is None:
+                logger.warning("%s motor 0x%02X: no reply for %s", arm.id, motor.SlaveID, rid.name)
+            elif abs(value - limit) > 1e-3:
+                logger.error(
+                    "%s motor 0x%02X: %s is %.3f but the driver assumes %.3f",
+                    arm.id,
+                    motor.SlaveID,
+                    rid.name,
+                    value,
+                    limit,
+                )
+    logger.info(
+        "Damiao parameter check on %s: %d motors in %.1fms", arm.id, len(motors), elapsed_ms
+    )
+
+
 def _create_dynamixel(arm: ArmDefinition, cal_dir: Path) -> Any | None:
     """Create Dynamixel leader instance (follower not supported)."""
     if arm.role != ArmRole.LEADER:
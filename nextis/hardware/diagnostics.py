@@ -7,13 +7,40 @@ Returns partial data on read failures rather than raising.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from nextis.hardware.types import MotorType
+from nextis.vendor.dm_can import DM_variable, MotorControl
 
 logger = logging.getLogger(__name__)
 
+# Damiao registers reported with each motor's diagnostics
+DAMIAO_DIAGNOSTIC_PARAMS = (
+    DM_variable.CTRL_MODE,
+    DM_variable.PMAX,
+    DM_variable.VMAX,
+    DM_variable.TMAX,
+    DM_variable.sw_ver,
+)
+
+# Diagnostics field -> bus register, for bulk sampling (see diagnostics_sampler)
+FEETECH_REGISTERS = {
+    "position": "Present_Position",
+    "velocity": "Present_Speed",
+    "temperature_c": "Present_Temperature",
+    "current_ma": "Present_Current",
+    "voltage_v": "Present_Voltage",
+}
+DYNAMIXEL_REGISTERS = {
+    "position": "Present_Position",
+    "velocity": "Present_Velocity",
+    "temperature_c": "Present_Temperature",
+    "current_ma": "Present_Current",
+    "voltage_v": "Present_Input_Voltage",
+    "error_flags": "Hardware_Error_Status",
+}
+
 
 @dataclass
 class MotorDiagnostics:
@@ -28,6 +55,7 @@ class MotorDiagnostics:
     voltage_v: float | None = None
     error_flags: int = 0
     error_description: str = ""
+    params: dict[str, float | None] = field(default_factory=dict)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -41,6 +69,7 @@ class MotorDiagnostics:
             "voltage_v": self.voltage_v,
             "error_flags": self.error_flags,
             "error_description": self.error_description,
+            "params": self.params,
         }
 
 
@@ -126,7 +155,7 @@ def _read_dynamixel(instance: Any) -> list[MotorDiagnostics]:
             hw_error = _safe_read(bus, "Hardware_Error_Status", name)
             if hw_error is not None:
                 diag.error_flags = int(hw_error)
-                diag.error_description = _decode_dxl_errors(diag.error_flags)
+                diag.error_description = decode_dxl_errors(diag.error_flags)
         except Exception as exc:
             logger.debug("Dynamixel read error for motor %s: %s", name, exc)
         results.append(diag)
@@ -134,11 +163,67 @@ def _read_dynamixel(instance: Any) -> list[MotorDiagnostics]:
     return results
 
 
+def find_motor_control(instance: Any) -> MotorControl | None:
+    """Locate the dm_can MotorControl behind a Damiao robot instance.
+
+    Checks the instance, its ``bus`` and their ``control`` /
+    ``motor_control`` / ``_control`` attributes.
+    """
+    candidates = [instance, getattr(instance, "bus", None)]
+    for obj in list(candidates):
+        for attr in ("control", "motor_control", "_control"):
+            candidates.append(getattr(obj, attr, None))
+    return next((c for c in candidates if isinstance(c, MotorControl)), None)
+
+
+def read_damiao_params(
+    instance: Any,
+    rids: tuple[DM_variable, ...] = DAMIAO_DIAGNOSTIC_PARAMS,
+    timeout: float = 0.05,
+) -> dict[int, dict[str, float | None]]:
+    """Read registers from every Damiao motor with one pipelined request burst.
+
+    Args:
+        instance: Connected Damiao robot.
+        rids: Registers to read.
+        timeout: Per-request timeout (seconds).
+
+    Returns:
+        Slave ID -> register name -> value (``None`` if the motor did not
+        answer in time). Empty if no MotorControl is reachable.
+    """
+    control = find_motor_control(instance)
+    if control is None:
+        return {}
+    motors = list({id(m): m for m in control.motors_map.values()}.values())
+    raw = control.read_params(motors, rids, timeout=timeout)
+    return {
+        slave_id: {DM_variable(rid).name: value for rid, value in values.items()}
+        for slave_id, values in raw.items()
+    }
+
+
 def _read_damiao(instance: Any) -> list[MotorDiagnostics]:
     """Read diagnostics from Damiao CAN bus.
 
-    Expects ``instance.motors`` dict with motor state attributes.
+    Expects ``instance.motors`` dict with motor state attributes. Register
+    values are added when the driver's MotorControl is reachable.
     """
+    results = read_damiao_state(instance)
+
+    try:
+        params = read_damiao_params(instance)
+    except Exception as exc:
+        logger.debug("Damiao parameter read failed: %s", exc)
+        params = {}
+    for diag in results:
+        diag.params = params.get(diag.motor_id, {})
+
+    return results
+
+
+def read_damiao_state(instance: Any) -> list[MotorDiagnostics]:
+    """Damiao diagnostics from the driver's cached motor state (no bus I/O)."""
     results: list[MotorDiagnostics] = []
     motors = getattr(instance, "motors", {})
     if not motors:
@@ -167,6 +252,42 @@ def _read_damiao(instance: Any) -> list[MotorDiagnostics]:
     return results
 
 
+def motor_table(instance: Any) -> list[tuple[int, str]]:
+    """Return ``(motor_id, name)`` for every motor on ``instance.bus``.
+
+    Uses ``motor_names`` / ``motor_ids`` like the per-register readers and
+    falls back to the lerobot ``bus.motors`` mapping.
+    """
+    bus = getattr(instance, "bus", None)
+    if bus is None:
+        return []
+    names = list(getattr(instance, "motor_names", getattr(bus, "motor_names", [])))
+    ids = list(getattr(bus, "motor_ids", []))
+    if not names and isinstance(getattr(bus, "motors", None), dict):
+        names = list(bus.motors)
+        ids = [getattr(m, "id", i) for i, m in enumerate(bus.motors.values())]
+    return [(ids[i] if i < len(ids) else i, name) for i, name in enumerate(names)]
+
+
+def bulk_read(bus: Any, register: str, motor_names: list[str]) -> dict[str, float]:
+    """Read one register from many motors, with one ``sync_read`` if possible.
+
+    Falls back to per-motor reads. Motors that fail are left out.
+    """
+    if hasattr(bus, "sync_read"):
+        try:
+            values = bus.sync_read(register, motor_names)
+            return {m: float(values[m]) for m in motor_names if values.get(m) is not None}
+        except Exception as exc:
+            logger.debug("sync_read of %s failed, reading per motor: %s", register, exc)
+    results: dict[str, float] = {}
+    for name in motor_names:
+        value = _safe_read(bus, register, name)
+        if value is not None:
+            results[name] = value
+    return results
+
+
 def _safe_read(bus: Any, register: str, motor_name: str) -> float | None:
     """Attempt to read a single register from the bus.
 
@@ -185,7 +306,7 @@ def _safe_read(bus: Any, register: str, motor_name: str) -> float | None:
     return None
 
 
-def _decode_dxl_errors(flags: int) -> str:
+def decode_dxl_errors(flags: int) -> str:
     """Decode Dynamixel hardware error status register."""
     errors: list[str] = []
     if flags & 0x01:
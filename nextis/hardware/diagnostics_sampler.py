@@ -0,0 +1,323 @@
+"""Low-priority background sampler for motor diagnostics.
+
+DiagnosticsSampler reads temperature, voltage, current, position and error
+flags of every connected arm at a low rate and keeps them in a fixed-size
+per-arm time series, so the API serves snapshots and trends without
+touching the bus.
+
+Feetech and Dynamixel arms are read one register at a time with a single
+``sync_read`` for all motors. Each read takes the arm's bus lock without
+blocking: while the control loop holds it the sampler waits for the next
+idle slot, and after ``max_wait`` skips the register for this cycle and
+carries its previous value forward. Damiao arms are sampled from the driver's cached feedback and
+never touch the bus.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any
+
+import numpy as np
+
+from nextis.control.ticker import RateTicker
+from nextis.hardware.diagnostics import (
+    DYNAMIXEL_REGISTERS,
+    FEETECH_REGISTERS,
+    MotorDiagnostics,
+    bulk_read,
+    decode_dxl_errors,
+    motor_table,
+    read_damiao_state,
+)
+from nextis.hardware.types import MotorType
+
+logger = logging.getLogger(__name__)
+
+# Columns of a diagnostics sample, in storage order
+DIAGNOSTIC_FIELDS = (
+    "position",
+    "velocity",
+    "temperature_c",
+    "current_ma",
+    "voltage_v",
+    "error_flags",
+)
+_FIELD_INDEX = {name: i for i, name in enumerate(DIAGNOSTIC_FIELDS)}
+
+
+class MotorTimeSeries:
+    """Fixed-size ring buffer of diagnostics samples for one arm.
+
+    Samples are ``(motors, fields)`` arrays; values that could not be read
+    are NaN.
+
+    Args:
+        motors: ``(motor_id, name)`` per motor, in column order.
+        capacity: Samples kept before the oldest is overwritten.
+        motor_type: Motor type of the arm (selects error decoding).
+    """
+
+    def __init__(
+        self,
+        motors: list[tuple[int, str]],
+        capacity: int,
+        motor_type: MotorType | None = None,
+    ) -> None:
+        self.motors = list(motors)
+        self.capacity = capacity
+        self.motor_type = motor_type
+        self._times = np.zeros(capacity)
+        self._values = np.full((capacity, len(motors), len(DIAGNOSTIC_FIELDS)), np.nan)
+        self._next = 0
+        self.count = 0
+
+    def append(self, timestamp: float, values: np.ndarray) -> None:
+        """Store one ``(motors, fields)`` sample taken at ``timestamp``."""
+        self._times[self._next] = timestamp
+        self._values[self._next] = values
+        self._next = (self._next + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def last_values(self) -> np.ndarray | None:
+        """Copy of the newest ``(motors, fields)`` sample, or None."""
+        if self.count == 0:
+            return None
+        return self._values[(self._next - 1) % self.capacity].copy()
+
+    def _order(self) -> np.ndarray:
+        """Ring indices of the stored samples, oldest first."""
+        return (np.arange(self.count) + self._next - self.count) % self.capacity
+
+    def latest(self) -> tuple[float, list[MotorDiagnostics]] | None:
+        """Timestamp and per-motor diagnostics of the newest sample."""
+        if self.count == 0:
+            return None
+        i = (self._next - 1) % self.capacity
+        return float(self._times[i]), [
+            self._diagnostics(motor_id, name, self._values[i, m])
+            for m, (motor_id, name) in enumerate(self.motors)
+        ]
+
+    def window(self, seconds: float, now: float | None = None) -> dict[str, Any]:
+        """Samples from the last ``seconds``.
+
+        Returns:
+            ``{"age_s": [...], "motors": {name: {field: [...]}}}`` oldest
+            first; ``age_s`` is seconds before ``now`` and missing values
+            are None.
+        """
+        now = time.perf_counter() if now is None else now
+        order = self._order()
+        order = order[self._times[order] >= now - seconds]
+        values = self._values[order]
+        return {
+            "age_s": [round(float(now - t), 4) for t in self._times[order]],
+            "motors": {
+                name: {
+                    field: _to_list(values[:, m, f]) for f, field in enumerate(DIAGNOSTIC_FIELDS)
+                }
+                for m, (_, name) in enumerate(self.motors)
+            },
+        }
+
+    def _diagnostics(self, motor_id: int, name: str, row: np.ndarray) -> MotorDiagnostics:
+        diag = MotorDiagnostics(motor_id=motor_id, name=name)
+        for field, f in _FIELD_INDEX.items():
+            if field != "error_flags" and not np.isnan(row[f]):
+                setattr(diag, field, float(row[f]))
+        flags = row[_FIELD_INDEX["error_flags"]]
+        if not np.isnan(flags) and flags:
+            diag.error_flags = int(flags)
+            if self.motor_type in (MotorType.DYNAMIXEL_XL330, MotorType.DYNAMIXEL_XL430):
+                diag.error_description = decode_dxl_errors(diag.error_flags)
+            else:
+                diag.error_description = f"Motor error code: {diag.error_flags}"
+        return diag
+
+
+def _to_list(column: np.ndarray) -> list[float | None]:
+    return [None if np.isnan(v) else round(float(v), 4) for v in column]
+
+
+class DiagnosticsSampler:
+    """Samples diagnostics of every connected arm in a background thread.
+
+    Args:
+        registry: ArmRegistryService providing arms, instances and bus locks.
+        frequency: Sampling rate (Hz) per arm.
+        capacity: Samples kept per arm (``capacity / frequency`` seconds).
+        max_wait: Longest wait (seconds) for an idle bus slot per register.
+    """
+
+    def __init__(
+        self,
+        registry: Any,
+        frequency: float = 1.0,
+        capacity: int = 600,
+        max_wait: float = 0.1,
+    ) -> None:
+        self.registry = registry
+        self.frequency = frequency
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self._series: dict[str, MotorTimeSeries] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self.samples: int = 0
+        self.busy_skips: int = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the sampling thread is active."""
+        return self._running
+
+    def start(self) -> None:
+        """Start the sampling thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name="DiagnosticsSampler")
+        self._thread.start()
+        logger.info("Diagnostics sampler started at %.2fHz", self.frequency)
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._running = False
+        if (
+            self._thread
+            and self._thread.is_alive()
+            and self._thread is not threading.current_thread()
+        ):
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def snapshot(self, arm_id: str) -> tuple[float, list[MotorDiagnostics]] | None:
+        """Newest sample of an arm as ``(age seconds, diagnostics)``, or None."""
+        with self._lock:
+            series = self._series.get(arm_id)
+            latest = series.latest() if series is not None else None
+        if latest is None:
+            return None
+        timestamp, diagnostics = latest
+        return time.perf_counter() - timestamp, diagnostics
+
+    def trend(self, arm_id: str, seconds: float) -> dict[str, Any] | None:
+        """Samples of an arm from the last ``seconds``, or None if never sampled."""
+        with self._lock:
+            series = self._series.get(arm_id)
+            return series.window(seconds) if series is not None else None
+
+    def stats(self) -> dict[str, Any]:
+        """Sampling counters."""
+        with self._lock:
+            arms = {arm_id: s.count for arm_id, s in self._series.items()}
+        return {
+            "frequency_hz": self.frequency,
+            "samples": self.samples,
+            "busy_skips": self.busy_skips,
+            "arms": arms,
+        }
+
+    # ── Sampling ───────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        ticker = RateTicker(self.frequency)
+        ticker.start()
+        while self._running:
+            self.sample_all()
+            ticker.wait()
+
+    def sample_all(self) -> None:
+        """Sample every connected arm once and forget disconnected ones."""
+        instances = dict(self.registry.arm_instances)
+        with self._lock:
+            for arm_id in list(self._series):
+                if arm_id not in instances:
+                    del self._series[arm_id]
+        for arm_id, instance in instances.items():
+            if not self._running and self._thread is not None:
+                return
+            arm = self.registry.arms.get(arm_id)
+            if arm is None:
+                continue
+            try:
+                self.sample_arm(arm_id, arm.motor_type, instance)
+            except Exception as e:
+                logger.debug("Diagnostics sample of %s failed: %s", arm_id, e)
+
+    def sample_arm(self, arm_id: str, motor_type: MotorType, instance: Any) -> None:
+        """Take one sample of an arm and append it to its time series."""
+        if motor_type == MotorType.DAMIAO:
+            diagnostics = read_damiao_state(instance)
+            motors = [(d.motor_id, d.name) for d in diagnostics]
+            skipped: list[int] = []
+            values = np.full((len(motors), len(DIAGNOSTIC_FIELDS)), np.nan)
+            for m, diag in enumerate(diagnostics):
+                for field, f in _FIELD_INDEX.items():
+                    value = getattr(diag, field)
+                    if value is not None:
+                        values[m, f] = value
+        else:
+            registers = (
+                FEETECH_REGISTERS if motor_type == MotorType.STS3215 else DYNAMIXEL_REGISTERS
+            )
+            motors = motor_table(instance)
+            values, skipped = self._read_bus(arm_id, instance.bus, motors, registers)
+
+        now = time.perf_counter()
+        with self._lock:
+            series = self._series.get(arm_id)
+            if series is None or series.motors != motors:
+                series = MotorTimeSeries(motors, self.capacity, motor_type)
+                self._series[arm_id] = series
+            previous = series.last_values()
+            if skipped and previous is not None:
+                values[:, skipped] = previous[:, skipped]
+            series.append(now, values)
+        self.samples += 1
+
+    def _read_bus(
+        self,
+        arm_id: str,
+        bus: Any,
+        motors: list[tuple[int, str]],
+        registers: dict[str, str],
+    ) -> tuple[np.ndarray, list[int]]:
+        """Bulk-read each register in an idle bus slot.
+
+        Returns:
+            The ``(motors, fields)`` sample and the field columns skipped
+            because the bus stayed busy.
+        """
+        names = [name for _, name in motors]
+        values = np.full((len(motors), len(DIAGNOSTIC_FIELDS)), np.nan)
+        skipped: list[int] = []
+        lock = self.registry.bus_lock(arm_id)
+        for field, register in registers.items():
+            if not self._acquire_idle(lock):
+                self.busy_skips += 1
+                skipped.append(_FIELD_INDEX[field])
+                continue
+            try:
+                read = bulk_read(bus, register, names)
+            finally:
+                lock.release()
+            f = _FIELD_INDEX[field]
+            for m, name in enumerate(names):
+                if name in read:
+                    values[m, f] = read[name]
+        return values, skipped
+
+    def _acquire_idle(self, lock: Any) -> bool:
+        """Take ``lock`` only when nobody holds it, polling up to ``max_wait``."""
+        deadline = time.perf_counter() + self.max_wait
+        while True:
+            if lock.acquire(blocking=False):
+                return True
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.0005)
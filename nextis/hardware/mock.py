@@ -68,6 +68,12 @@ class MockBus:
     def write_pwm(self, pwm_dict: dict[str, int]) -> None:
         """No-op PWM write."""
 
+    def sync_read(
+        self, register: str, motors: list[str] | None = None, **kwargs: Any
+    ) -> dict[str, int]:
+        """Return zero for every requested motor."""
+        return dict.fromkeys(motors or self.motors, 0)
+
 
 class MockRobot:
     """Fake follower robot that obeys sent commands.
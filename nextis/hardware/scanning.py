@@ -1,17 +1,29 @@
 """Serial port and motor scanning for hardware discovery.
 
-Provides ``scan_ports()`` for enumerating serial/CAN devices and
-``scan_motors()`` for probing motor IDs at various baud rates.
-Port scanning is a separate concern from the registry (which only
-manages known arms).
+Provides ``scan_ports()`` for enumerating serial/CAN devices,
+``scan_motors()`` for probing motor IDs at various baud rates on one port
+and ``iter_scan_motors()`` for sweeping many ports concurrently while
+yielding motors as they are found. Port scanning is a separate concern
+from the registry (which only manages known arms).
 """
 
 from __future__ import annotations
 
 import logging
+import queue
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
+from nextis.hardware.can_transport import (
+    CanTransport,
+    collect_frames,
+    create_transport,
+    param_request,
+)
 from nextis.hardware.types import MotorType
+from nextis.vendor.dm_can import DM_variable
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +38,21 @@ _DEFAULT_BAUDS: dict[MotorType, list[int]] = {
 # Max motor ID to probe (keep scan fast)
 _MAX_SCAN_ID = 20
 
+# How long to collect Damiao replies after the probe burst
+_DAMIAO_SCAN_TIMEOUT_S = 0.1
+
+# How long to collect Dynamixel replies after a broadcast ping
+_DXL_BROADCAST_TIMEOUT_S = 0.1
+
+# Per-ID reply timeout for Feetech pings
+_FEETECH_PING_TIMEOUT_S = 0.02
+
+_DXL_BROADCAST_ID = 0xFE
+_FEETECH_STATUS_LENGTH = 6
+
+# Callback invoked with each motor as soon as it is found
+OnFound = Callable[["DiscoveredMotor"], None]
+
 
 @dataclass
 class PortInfo:
@@ -45,6 +72,7 @@ class DiscoveredMotor:
     motor_type: str
     baud_rate: int
     model_number: int | None = None
+    port: str = ""
 
 
 def scan_ports(configured_ports: set[str] | None = None) -> list[PortInfo]:
@@ -87,6 +115,7 @@ def scan_motors(
     port: str,
     motor_type: MotorType,
     baud_rates: list[int] | None = None,
+    on_found: OnFound | None = None,
 ) -> list[DiscoveredMotor]:
     """Scan a serial port for motors at one or more baud rates.
 
@@ -94,21 +123,35 @@ def scan_motors(
         port: Serial port path (e.g. ``/dev/ttyUSB0``).
         motor_type: Type of motor to scan for.
         baud_rates: Baud rates to try. Defaults per motor type.
+        on_found: Called with each motor (first sighting of its ID) as soon
+            as it answers.
 
     Returns:
         List of discovered motors. Empty on error or if no motors found.
     """
     rates = baud_rates or _DEFAULT_BAUDS.get(motor_type, [1_000_000])
-    results: list[DiscoveredMotor] = []
+    seen: set[int] = set()
+    unique: list[DiscoveredMotor] = []
+
+    def report(motor: DiscoveredMotor) -> None:
+        # Deduplicate by motor_id across baud rates
+        if motor.motor_id in seen:
+            return
+        seen.add(motor.motor_id)
+        motor.port = port
+        unique.append(motor)
+        if on_found is not None:
+            on_found(motor)
 
     for baud in rates:
         try:
             if motor_type in (MotorType.DYNAMIXEL_XL330, MotorType.DYNAMIXEL_XL430):
-                results.extend(_scan_dynamixel(port, baud, motor_type))
+                _scan_dynamixel(port, baud, motor_type, on_found=report)
             elif motor_type == MotorType.STS3215:
-                results.extend(_scan_feetech(port, baud))
+                _scan_feetech(port, baud, on_found=report)
             elif motor_type == MotorType.DAMIAO:
-                results.extend(_scan_damiao(port))
+                for motor in _scan_damiao(port):
+                    report(motor)
                 break  # CAN doesn't use baud rates the same way
         except PermissionError:
             logger.error("Permission denied accessing %s", port)
@@ -116,20 +159,84 @@ def scan_motors(
         except OSError as exc:
             logger.error("Error scanning %s at %d baud: %s", port, baud, exc)
 
-    # Deduplicate by motor_id
-    seen: set[int] = set()
-    unique: list[DiscoveredMotor] = []
-    for m in results:
-        if m.motor_id not in seen:
-            seen.add(m.motor_id)
-            unique.append(m)
-
     logger.info("Motor scan on %s: found %d motors", port, len(unique))
     return unique
 
 
-def _scan_dynamixel(port: str, baud_rate: int, motor_type: MotorType) -> list[DiscoveredMotor]:
-    """Ping Dynamixel motors using Protocol 2.0."""
+def iter_scan_motors(
+    targets: list[tuple[str, MotorType]],
+    baud_rates: list[int] | None = None,
+    max_workers: int | None = None,
+) -> Iterator[DiscoveredMotor]:
+    """Scan many ports concurrently, yielding motors as they are found.
+
+    Each port gets its own worker thread; the motor types listed for one
+    port are scanned one after another on that worker, since a port can
+    only be opened once.
+
+    Args:
+        targets: ``(port, motor_type)`` pairs to scan.
+        baud_rates: Baud rates to try (defaults per motor type).
+        max_workers: Thread pool size. Defaults to one per port.
+
+    Yields:
+        Discovered motors (with ``port`` set) in the order they answer.
+    """
+    by_port: dict[str, list[MotorType]] = {}
+    for port, motor_type in targets:
+        types = by_port.setdefault(port, [])
+        if motor_type not in types:
+            types.append(motor_type)
+    if not by_port:
+        return
+
+    found: queue.Queue[DiscoveredMotor] = queue.Queue()
+
+    def scan_port(port: str) -> None:
+        for motor_type in by_port[port]:
+            scan_motors(port, motor_type, baud_rates, on_found=found.put)
+
+    start = time.perf_counter()
+    count = 0
+    with ThreadPoolExecutor(
+        max_workers=max_workers or len(by_port), thread_name_prefix="motor-scan"
+    ) as pool:
+        futures = [pool.submit(scan_port, port) for port in by_port]
+        while True:
+            try:
+                motor = found.get(timeout=0.01)
+            except queue.Empty:
+                if all(f.done() for f in futures):
+                    break
+                continue
+            count += 1
+            yield motor
+        while not found.empty():
+            count += 1
+            yield found.get_nowait()
+        for future, port in zip(futures, by_port, strict=True):
+            if future.exception() is not None:
+                logger.error("Motor scan on %s failed: %s", port, future.exception())
+
+    logger.info(
+        "Parallel motor scan: %d motors on %d ports in %.2fs",
+        count,
+        len(by_port),
+        time.perf_counter() - start,
+    )
+
+
+def _scan_dynamixel(
+    port: str,
+    baud_rate: int,
+    motor_type: MotorType,
+    on_found: OnFound | None = None,
+) -> list[DiscoveredMotor]:
+    """Find Dynamixel motors with one Protocol 2.0 broadcast ping.
+
+    Every motor answers the broadcast in turn, so the scan costs one reply
+    window instead of a timeout per absent ID.
+    """
     try:
         import serial
     except ImportError:
@@ -137,31 +244,68 @@ def _scan_dynamixel(port: str, baud_rate: int, motor_type: MotorType) -> list[Di
 
     found: list[DiscoveredMotor] = []
     try:
-        with serial.Serial(port, baud_rate, timeout=0.02) as ser:
-            for motor_id in range(_MAX_SCAN_ID + 1):
-                # Dynamixel Protocol 2.0 ping packet
-                packet = _build_dxl2_ping(motor_id)
-                ser.reset_input_buffer()
-                ser.write(packet)
-                response = ser.read(20)
-                if len(response) >= 11 and response[4] == motor_id:
-                    model = (
-                        int.from_bytes(response[9:11], "little") if len(response) >= 13 else None
-                    )
-                    found.append(
-                        DiscoveredMotor(
-                            motor_id=motor_id,
-                            motor_type=motor_type.value,
-                            baud_rate=baud_rate,
-                            model_number=model,
-                        )
+        with serial.Serial(port, baud_rate, timeout=0) as ser:
+            ser.reset_input_buffer()
+            ser.write(_build_dxl2_ping(_DXL_BROADCAST_ID))
+            deadline = time.perf_counter() + _DXL_BROADCAST_TIMEOUT_S
+            buf = b""
+            while time.perf_counter() < deadline:
+                chunk = ser.read(ser.in_waiting or 1)
+                if not chunk:
+                    time.sleep(0.001)
+                    continue
+                buf += chunk
+                replies, consumed = _parse_dxl2_ping_replies(buf)
+                buf = buf[consumed:]
+                for motor_id, model in replies:
+                    if motor_id > _MAX_SCAN_ID:
+                        continue
+                    motor = DiscoveredMotor(
+                        motor_id=motor_id,
+                        motor_type=motor_type.value,
+                        baud_rate=baud_rate,
+                        model_number=model,
                     )
+                    found.append(motor)
+                    if on_found is not None:
+                        on_found(motor)
     except (serial.SerialException, OSError) as exc:
         logger.debug("Dynamixel scan error on %s: %s", port, exc)
 
     return found
 
 
+def _parse_dxl2_ping_replies(data: bytes) -> tuple[list[tuple[int, int]], int]:
+    """Extract ``(motor_id, model_number)`` from Protocol 2.0 ping replies.
+
+    Packets with a bad CRC are skipped.
+
+    Returns:
+        The replies and the number of bytes consumed; the remainder may be
+        the start of an incomplete packet.
+    """
+    replies: list[tuple[int, int]] = []
+    i = 0
+    while True:
+        start = data.find(b"\xff\xff\xfd\x00", i)
+        if start < 0:
+            # Keep a possible partial header
+            return replies, max(i, len(data) - 3)
+        if start + 7 > len(data):
+            return replies, start
+        length = data[start + 5] | (data[start + 6] << 8)
+        end = start + 7 + length
+        if end > len(data):
+            return replies, start
+        packet = data[start:end]
+        crc = packet[-2] | (packet[-1] << 8)
+        if length >= 7 and packet[7] == 0x55 and _crc16_dxl(packet[:-2]) == crc:
+            replies.append((packet[4], packet[9] | (packet[10] << 8)))
+            i = end
+        else:
+            i = start + 1
+
+
 def _build_dxl2_ping(motor_id: int) -> bytes:
     """Build a Dynamixel Protocol 2.0 ping instruction packet."""
     # Header: FF FF FD 00, ID, LEN_L, LEN_H, INST(0x01)
@@ -248,8 +392,17 @@ def _crc16_dxl(data: bytes) -> int:
     return crc
 
 
-def _scan_feetech(port: str, baud_rate: int) -> list[DiscoveredMotor]:
-    """Ping Feetech STS3215 motors."""
+def _scan_feetech(
+    port: str,
+    baud_rate: int,
+    on_found: OnFound | None = None,
+) -> list[DiscoveredMotor]:
+    """Ping Feetech STS3215 motors.
+
+    The SCS protocol has no broadcast ping (every motor would answer at
+    once), so IDs are pinged one at a time; a reply returns as soon as its
+    six bytes arrive and only absent IDs wait out the timeout.
+    """
     try:
         import serial
     except ImportError:
@@ -257,7 +410,7 @@ def _scan_feetech(port: str, baud_rate: int) -> list[DiscoveredMotor]:
 
     found: list[DiscoveredMotor] = []
     try:
-        with serial.Serial(port, baud_rate, timeout=0.02) as ser:
+        with serial.Serial(port, baud_rate, timeout=_FEETECH_PING_TIMEOUT_S) as ser:
             for motor_id in range(_MAX_SCAN_ID + 1):
                 # Feetech protocol: FF FF ID LEN INST(0x01) CHECKSUM
                 length = 2  # instruction + checksum
@@ -265,60 +418,65 @@ def _scan_feetech(port: str, baud_rate: int) -> list[DiscoveredMotor]:
                 packet = bytes([0xFF, 0xFF, motor_id, length, 0x01, checksum])
                 ser.reset_input_buffer()
                 ser.write(packet)
-                response = ser.read(10)
+                response = ser.read(_FEETECH_STATUS_LENGTH)
                 if len(response) >= 6 and response[0] == 0xFF and response[1] == 0xFF:
                     resp_id = response[2]
                     if resp_id == motor_id:
-                        found.append(
-                            DiscoveredMotor(
-                                motor_id=motor_id,
-                                motor_type=MotorType.STS3215.value,
-                                baud_rate=baud_rate,
-                            )
+                        motor = DiscoveredMotor(
+                            motor_id=motor_id,
+                            motor_type=MotorType.STS3215.value,
+                            baud_rate=baud_rate,
                         )
+                        found.append(motor)
+                        if on_found is not None:
+                            on_found(motor)
     except (serial.SerialException, OSError) as exc:
         logger.debug("Feetech scan error on %s: %s", port, exc)
 
     return found
 
 
-def _scan_damiao(port: str) -> list[DiscoveredMotor]:
-    """Scan Damiao CAN bus for motor IDs.
+def _scan_damiao(port: str, transport: CanTransport | None = None) -> list[DiscoveredMotor]:
+    """Scan a Damiao CAN bus for motor IDs.
 
-    Uses SocketCAN if available, otherwise tries serial CAN bridge.
-    """
-    found: list[DiscoveredMotor] = []
+    Sends a parameter read of ``ESC_ID`` to every candidate ID in one write
+    and collects the replies. Unlike an enable frame, a parameter read does
+    not energize the motors.
 
-    # Try SocketCAN first
+    Args:
+        port: CAN interface (``can0``), serial bridge (``/dev/ttyACM0``) or
+            ``sim[:N]`` for the simulated bus.
+        transport: Pre-built transport (overrides ``port``).
+    """
+    rid = int(DM_variable.ESC_ID)
     try:
-        import socket as sock
+        transport = transport or create_transport(port)
+        transport.open()
+    except (OSError, AttributeError, ImportError) as exc:
+        logger.debug("CAN transport not available for %s — skipping Damiao scan: %s", port, exc)
+        return []
 
-        s = sock.socket(sock.AF_CAN, sock.SOCK_RAW, sock.CAN_RAW)
-        s.settimeout(0.1)
-        try:
-            s.bind((port,))
-            # Send broadcast query and collect responses
-            for motor_id in range(_MAX_SCAN_ID + 1):
-                # Damiao enable command: CAN ID = motor_id, data = enable frame
-                can_id = motor_id
-                data = bytes([0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFC])
-                frame = can_id.to_bytes(4, "little") + len(data).to_bytes(4, "little") + data
-                try:
-                    s.send(frame)
-                    resp = s.recv(16)
-                    if resp:
-                        found.append(
-                            DiscoveredMotor(
-                                motor_id=motor_id,
-                                motor_type=MotorType.DAMIAO.value,
-                                baud_rate=1_000_000,
-                            )
-                        )
-                except (OSError, TimeoutError):
-                    continue
-        finally:
-            s.close()
-    except (OSError, AttributeError):
-        logger.debug("SocketCAN not available for %s — skipping Damiao scan", port)
+    found: list[DiscoveredMotor] = []
+    try:
+        transport.read_all()  # drop stale frames
+        transport.write(
+            b"".join(param_request(motor_id, rid) for motor_id in range(1, _MAX_SCAN_ID + 1))
+        )
+        frames = collect_frames(transport, timeout=_DAMIAO_SCAN_TIMEOUT_S)
+        replies = frames[(frames[:, 1] == 0x11) & (frames[:, 9] == 0x33) & (frames[:, 10] == rid)]
+        ids = sorted({int(f[7]) | (int(f[8]) << 8) for f in replies})
+        found = [
+            DiscoveredMotor(
+                motor_id=motor_id,
+                motor_type=MotorType.DAMIAO.value,
+                baud_rate=1_000_000,
+            )
+            for motor_id in ids
+            if 0 < motor_id <= _MAX_SCAN_ID
+        ]
+    except OSError as exc:
+        logger.debug("Damiao scan error on %s: %s", port, exc)
+    finally:
+        transport.close()
 
     return found
@@ -17,6 +17,8 @@ from pathlib import Path
 
 import numpy as np
 
+from nextis.control.telemetry import TelemetrySnapshot
+from nextis.control.ticker import RateTicker
 from nextis.errors import RecordingError
 
 logger = logging.getLogger(__name__)
@@ -32,6 +34,8 @@ except ImportError:
 
 DEFAULT_DATA_DIR = Path(__file__).resolve().parents[2] / "data" / "demos"
 RECORDING_HZ = 50
+# Shared telemetry older than this is considered stale (teleop not reading it)
+MAX_TELEMETRY_AGE_S = 0.1
 
 
 @dataclass
@@ -90,6 +94,7 @@ class DemoRecorder:
         self._is_recording = False
         self._thread: threading.Thread | None = None
         self._start_time: float = 0.0
+        self._ticker = RateTicker(RECORDING_HZ)
 
         # Generate unique demo id + output path
         self._timestamp = time.time()
@@ -123,6 +128,7 @@ class DemoRecorder:
         action_fn: Callable[[], dict[str, float]],
         torque_fn: Callable[[], dict[str, float]] | None = None,
         camera_fn: Callable[[str], np.ndarray | None] | None = None,
+        telemetry_fn: Callable[[], TelemetrySnapshot | None] | None = None,
     ) -> None:
         """Begin recording in a background thread.
 
@@ -131,6 +137,10 @@ class DemoRecorder:
             action_fn: Returns latest teleop action dict.
             torque_fn: Optional — returns force/torque readings.
             camera_fn: Optional — called with camera_key, returns BGR frame.
+            telemetry_fn: Optional — returns the teleop loop's latest
+                telemetry snapshot. When fresh, positions and torques come
+                from it instead of separate bus reads; robot_state_fn and
+                torque_fn are only used as a fallback.
 
         Raises:
             RecordingError: If already recording.
@@ -144,7 +154,7 @@ class DemoRecorder:
 
         self._thread = threading.Thread(
             target=self._record_loop,
-            args=(robot_state_fn, action_fn, torque_fn, camera_fn),
+            args=(robot_state_fn, action_fn, torque_fn, camera_fn, telemetry_fn),
             daemon=True,
             name=f"Recorder-{self._step_id}",
         )
@@ -213,16 +223,22 @@ class DemoRecorder:
         action_fn: Callable[[], dict[str, float]],
         torque_fn: Callable[[], dict[str, float]] | None,
         camera_fn: Callable[[str], np.ndarray | None] | None,
+        telemetry_fn: Callable[[], TelemetrySnapshot | None] | None,
     ) -> None:
-        """Background capture loop at 50 Hz."""
-        dt = 1.0 / RECORDING_HZ
+        """Background capture loop at 50 Hz on absolute deadlines."""
+        ticker = self._ticker
+        ticker.start()
 
         while self._is_recording:
-            loop_start = time.perf_counter()
             try:
-                obs = robot_state_fn()
+                snapshot = telemetry_fn() if telemetry_fn else None
+                if snapshot is not None and snapshot.age <= MAX_TELEMETRY_AGE_S:
+                    obs = snapshot.positions
+                    torques = snapshot.torques
+                else:
+                    obs = robot_state_fn()
+                    torques = torque_fn() if torque_fn else {}
                 action = action_fn()
-                torques = torque_fn() if torque_fn else {}
 
                 gripper_val = 0.0
                 for k, v in obs.items():
@@ -255,8 +271,7 @@ class DemoRecorder:
                 if len(self._frames) % RECORDING_HZ == 0:
                     logger.warning("Recording frame error: %s", e)
 
-            elapsed = time.perf_counter() - loop_start
-            time.sleep(max(0, dt - elapsed))
+            ticker.wait()
 
     def _flush_to_hdf5(self) -> None:
         """Write buffered frames to an HDF5 file."""
@@ -280,6 +295,9 @@ class DemoRecorder:
             f.attrs["num_frames"] = n
             f.attrs["recording_hz"] = RECORDING_HZ
             f.attrs["timestamp"] = self._timestamp
+            timing = self._ticker.stats()
+            f.attrs["timing_overruns"] = timing["overruns"]
+            f.attrs["timing_jitter_p99_ms"] = timing["jitter_p99_ms"]
 
             f.create_dataset(
                 "timestamps",
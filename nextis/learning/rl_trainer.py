@@ -22,10 +22,11 @@ from nextis.assembly.models import AssemblyStep
 from nextis.control.intervention import InterventionDetector
 from nextis.control.motion_helpers import (
     JOINT_COUNT,
+    JOINT_ORDER,
     joints_to_action,
     obs_to_joints,
-    read_torques_list,
 )
+from nextis.control.telemetry import TelemetryReader, TelemetrySnapshot
 from nextis.learning.policy_loader import Policy
 from nextis.learning.replay_buffer import ReplayBuffer, Transition
 from nextis.learning.reward import StepRewardComputer
@@ -285,7 +286,9 @@ class StepRLTrainer:
         force_history: list[float] = []
 
         # Get initial observation
-        obs_list = obs_to_joints(self._robot.get_observation())
+        telemetry = TelemetryReader(self._robot)
+        snapshot = self._read_telemetry(telemetry)
+        obs_list = obs_to_joints(snapshot.positions)
         obs_array = np.array(obs_list, dtype=np.float32)
 
         for _tick in range(self._config.max_steps_per_episode):
@@ -293,11 +296,11 @@ class StepRLTrainer:
                 break
 
             # Check for human intervention
-            is_intervening = self._detector.check(self._leader)
+            is_intervening = self._detector.check(self._leader, snapshot=snapshot)
 
             if is_intervening:
-                # Use leader action
-                leader_obs = self._leader.get_action()
+                # Use leader action (already read into this tick's snapshot)
+                leader_obs = snapshot.leader_positions or self._leader.get_action()
                 action_list = obs_to_joints(leader_obs)
                 action_array = np.array(action_list, dtype=np.float32)
                 interventions += 1
@@ -314,8 +317,9 @@ class StepRLTrainer:
             # Send to robot
             self._robot.send_action(joints_to_action(safe_list))
 
-            # Read telemetry
-            torques = read_torques_list(self._robot)
+            # Read telemetry once: torques, next observation and leader state
+            snapshot = self._read_telemetry(telemetry)
+            torques = [snapshot.torques.get(name, 0.0) for name in JOINT_ORDER]
             peak_torque = max(abs(t) for t in torques) if torques else 0.0
             force_history.append(peak_torque)
 
@@ -326,7 +330,7 @@ class StepRLTrainer:
             total_reward += dense
 
             # Next observation
-            next_obs_list = obs_to_joints(self._robot.get_observation())
+            next_obs_list = obs_to_joints(snapshot.positions)
             next_obs_array = np.array(next_obs_list, dtype=np.float32)
 
             # Store transition
@@ -373,6 +377,23 @@ class StepRLTrainer:
 
         return total_reward, len(force_history), interventions, success
 
+    def _read_telemetry(self, reader: TelemetryReader) -> TelemetrySnapshot:
+        """Read follower telemetry plus the leader's position for this tick.
+
+        Args:
+            reader: Per-episode telemetry reader for the follower.
+
+        Returns:
+            Snapshot shared by reward, observation and intervention checks.
+        """
+        leader_obs: dict[str, float] | None = None
+        if self._leader:
+            try:
+                leader_obs = self._leader.get_action()
+            except Exception as e:
+                logger.debug("Leader read failed: %s", e)
+        return reader.read(leader_obs)
+
     def _do_sac_updates(self, num_updates: int) -> dict[str, float]:
         """Perform SAC gradient updates between episodes.
 
@@ -15,9 +15,11 @@ from nextis.config import CONFIG_PATH, _resolve_config_path, load_config
 
 if TYPE_CHECKING:
     from nextis.cameras.service import CameraService
+    from nextis.control.teleop_engine import TeleopEngine
     from nextis.control.teleop_loop import TeleopLoop
     from nextis.hardware.arm_registry import ArmRegistryService
     from nextis.hardware.calibration import CalibrationManager
+    from nextis.hardware.diagnostics_sampler import DiagnosticsSampler
     from nextis.learning.recorder import DemoRecorder
     from nextis.tools.registry import ToolRegistryService
 
@@ -51,10 +53,11 @@ class SystemState:
         self._calibration_manager: CalibrationManager | None = None
         self._camera_service: CameraService | None = None
         self._tool_registry: ToolRegistryService | None = None
+        self._diagnostics_sampler: DiagnosticsSampler | None = None
         self._config_data: dict = {}
 
         # Mutable — set by route handlers
-        self._teleop_loop: TeleopLoop | None = None
+        self._teleop_engine: TeleopEngine | None = None
         self._recorder: DemoRecorder | None = None
         self._teleop_session_id: str | None = None
         self._teleop_session_arms: list[str] = []
@@ -101,16 +104,28 @@ class SystemState:
         """Active tool/trigger registry, or ``None`` if not initialized."""
         return self._tool_registry
 
+    @property
+    def diagnostics_sampler(self) -> DiagnosticsSampler | None:
+        """Background motor diagnostics sampler, or ``None`` if disabled."""
+        return self._diagnostics_sampler
+
     # --- Mutable properties (set by route handlers) ---
 
     @property
-    def teleop_loop(self) -> TeleopLoop | None:
-        """Active teleop loop, or None."""
-        return self._teleop_loop
+    def teleop_engine(self) -> TeleopEngine | None:
+        """Active multi-pairing teleop engine, or None."""
+        return self._teleop_engine
+
+    @teleop_engine.setter
+    def teleop_engine(self, value: TeleopEngine | None) -> None:
+        self._teleop_engine = value
 
-    @teleop_loop.setter
-    def teleop_loop(self, value: TeleopLoop | None) -> None:
-        self._teleop_loop = value
+    @property
+    def teleop_loop(self) -> TeleopLoop | None:
+        """Primary pairing's teleop loop, or None if no engine is active."""
+        if self._teleop_engine is None:
+            return None
+        return self._teleop_engine.primary
 
     @property
     def recorder(self) -> DemoRecorder | None:
@@ -163,6 +178,7 @@ class SystemState:
             self._init_calibration_manager()
             self._init_camera_service()
             self._init_tool_registry()
+            self._init_diagnostics_sampler()
 
             with self._lock:
                 self._phase = SystemPhase.READY
@@ -226,7 +242,14 @@ class SystemState:
                 )
             )
 
-        self._camera_service = CameraService(configs)
+        bus_cfg = self._config_data.get("camera_bus") or {}
+        self._camera_service = CameraService(
+            configs,
+            shared_memory_prefix=(
+                bus_cfg.get("prefix", "nextis-cam") if bus_cfg.get("enabled", False) else None
+            ),
+            shared_memory_slots=int(bus_cfg.get("slots", 4)),
+        )
         self._camera_service.start()
         logger.info("CameraService initialized with %d cameras", len(configs))
 
@@ -246,6 +269,20 @@ class SystemState:
         if tool_count or trigger_count:
             logger.info("ToolRegistry: %d tools, %d triggers", tool_count, trigger_count)
 
+    def _init_diagnostics_sampler(self) -> None:
+        """Start the background diagnostics sampler from the diagnostics config."""
+        from nextis.hardware.diagnostics_sampler import DiagnosticsSampler
+
+        cfg = self._config_data.get("diagnostics") or {}
+        if not cfg.get("enabled", True) or self._arm_registry is None:
+            return
+        self._diagnostics_sampler = DiagnosticsSampler(
+            self._arm_registry,
+            frequency=float(cfg.get("sample_hz", 1.0)),
+            capacity=int(cfg.get("history", 600)),
+        )
+        self._diagnostics_sampler.start()
+
     def shutdown(self) -> None:
         """Gracefully shut down all services."""
         with self._lock:
@@ -253,13 +290,17 @@ class SystemState:
                 return
             self._phase = SystemPhase.SHUTTING_DOWN
 
-        if self._teleop_loop is not None:
+        if self._teleop_engine is not None:
             try:
-                if self._teleop_loop.is_running:
-                    self._teleop_loop.stop()
+                if self._teleop_engine.is_running:
+                    self._teleop_engine.stop()
             except Exception as exc:
                 logger.error("Error stopping teleop: %s", exc)
-            self._teleop_loop = None
+            self._teleop_engine = None
+
+        if self._diagnostics_sampler is not None:
+            self._diagnostics_sampler.stop()
+            self._diagnostics_sampler = None
 
         if self._recorder is not None:
             try:
@@ -289,11 +330,10 @@ class SystemState:
                     logger.error("Error disconnecting trigger %s: %s", trigger_id, exc)
 
         if self._arm_registry is not None:
-            for arm_id in list(self._arm_registry.arm_instances.keys()):
-                try:
-                    self._arm_registry.disconnect_arm(arm_id)
-                except Exception as exc:
-                    logger.error("Error disconnecting arm %s: %s", arm_id, exc)
+            try:
+                self._arm_registry.disconnect_all()
+            except Exception as exc:
+                logger.error("Error disconnecting arms: %s", exc)
 
         self._calibration_manager = None
 
@@ -317,7 +357,7 @@ class SystemState:
         }
         if self._arm_registry is not None:
             status.update(self._arm_registry.get_status_summary())
-        status["teleopActive"] = self._teleop_loop is not None and self._teleop_loop.is_running
+        status["teleopActive"] = self._teleop_engine is not None and self._teleop_engine.is_running
         status["recording"] = self._recorder is not None and self._recorder.is_recording
         status["camerasConnected"] = (
             len(self._camera_service.connected_keys) if self._camera_service else 0
@@ -332,8 +372,11 @@ class SystemState:
         self._calibration_manager = None
         self._camera_service = None
         self._tool_registry = None
+        if self._diagnostics_sampler is not None:
+            self._diagnostics_sampler.stop()
+        self._diagnostics_sampler = None
         self._config_data = {}
-        self._teleop_loop = None
+        self._teleop_engine = None
         self._recorder = None
         self._teleop_session_id = None
         self._teleop_session_arms = []
@@ -0,0 +1,125 @@
+"""Microbenchmark: vectorized dm_can frame parser vs. the original scalar one.
+
+Usage:
+    python scripts/bench_dm_can_parser.py
+    python scripts/bench_dm_can_parser.py --frames 4000 --motors 7 --repeat 50
+
+Builds a receive buffer of MIT feedback frames (with some line noise between
+them) and times ``MotorControl.process_frames`` against a copy of the
+byte-by-byte ``__extract_packets`` + per-frame ``__process_packet`` decoder the
+driver used before. Both parsers must agree on the final motor states.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+sys.path.insert(0, PROJECT_ROOT)
+
+from nextis.vendor.dm_can import (  # noqa: E402
+    DM_Motor_Type,
+    Motor,
+    MotorControl,
+    uint_to_float,
+)
+
+
+class _NullSerial:
+    is_open = False
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _legacy_parse(control: MotorControl, data: bytes) -> None:
+    """The scalar parser as it was before vectorization."""
+    frames = []
+    i = 0
+    while i <= len(data) - 16:
+        if data[i] == 0xAA and data[i + 15] == 0x55:
+            frames.append(data[i : i + 16])
+            i += 16
+        else:
+            i += 1
+    for packet in frames:
+        data_ = packet[7:15]
+        can_id = (packet[6] << 24) | (packet[5] << 16) | (packet[4] << 8) | packet[3]
+        if packet[1] != 0x11:
+            continue
+        key = can_id if can_id != 0 else data_[0] & 0x0F
+        if key not in control.motors_map:
+            continue
+        q_uint = np.uint16((np.uint16(data_[1]) << 8) | data_[2])
+        dq_uint = np.uint16((np.uint16(data_[3]) << 4) | (data_[4] >> 4))
+        tau_uint = np.uint16(((data_[4] & 0xF) << 8) | data_[5])
+        motor = control.motors_map[key]
+        q_max, dq_max, tau_max = control.Limit_Param[motor.MotorType]
+        motor.recv_data(
+            uint_to_float(q_uint, -q_max, q_max, 16),
+            uint_to_float(dq_uint, -dq_max, dq_max, 12),
+            uint_to_float(tau_uint, -tau_max, tau_max, 12),
+        )
+
+
+def _make_stream(n_frames: int, n_motors: int, rng: np.random.Generator) -> bytes:
+    out = bytearray()
+    for k in range(n_frames):
+        master = 0x11 + k % n_motors
+        payload = rng.integers(0, 256, 8, dtype=np.uint8)
+        payload[0] = master & 0x0F
+        out += bytes([0xAA, 0x11, 0x08, master, 0, 0, 0, *payload.tolist(), 0x55])
+        if k % 17 == 0:
+            out += b"\x00\x13"  # line noise
+    return bytes(out)
+
+
+def _controller(n_motors: int) -> MotorControl:
+    control = MotorControl(_NullSerial())
+    types = list(DM_Motor_Type)
+    for i in range(n_motors):
+        control.addMotor(Motor(types[i % len(types)], 0x01 + i, 0x11 + i))
+    return control
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="dm_can frame parser microbenchmark")
+    parser.add_argument("--frames", type=int, default=2000, help="Frames per buffer")
+    parser.add_argument("--motors", type=int, default=7, help="Motors on the bus")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions (best of)")
+    args = parser.parse_args()
+
+    stream = _make_stream(args.frames, args.motors, np.random.default_rng(0))
+    legacy, vectorized = _controller(args.motors), _controller(args.motors)
+
+    t_legacy = _time(lambda: _legacy_parse(legacy, stream), args.repeat)
+    t_vector = _time(lambda: vectorized.process_frames(stream), args.repeat)
+
+    for a, b in zip(legacy.motors_map.values(), vectorized.motors_map.values(), strict=True):
+        assert (a.state_q, a.state_dq, a.state_tau) == (b.state_q, b.state_dq, b.state_tau)
+
+    print(f"{args.frames} frames, {len(stream)} bytes, {args.motors} motors")
+    print(f"  scalar     {t_legacy * 1e3:8.3f} ms  ({args.frames / t_legacy:,.0f} frames/s)")
+    print(f"  vectorized {t_vector * 1e3:8.3f} ms  ({args.frames / t_vector:,.0f} frames/s)")
+    print(f"  speedup    {t_legacy / t_vector:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Microbenchmark: TorqueTrendPredictor.update cost per sample.
+
+Usage:
+    python scripts/bench_torque_trend.py
+    python scripts/bench_torque_trend.py --joints 14 --samples 5000 --repeat 10
+
+Feeds random torque samples through the predictor and reports the best
+per-update time. The safety path runs this once per control tick, so it
+should stay well under 1 ms for a two-arm setup.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+sys.path.insert(0, PROJECT_ROOT)
+
+from nextis.control.torque_trend import TorqueTrendPredictor  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Torque trend update microbenchmark")
+    parser.add_argument("--joints", type=int, default=14, help="Motors per update")
+    parser.add_argument("--samples", type=int, default=2000, help="Updates per run")
+    parser.add_argument("--repeat", type=int, default=10, help="Timing repetitions (best of)")
+    args = parser.parse_args()
+    logging.getLogger("nextis").setLevel(logging.ERROR)  # random torques trip slowdowns
+
+    samples = np.random.default_rng(3).normal(0, 1, size=(args.samples, args.joints))
+    best = float("inf")
+    for _ in range(args.repeat):
+        trend = TorqueTrendPredictor(
+            [f"m{i}" for i in range(args.joints)], np.full(args.joints, 5.0)
+        )
+        start = time.perf_counter()
+        for k, torques in enumerate(samples):
+            trend.update(k / 60, torques)
+        best = min(best, time.perf_counter() - start)
+
+    per_update = best / args.samples
+    print(f"{args.joints} joints, {args.samples} updates")
+    print(f"  {per_update * 1e6:8.1f} us/update  ({1 / per_update:,.0f} updates/s)")
+
+
+if __name__ == "__main__":
+    main()
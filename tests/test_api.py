@@ -7,6 +7,7 @@ isolating each test from real data on disk.
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 
 import pytest
@@ -109,6 +110,31 @@ def test_health(isolated_app: TestClient) -> None:
     assert r.json() == {"status": "ok"}
 
 
+# ------------------------------------------------------------------
+# Teleop routes
+# ------------------------------------------------------------------
+
+
+def test_teleop_metrics_mock_session(isolated_app: TestClient) -> None:
+    r = isolated_app.get("/teleop/metrics")
+    assert r.status_code == 200
+    assert r.json()["active"] is False
+
+    r = isolated_app.post("/teleop/start?mock=true", json={})
+    assert r.status_code == 200
+    try:
+        time.sleep(0.2)
+        data = isolated_app.get("/teleop/metrics").json()
+        assert data["active"] is True
+        assert data["ticks"] > 0
+        assert data["stages"]["leader_read"]["count"] > 0
+        assert "p99Ms" in data["stages"]["tick"]
+        assert data["pairings"]["mock"]["ticks"] > 0
+        assert isolated_app.get("/teleop/state").json()["pairings"] == ["mock"]
+    finally:
+        isolated_app.post("/teleop/stop")
+
+
 # ------------------------------------------------------------------
 # Assembly routes
 # ------------------------------------------------------------------
@@ -0,0 +1,174 @@
+"""Tests for parallel arm connection and warm reconnect in ArmRegistryService."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from nextis.hardware import arm_registry
+from nextis.hardware.arm_registry import ArmRegistryService
+from nextis.hardware.types import ArmDefinition, ArmRole, ConnectionStatus
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+class _FakeBus:
+    def __init__(self, torque: dict[str, int] | None = None) -> None:
+        self.motors = torque or {"base": 1, "link1": 1}
+
+    @property
+    def torque(self) -> bool:
+        return all(self.motors.values())
+
+    def enable_torque(self, motors: list[str] | None = None) -> None:
+        for name in motors or list(self.motors):
+            self.motors[name] = 1
+
+    def disable_torque(self) -> None:
+        self.motors = dict.fromkeys(self.motors, 0)
+
+    def sync_read(self, data_name: str, normalize: bool = True) -> dict[str, int]:
+        assert data_name == "Torque_Enable" and not normalize
+        return dict(self.motors)
+
+
+class _FakeArm:
+    """Instance that takes a while to build, like a real bus + calibration."""
+
+    def __init__(self, arm: ArmDefinition) -> None:
+        self.port = arm.port
+        if arm.role == ArmRole.LEADER:
+            # Hand-guided: torque off except the gripper, as after a cold connect
+            self.bus = _FakeBus({"base": 0, "link1": 0, "gripper": 1})
+        else:
+            self.bus = _FakeBus()
+        self.is_connected = True
+        self.connects = 1
+
+    def connect(self, calibrate: bool = True) -> None:
+        self.is_connected = True
+        self.connects += 1
+
+    def disconnect(self) -> None:
+        self.is_connected = False
+
+
+@pytest.fixture()
+def registry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[ArmRegistryService, list]:
+    config = {
+        "arms": {
+            arm_id: {"role": role, "motor_type": "sts3215", "port": f"/dev/tty{arm_id}"}
+            for arm_id, role in (
+                ("ll", "leader"),
+                ("lf", "follower"),
+                ("rl", "leader"),
+                ("rf", "follower"),
+                ("spare", "follower"),
+            )
+        },
+        "pairings": [{"leader": "ll", "follower": "lf"}, {"leader": "rl", "follower": "rf"}],
+    }
+    path = tmp_path / "settings.yaml"
+    path.write_text(yaml.safe_dump(config))
+    created: list[_FakeArm] = []
+
+    def create(arm: ArmDefinition) -> Any:
+        time.sleep(0.1)
+        created.append(_FakeArm(arm))
+        return created[-1]
+
+    monkeypatch.setattr(arm_registry, "create_arm_instance", create)
+    return ArmRegistryService(path), created
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_connect_many_connects_paired_arms_in_parallel(registry) -> None:
+    reg, created = registry
+    start = time.perf_counter()
+    results = reg.connect_many()
+    elapsed = time.perf_counter() - start
+
+    assert sorted(results) == ["lf", "ll", "rf", "rl"]
+    assert all(r["success"] and not r["warm"] for r in results.values())
+    assert elapsed < 0.3  # four 0.1 s connects overlapped
+    assert reg.arm_status["spare"] == ConnectionStatus.DISCONNECTED
+    # Already connected arms are not opened twice
+    assert reg.connect_many(["ll"]) == {"ll": {"success": True, "status": "connected"}}
+    assert len(created) == 4
+
+
+def test_warm_disconnect_parks_and_reuses_instance(registry) -> None:
+    reg, created = registry
+    reg.connect_arm("lf")
+    instance = reg.get_arm_instance("lf")
+
+    reg.disconnect_arm("lf", keep_warm=True)
+    assert reg.arm_status["lf"] == ConnectionStatus.DISCONNECTED
+    assert instance.is_connected and not instance.bus.torque
+
+    result = reg.connect_arm("lf")
+    assert result["warm"] is True
+    assert reg.get_arm_instance("lf") is instance
+    assert instance.bus.torque and instance.connects == 1
+    assert len(created) == 1
+
+    # A cold disconnect closes the port and forgets the instance
+    reg.disconnect_arm("lf")
+    assert not instance.is_connected
+    assert reg.connect_arm("lf")["warm"] is False
+    assert len(created) == 2
+
+
+def test_warm_reconnect_restores_leader_torque(registry) -> None:
+    """A parked leader comes back hand-movable, not stiff on every joint."""
+    reg, _ = registry
+    reg.connect_arm("ll")
+    leader = reg.get_arm_instance("ll")
+
+    reg.disconnect_arm("ll", keep_warm=True)
+    assert leader.bus.motors == {"base": 0, "link1": 0, "gripper": 0}
+
+    assert reg.connect_arm("ll")["warm"] is True
+    assert leader.bus.motors == {"base": 0, "link1": 0, "gripper": 1}
+
+    # A bus that cannot report torque leaves the leader limp
+    def no_torque_register(*args: Any, **kwargs: Any) -> dict[str, int]:
+        raise NotImplementedError
+
+    leader.bus.sync_read = no_torque_register
+    reg.disconnect_arm("ll", keep_warm=True)
+    reg.connect_arm("ll")
+    assert leader.bus.motors == {"base": 0, "link1": 0, "gripper": 0}
+
+
+def test_estop_release_reconnects_in_place(registry) -> None:
+    reg, created = registry
+    reg.connect_many(["ll", "lf"])
+    follower = reg.get_arm_instance("lf")
+    follower.disconnect()  # what the E-stop does
+
+    assert reg.release_after_estop([follower]) == ["lf"]
+    assert reg.arm_status["lf"] == ConnectionStatus.DISCONNECTED
+    assert reg.arm_status["ll"] == ConnectionStatus.CONNECTED
+
+    results = reg.connect_many(["ll", "lf"])
+    assert results["lf"]["warm"] is True
+    assert reg.get_arm_instance("lf") is follower
+    assert follower.is_connected and follower.connects == 2
+    assert len(created) == 2
+
+    # A changed port invalidates the warm instance
+    reg.disconnect_arm("lf", keep_warm=True)
+    reg.arms["lf"].port = "/dev/ttyNEW"
+    assert reg.connect_arm("lf")["warm"] is False
+    assert not follower.is_connected
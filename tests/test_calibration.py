@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from nextis.errors import CalibrationError
-from nextis.hardware.calibration import CalibrationManager, CalibrationProfile
+from nextis.hardware.calibration import CalibrationManager, CalibrationProfile, RangeAccumulator
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -288,3 +291,118 @@ def test_delete_nonexistent_raises(tmp_path: Path) -> None:
     mgr = CalibrationManager(config_dir=tmp_path)
     with pytest.raises(CalibrationError):
         mgr.delete_profile("nonexistent")
+
+
+# ---------------------------------------------------------------------------
+# Simultaneous range discovery
+# ---------------------------------------------------------------------------
+
+
+def test_range_accumulator_tracks_min_max_and_coverage() -> None:
+    """All joints accumulate at once; histograms re-bin as ranges grow."""
+    acc = RangeAccumulator(["a.pos", "b.pos"], bins=10)
+    for i, a in enumerate(np.linspace(0.0, 1.0, 50)):
+        acc.add(np.array([a, np.nan if i % 2 else 5.0]), now=float(i))
+
+    assert acc.ranges() == {"a.pos": {"min": 0.0, "max": 1.0}, "b.pos": {"min": 5.0, "max": 5.0}}
+    coverage = acc.coverage()
+    assert coverage[0] == pytest.approx(1.0)
+    assert coverage[1] == 0.0  # never moved
+    assert acc.samples.tolist() == [50, 25]
+    assert acc.hist[0].sum() == 50
+
+    # 'a' kept growing until the last sample; 'b' never moved, so never settles
+    assert acc.unmoved() == ["b.pos"]
+    assert not acc.settled(now=50.0, settle_time=2.0)
+    assert not acc.settled(now=52.0, settle_time=2.0)
+    assert not acc.joint_status(now=52.0, settle_time=2.0)["b.pos"]["settled"]
+
+    for i, b in enumerate(np.linspace(5.0, 6.0, 20)):
+        acc.add(np.array([np.nan, b]), now=60.0 + i * 0.1)
+    assert acc.unmoved() == []
+    assert not acc.settled(now=62.0, settle_time=2.0)
+    assert acc.settled(now=64.0, settle_time=2.0)
+
+
+def test_range_accumulator_ignores_encoder_jitter() -> None:
+    """A static joint flickering between neighbouring ticks does not count as moved."""
+    acc = RangeAccumulator(["a.pos"])
+    for i in range(200):
+        acc.add(np.array([100.0 + 0.088 * (i % 3)]), now=i * 0.01)
+    assert acc.unmoved() == ["a.pos"]
+    assert not acc.settled(now=10.0, settle_time=2.0)
+
+
+def test_simultaneous_discovery_finishes_when_ranges_settle(tmp_path: Path) -> None:
+    """Discovery samples every joint and exits early once nothing grows."""
+    start = time.perf_counter()
+
+    class SweepingArm:
+        def get_observation(self) -> dict[str, float]:
+            t = min(time.perf_counter() - start, 0.2)  # operator stops after 0.2 s
+            return {"base.pos": -10.0 * t, "link1.pos": 20.0 * t, "gripper.pos": 5.0 * t}
+
+    mgr = CalibrationManager(config_dir=tmp_path)
+    mgr.start_range_discovery(
+        "arm", SweepingArm(), simultaneous=True, settle_time=0.3, max_duration=5.0
+    )
+    while mgr.get_range_discovery_status("arm")["phase"] == "running":
+        time.sleep(0.02)
+    elapsed = time.perf_counter() - start
+
+    status = mgr.get_range_discovery_status("arm")
+    assert status["phase"] == "complete"
+    assert status["mode"] == "simultaneous"
+    assert status["joints"]["link1.pos"]["samples"] > 10
+    assert elapsed < 2.0
+    ranges = mgr.load("arm").ranges
+    assert ranges["base.pos"]["min"] == pytest.approx(-2.0)
+    assert ranges["link1.pos"]["max"] == pytest.approx(4.0)
+    assert ranges["gripper.pos"]["max"] == pytest.approx(1.0)
+
+
+def test_discovery_on_static_joint_keeps_stored_ranges(tmp_path: Path) -> None:
+    """A joint that never moves fails discovery instead of saving a zero-width range."""
+    mgr = CalibrationManager(config_dir=tmp_path)
+    stored = {"base.pos": {"min": -90.0, "max": 90.0}, "gripper.pos": {"min": 0.0, "max": 100.0}}
+    mgr.save(CalibrationProfile(arm_id="arm", ranges=stored))
+    start = time.perf_counter()
+
+    class StaticGripperArm:
+        def get_observation(self) -> dict[str, float]:
+            t = min(time.perf_counter() - start, 0.2)
+            return {"base.pos": -10.0 * t, "gripper.pos": 40.0}
+
+    mgr.start_range_discovery(
+        "arm", StaticGripperArm(), simultaneous=True, settle_time=0.1, max_duration=0.5
+    )
+    while mgr.get_range_discovery_status("arm")["phase"] == "running":
+        time.sleep(0.02)
+
+    status = mgr.get_range_discovery_status("arm")
+    assert status["phase"] == "error"
+    assert "gripper.pos" in status["error"]
+    assert mgr.load("arm").ranges == stored
+
+
+def test_range_discovery_reads_under_bus_lock(tmp_path: Path) -> None:
+    """Every discovery read holds the arm's bus lock shared with the sampler."""
+    lock = threading.Lock()
+    unlocked_reads = []
+    start = time.perf_counter()
+
+    class SweepingArm:
+        def get_observation(self) -> dict[str, float]:
+            if not lock.locked():
+                unlocked_reads.append(time.perf_counter())
+            return {"base.pos": 10.0 * min(time.perf_counter() - start, 0.2)}
+
+    mgr = CalibrationManager(config_dir=tmp_path)
+    mgr.start_range_discovery(
+        "arm", SweepingArm(), simultaneous=True, settle_time=0.3, max_duration=5.0, bus_lock=lock
+    )
+    while mgr.get_range_discovery_status("arm")["phase"] == "running":
+        time.sleep(0.02)
+
+    assert mgr.get_range_discovery_status("arm")["phase"] == "complete"
+    assert unlocked_reads == []
@@ -0,0 +1,241 @@
+"""Tests for camera frame buffering (no camera hardware needed)."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+import numpy as np
+import pytest
+
+from nextis.cameras.frame_ring import FrameRing
+from nextis.cameras.service import CameraConfig, CameraService, CameraStatus
+from nextis.cameras.shm_bus import SharedFrameReader
+from nextis.errors import CameraError
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+class _FakeCapture:
+    """OpenCV-like capture that fills the given buffer in place."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.allocations = 0
+
+    def read(self, image: np.ndarray | None = None) -> tuple[bool, np.ndarray]:
+        self.count += 1
+        if image is None:
+            self.allocations += 1
+            image = np.empty((4, 6, 3), dtype=np.uint8)
+        image.fill(self.count)
+        return True, image
+
+
+@pytest.fixture()
+def service(request) -> tuple[CameraService, object, _FakeCapture]:
+    prefix = getattr(request, "param", None)
+    svc = CameraService([CameraConfig(key="top")], shared_memory_prefix=prefix)
+    state = svc._cameras["top"]
+    state.capture = _FakeCapture()
+    state.status = CameraStatus.CONNECTED
+    return svc, state, state.capture
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_ring_never_overwrites_leased_slot() -> None:
+    ring = FrameRing(slots=3)
+    assert ring.lease() is None
+    ring.publish(np.full(4, 1), 0.0)
+
+    pinned = ring.lease()
+    assert pinned.seq == 1 and not pinned.frame.flags.writeable
+    for value in range(2, 10):
+        ring.publish(np.full(4, value), float(value))
+    assert pinned.frame.tolist() == [1, 1, 1, 1]  # still intact
+    assert ring.seq == 9 and ring.dropped == 0
+
+    # With both other slots pinned as well, new frames are dropped
+    second = ring.lease()
+    ring.publish(np.full(4, 10), 10.0)
+    third = ring.lease()
+    assert not ring.publish(np.full(4, 11), 11.0)
+    assert ring.dropped == 1
+    for lease in (pinned, second, third):
+        lease.release()
+    assert ring.publish(np.full(4, 12), 12.0)
+    assert ring.stats() == {"seq": 11, "dropped": 1, "pinned": 0}
+
+
+def test_capture_reuses_ring_buffers(service) -> None:
+    svc, state, capture = service
+    for _ in range(10):
+        svc._read_opencv(state)
+    assert capture.allocations == 1  # only the very first frame
+
+    with svc.lease_frame("top") as lease:
+        assert lease.seq == 10
+        assert lease.frame[0, 0, 0] == 10
+        with pytest.raises(ValueError):
+            lease.frame[0, 0, 0] = 0
+
+
+def test_get_frame_copies_once_per_captured_frame(service) -> None:
+    svc, state, _ = service
+    svc._read_opencv(state)
+
+    first = svc.get_frame("top")
+    assert svc.get_frame("top") is first
+    assert svc.get_all_frames()["top"] is first
+    assert not first.flags.writeable
+
+    svc._read_opencv(state)
+    second = svc.get_frame("top")
+    assert second is not first
+    assert first[0, 0, 0] == 1 and second[0, 0, 0] == 2
+    assert svc.get_status()["top"]["frameSeq"] == 2
+
+    svc.disconnect("top")
+    assert svc.get_frame("top") is None
+    assert svc.lease_frame("top") is None
+
+
+def test_wait_for_frame_blocks_until_capture(service) -> None:
+    svc, state, _ = service
+    threading.Timer(0.05, svc._read_opencv, args=(state,)).start()
+    start = time.monotonic()
+    with svc.wait_for_frame("top", timeout=2.0) as lease:
+        assert lease.seq == 1 and lease.frame[0, 0, 0] == 1
+    assert 0.03 < time.monotonic() - start < 1.0
+
+    # Already-consumed frames are not returned again
+    assert svc.wait_for_frame("top", after_seq=1, timeout=0.02) is None
+    assert svc.wait_for_frame("missing", timeout=0.02) is None
+
+    # Disconnecting wakes blocked waiters
+    threading.Timer(0.05, svc.disconnect, args=("top",)).start()
+    start = time.monotonic()
+    assert svc.wait_for_frame("top", after_seq=1, timeout=5.0) is None
+    assert time.monotonic() - start < 1.0
+
+
+def test_get_synchronized_matches_capture_times() -> None:
+    svc = CameraService([CameraConfig(key="a"), CameraConfig(key="b")])
+    ring_a, ring_b = svc._cameras["a"].ring, svc._cameras["b"].ring
+    for ts in (1.000, 1.033, 1.066):
+        ring_a.publish(np.full(2, int(ts * 1000)), ts)
+    for ts in (1.00, 1.02, 1.04, 1.06):
+        ring_b.publish(np.full(2, int(ts * 1000)), ts)
+
+    synced = svc.get_synchronized(["a", "b"], max_skew_ms=10.0)
+    assert synced.timestamps == {"b": 1.06, "a": 1.066}
+    assert synced.seqs == {"b": 4, "a": 3}
+    assert synced.frames["a"][0] == 1066 and not synced.frames["a"].flags.writeable
+    assert synced.skew_s == pytest.approx(0.006)
+    assert ring_a.stats()["pinned"] == ring_b.stats()["pinned"] == 0
+
+    # Camera b runs ahead: wait for a's next frame rather than return a stale pair
+    ring_b.publish(np.zeros(2), 2.0)
+    assert svc.get_synchronized(["a", "b"], max_skew_ms=10.0, timeout=0.02) is None
+    threading.Timer(0.05, ring_a.publish, args=(np.zeros(2), 2.004)).start()
+    synced = svc.get_synchronized(["a", "b"], max_skew_ms=10.0, timeout=2.0)
+    assert synced.timestamps == {"a": 2.004, "b": 2.0}
+
+    with pytest.raises(CameraError):
+        svc.get_synchronized(["a", "nope"])
+
+
+def test_jpeg_fanout_encodes_each_frame_once(service) -> None:
+    """Streams and snapshots at one quality share a single encode per frame."""
+    pytest.importorskip("cv2")
+    svc, state, _ = service
+    encoder = svc.jpeg_fanout.encoder("top", 85)
+    assert svc.jpeg_fanout.encoder("top", 85) is encoder
+
+    async def watch(n: int) -> list[bytes]:
+        parts = []
+        async for part in encoder.stream(fps=1000):
+            parts.append(part)
+            if len(parts) == n:
+                break
+        return parts
+
+    async def main() -> tuple[list[bytes], ...]:
+        clients = [asyncio.create_task(watch(3)) for _ in range(3)]
+        for _ in range(3):
+            await asyncio.sleep(0.03)
+            svc._read_opencv(state)
+        return await asyncio.gather(*clients)
+
+    results = asyncio.run(main())
+    assert all(len(parts) == 3 for parts in results)
+    assert results[0] == results[1] == results[2]
+    assert results[0][0].startswith(b"--frame\r\nContent-Type: image/jpeg")
+
+    snapshot = encoder.encode_latest()
+    assert snapshot.seq == 3
+    assert encoder.encodes == 3  # three frames, three clients, one snapshot
+    assert encoder.subscribers == 0
+
+
+@pytest.mark.parametrize("service", [f"nextis-test-{uuid.uuid4().hex[:8]}"], indirect=True)
+def test_shared_memory_bus_serves_other_processes(service) -> None:
+    svc, state, _ = service
+    prefix = svc._shm_prefix
+    reader = SharedFrameReader("top", prefix=prefix)
+    assert reader.latest() is None  # nothing published yet
+
+    svc._read_opencv(state)
+    svc._read_opencv(state)
+    frame = reader.latest()
+    assert frame.seq == 2 and frame.array.shape == (4, 6, 3)
+    assert frame.array[0, 0, 0] == 2 and not frame.array.flags.writeable
+    assert svc.get_status()["top"]["sharedMemory"] == f"{prefix}_top"
+
+    # Another process attaches by name and reads the same frame
+    code = (
+        "from nextis.cameras.shm_bus import SharedFrameReader\n"
+        f"f = SharedFrameReader('top', prefix='{prefix}').wait(timeout=2.0)\n"
+        "print(f.seq, int(f.array.sum()))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=30
+    )
+    assert out.stdout.split() == ["2", str(2 * 4 * 6 * 3)]
+
+    # The view survives slots - 1 newer frames, then reports itself stale
+    for _ in range(3):
+        svc._read_opencv(state)
+    assert frame.valid() and frame.array[0, 0, 0] == 2
+    svc._read_opencv(state)
+    assert not frame.valid()
+    assert reader.read().array[0, 0, 0] == 6
+
+    svc.disconnect("top")  # the reader process exiting did not unlink it
+    assert reader.latest() is None and not reader.attached
+
+
+def test_shared_memory_writers_closed_at_exit() -> None:
+    """Writers still open at interpreter exit are closed, so readers detach."""
+    from nextis.cameras import shm_bus
+
+    prefix = f"nextis-test-{uuid.uuid4().hex[:8]}"
+    writer = shm_bus.SharedFrameWriter(shm_bus.segment_name("top", prefix), (2, 2))
+    writer.publish(np.ones((2, 2), dtype=np.uint8), time.monotonic())
+    reader = SharedFrameReader("top", prefix=prefix)
+    assert reader.latest().seq == 1
+
+    shm_bus._close_writers()
+    assert reader.latest() is None and not reader.attached
+    assert writer not in shm_bus._writers
+    writer.close()  # still idempotent
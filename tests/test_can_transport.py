@@ -0,0 +1,255 @@
+"""Tests for the pluggable CAN transports and the simulated Damiao bus."""
+
+from __future__ import annotations
+
+import heapq
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from nextis.hardware.bus_stats import instrument_motor_control, instrument_serial_bus
+from nextis.hardware.can_transport import (
+    CAN_FRAME_BITS,
+    SerialBridgeTransport,
+    SimulatedCanBus,
+    SimulatedMotor,
+    SocketCanTransport,
+    create_transport,
+    decode_tx,
+    encode_rx,
+    encode_tx,
+)
+from nextis.hardware.diagnostics import read_diagnostics
+from nextis.hardware.scanning import _scan_damiao
+from nextis.hardware.types import MotorType
+from nextis.vendor.dm_can import DM_Motor_Type, DM_variable, Motor, MotorControl
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _sim_bus(n: int = 3, **kwargs) -> SimulatedCanBus:
+    motors = [
+        SimulatedMotor(slave_id=i, master_id=0x10 + i, motor_type=DM_Motor_Type.DM4340)
+        for i in range(1, n + 1)
+    ]
+    return SimulatedCanBus(motors, **kwargs)
+
+
+def _drain(control: MotorControl, timeout: float = 0.2) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        control.recv()
+        time.sleep(0.001)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_codec_round_trip() -> None:
+    """Bridge transmit frames split back into (can_id, payload)."""
+    payload = bytes(range(8))
+    stream = b"\x00" + encode_tx(0x203, payload) + encode_tx(0x7FF, b"\x01\x00\x33\x08")
+    assert decode_tx(stream) == [(0x203, payload), (0x7FF, b"\x01\x00\x33\x08\x00\x00\x00\x00")]
+    assert encode_tx(0x01, payload) == bytes(MotorControl.send_data_frame[:13]) + bytes(
+        [0x01, 0x00, *MotorControl.send_data_frame[15:21], *payload, 0x00]
+    )
+
+
+def test_create_transport_by_port() -> None:
+    assert isinstance(create_transport("sim:4"), SimulatedCanBus)
+    assert len(create_transport("sim:4").motors) == 4
+    assert isinstance(create_transport("/dev/ttyACM0"), SerialBridgeTransport)
+    assert isinstance(create_transport("can0"), SocketCanTransport)
+
+
+def test_motor_control_over_simulated_bus() -> None:
+    """MotorControl drives simulated motors through the bridge interface."""
+    bus = _sim_bus(latency=0.0)
+    control = MotorControl(bus)
+    motors = [Motor(DM_Motor_Type.DM4340, i, 0x10 + i) for i in (1, 2, 3)]
+    for motor in motors:
+        control.addMotor(motor)
+        control.enable(motor)
+
+    targets = [0.5, -1.25, 2.0]
+    control.control_mit_many(
+        [(m, 20.0, 0.5, q, 0.0, 1.0) for m, q in zip(motors, targets, strict=True)]
+    )
+    _drain(control)
+
+    assert all(bus.motors[i].enabled for i in (1, 2, 3))
+    for motor, target in zip(motors, targets, strict=True):
+        assert abs(motor.getPosition() - target) < 1e-3
+        assert abs(motor.getTorque() - 1.0) < 0.02
+    assert bus.frames_tx == 6 and bus.frames_rx == 6
+
+
+def test_simulated_bus_models_bandwidth_and_loss() -> None:
+    """Replies are serialized at the bitrate; loss drops frames."""
+    bus = _sim_bus(n=1, latency=0.0, bitrate=125_000)
+    bus.open()
+    burst = 40
+    start = time.perf_counter()
+    bus.write(b"".join(encode_tx(1, b"\xff" * 7 + b"\xfc") for _ in range(burst)))
+    frames = bytearray()
+    while len(frames) < burst * 16 and time.perf_counter() - start < 1.0:
+        frames += bus.read_all()
+    elapsed = time.perf_counter() - start
+
+    # 40 requests + 40 replies on a shared 125 kbit/s wire
+    assert len(frames) == burst * 16
+    assert elapsed >= 2 * burst * CAN_FRAME_BITS / 125_000 * 0.9
+    assert bus.utilization() > 0.0
+
+    lossy = _sim_bus(n=1, loss=0.5, seed=1)
+    lossy.write(b"".join(encode_tx(1, b"\xff" * 7 + b"\xfc") for _ in range(200)))
+    assert 0 < lossy.frames_lost < 200
+
+
+def test_scan_damiao_on_simulated_bus() -> None:
+    """The scanner finds every simulated motor without enabling any."""
+    bus = _sim_bus(n=4)
+    found = _scan_damiao("sim", transport=bus)
+    assert [m.motor_id for m in found] == [1, 2, 3, 4]
+    assert {m.motor_type for m in found} == {"damiao"}
+    assert not any(m.enabled for m in bus.motors.values())
+
+    assert _scan_damiao("sim", transport=_sim_bus(n=4, loss=1.0)) == []
+
+
+def test_read_params_pipelined() -> None:
+    """All requests go out in one burst; a silent motor times out alone."""
+    bus = _sim_bus(n=7, latency=0.0005)
+    control = MotorControl(bus)
+    motors = [Motor(DM_Motor_Type.DM4340, i, 0x10 + i) for i in range(1, 9)]  # 8 is absent
+    for motor in motors:
+        control.addMotor(motor)
+    rids = [DM_variable.CTRL_MODE, DM_variable.PMAX, DM_variable.VMAX, DM_variable.TMAX]
+
+    start = time.perf_counter()
+    values = control.read_params(motors, rids, timeout=0.03, retries=1)
+    elapsed = time.perf_counter() - start
+
+    for motor in motors[:7]:
+        assert values[motor.SlaveID] == {10: 1, 21: 12.5, 22: 8.0, 23: 28.0}
+    assert values[8] == dict.fromkeys([10, 21, 22, 23])
+    # Two timeouts for the absent motor bound the call, not 32 sequential polls
+    assert elapsed < 0.2
+    assert bus.frames_tx == 7 * 4 + 2 * 4
+
+
+def test_read_params_keeps_lookalike_feedback() -> None:
+    """Feedback whose q low byte is 0x33 is not mistaken for a param reply."""
+    bus = _sim_bus(n=2, latency=0.0005)
+    control = MotorControl(bus)
+    motors = [Motor(DM_Motor_Type.DM4340, i, 0x10 + i) for i in (1, 2)]
+    for motor in motors:
+        control.addMotor(motor)
+    pmax = int(DM_variable.PMAX)
+
+    # MIT feedback for motor 1: q = 0x8033, dq high byte equal to a requested RID
+    lookalike = encode_rx(0x11, bytes([0x01, 0x80, 0x33, pmax, 0x00, 0x00, 25, 30]))
+    heapq.heappush(bus._pending, (0.0, -1, lookalike))
+    values = control.read_params(motors, [DM_variable.PMAX], timeout=0.05)
+
+    assert values == {1: {pmax: 12.5}, 2: {pmax: 12.5}}
+    assert control.get_state(motors[0]).seq == 1
+    q_max = MotorControl.Limit_Param[DM_Motor_Type.DM4340][0]
+    assert motors[0].getPosition() == pytest.approx((0x8033 / 0xFFFF * 2 - 1) * q_max)
+
+
+def test_damiao_diagnostics_include_params() -> None:
+    """Diagnostics attach register values read through the driver."""
+    control = MotorControl(_sim_bus(n=2))
+    for i in (1, 2):
+        control.addMotor(Motor(DM_Motor_Type.DM4340, i, 0x10 + i))
+    robot = SimpleNamespace(
+        bus=SimpleNamespace(control=control),
+        motors={"base": SimpleNamespace(id=1), "link1": SimpleNamespace(id=2)},
+    )
+
+    diags = read_diagnostics(robot, MotorType.DAMIAO)
+    assert [d.name for d in diags] == ["base", "link1"]
+    assert diags[0].params["TMAX"] == 28.0
+    assert diags[1].to_dict()["params"]["CTRL_MODE"] == 1
+
+
+def test_bus_stats_count_can_traffic() -> None:
+    """Instrumented MotorControl counts frames, round trips, load and garbage."""
+    bus = _sim_bus(n=3, latency=0.0005)
+    control = MotorControl(bus)
+    motors = [Motor(DM_Motor_Type.DM4340, i, 0x10 + i) for i in range(1, 4)]
+    for motor in motors:
+        control.addMotor(motor)
+    stats = instrument_motor_control(control)
+    assert instrument_motor_control(control) is stats
+    stats.window = 0.01
+
+    for i in range(5):
+        if i == 4:
+            heapq.heappush(bus._pending, (0.0, -1, b"\x00\x01\x02"))  # line noise
+        control.control_mit_many([(m, 10.0, 1.0, 0.1, 0.0, 0.0) for m in motors])
+        # Wait for every reply so each burst yields one round-trip sample
+        deadline = time.perf_counter() + 1.0
+        while stats.frames_rx < 3 * (i + 1) and time.perf_counter() < deadline:
+            control.recv()
+            time.sleep(0.001)
+
+    snap = stats.snapshot()
+    assert snap["kind"] == "can"
+    assert snap["frames_tx"] == bus.frames_tx == 15
+    assert snap["frames_rx"] == bus.frames_rx - 1 == 15  # noise is not a frame
+    assert snap["bytes_tx"] == 15 * 30
+    assert snap["rtt"]["count"] == 5
+    assert snap["rtt"]["p50_ms"] > 0.0
+    assert snap["parse_errors"] == 3
+    assert snap["rx_pending_bytes"] == 0
+    assert snap["avg_load_pct"] > 0.0
+    assert snap["window"]["load_pct"] == snap["load_pct"]
+
+
+def test_bus_stats_wrap_sdk_handlers() -> None:
+    """Serial buses are counted through the SDK port and packet handlers."""
+    calls: list[str] = []
+    port = SimpleNamespace(
+        getBaudRate=lambda: 1_000_000,
+        getBytesAvailable=lambda: 2,
+        writePort=lambda packet: len(packet),
+        readPort=lambda length: [0xFF] * length,
+    )
+
+    def tx_packet(port_handler, txpacket):
+        calls.append("tx")
+        return port_handler.writePort(txpacket) and 0
+
+    results = iter([0, -3002, -3001])
+
+    def rx_packet(port_handler):
+        port_handler.readPort(11)
+        return [0] * 11, next(results)
+
+    packets = SimpleNamespace(txPacket=tx_packet, rxPacket=rx_packet)
+    bus = SimpleNamespace(port_handler=port, packet_handler=packets)
+    stats = instrument_serial_bus(bus)
+    assert instrument_serial_bus(bus) is stats
+    assert instrument_serial_bus(SimpleNamespace()) is None
+
+    packets.txPacket(port, [0] * 8)
+    for _ in range(3):
+        packets.rxPacket(port)
+
+    snap = stats.snapshot()
+    assert calls == ["tx"]
+    assert snap["frames_tx"] == 1
+    assert snap["bytes_tx"] == 8
+    assert snap["frames_rx"] == 1
+    assert snap["bytes_rx"] == 33
+    assert snap["parse_errors"] == 1
+    assert snap["timeouts"] == 1
+    assert snap["rx_pending_bytes"] == 2
+    assert snap["rtt"]["count"] == 1
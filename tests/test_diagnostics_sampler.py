@@ -0,0 +1,90 @@
+"""Tests for the background motor diagnostics sampler."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+from nextis.hardware.diagnostics_sampler import DIAGNOSTIC_FIELDS, DiagnosticsSampler
+from nextis.hardware.types import MotorType
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+class _SyncBus:
+    """Dynamixel-style bus that counts one transaction per sync_read."""
+
+    motor_names = ["shoulder", "elbow"]
+    motor_ids = [1, 2]
+
+    def __init__(self) -> None:
+        self.transactions: list[str] = []
+
+    def sync_read(self, register: str, motors: list[str]) -> dict[str, float]:
+        self.transactions.append(register)
+        base = {"Present_Temperature": 40.0, "Hardware_Error_Status": 0.0}.get(register, 1.0)
+        if register == "Hardware_Error_Status":
+            return {"shoulder": 0.0, "elbow": 4.0}
+        return {m: base + i for i, m in enumerate(motors)}
+
+
+class _Registry:
+    def __init__(self, bus: _SyncBus) -> None:
+        self.arms = {"leader": SimpleNamespace(motor_type=MotorType.DYNAMIXEL_XL330)}
+        self.arm_instances = {"leader": SimpleNamespace(bus=bus)}
+        self.lock = threading.Lock()
+
+    def bus_lock(self, arm_id: str) -> threading.Lock:
+        return self.lock
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_sampler_bulk_reads_and_serves_snapshots() -> None:
+    bus = _SyncBus()
+    sampler = DiagnosticsSampler(_Registry(bus), capacity=3)
+    for _ in range(5):
+        sampler.sample_all()
+
+    # One sync_read per register per sample, not one read per motor
+    assert len(bus.transactions) == 5 * 6
+    age, diagnostics = sampler.snapshot("leader")
+    assert age >= 0.0
+    assert [d.name for d in diagnostics] == ["shoulder", "elbow"]
+    assert diagnostics[1].temperature_c == 41.0
+    assert diagnostics[1].error_flags == 4
+    assert diagnostics[1].error_description == "overheating"
+
+    trend = sampler.trend("leader", seconds=60.0)
+    assert len(trend["age_s"]) == 3  # ring buffer keeps the newest samples
+    assert set(trend["motors"]["elbow"]) == set(DIAGNOSTIC_FIELDS)
+    assert trend["motors"]["elbow"]["temperature_c"] == [41.0] * 3
+    assert sampler.snapshot("missing") is None
+
+
+def test_sampler_yields_to_busy_bus_and_carries_values_forward() -> None:
+    bus = _SyncBus()
+    registry = _Registry(bus)
+    sampler = DiagnosticsSampler(registry, max_wait=0.005)
+    sampler.sample_all()
+
+    with registry.lock:  # control loop holds the bus for the whole cycle
+        sampler.sample_all()
+
+    assert len(bus.transactions) == 6
+    assert sampler.busy_skips == 6
+    trend = sampler.trend("leader", seconds=60.0)
+    assert trend["motors"]["shoulder"]["temperature_c"] == [40.0, 40.0]
+
+    # Disconnected arms are dropped from the cache
+    registry.arm_instances.clear()
+    sampler.sample_all()
+    assert sampler.trend("leader", seconds=60.0) is None
+    assert np.isclose(sampler.stats()["frequency_hz"], 1.0)
@@ -0,0 +1,233 @@
+"""Tests for the vendored Damiao CAN driver (bulk MIT control, receiver, parser)."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+
+from nextis.vendor.dm_can import (
+    DM_Motor_Type,
+    DM_variable,
+    Motor,
+    MotorControl,
+    find_frames,
+    uint_to_float,
+)
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+class _FakeSerial:
+    """Records writes; replies with queued bytes on read_all()."""
+
+    def __init__(self) -> None:
+        self.is_open = False
+        self.writes: list[bytes] = []
+        self.rx = bytearray()
+        self.reads = 0
+        self._lock = threading.Lock()
+
+    def open(self) -> None:
+        self.is_open = True
+
+    def close(self) -> None:
+        self.is_open = False
+
+    def write(self, data: bytes | bytearray) -> int:
+        self.writes.append(bytes(data))
+        return len(data)
+
+    def read_all(self) -> bytes:
+        with self._lock:
+            self.reads += 1
+            data, self.rx = bytes(self.rx), bytearray()
+        return data
+
+    def feed(self, data: bytes) -> None:
+        with self._lock:
+            self.rx += data
+
+
+def _feedback_frame(can_id: int, q: int, dq: int, tau: int) -> bytes:
+    """16-byte serial-bridge feedback frame (CMD 0x11) with raw MIT fields."""
+    data = [
+        can_id & 0x0F,
+        q >> 8,
+        q & 0xFF,
+        dq >> 4,
+        ((dq & 0xF) << 4) | (tau >> 8),
+        tau & 0xFF,
+        0,
+        0,
+    ]
+    return bytes([0xAA, 0x11, 0x08, can_id & 0xFF, 0, 0, 0, *data, 0x55])
+
+
+def _param_frame(slave_id: int, rid: int, value: int) -> bytes:
+    """Parameter read reply (0x33) carrying a uint32 value."""
+    data = [slave_id & 0xFF, slave_id >> 8, 0x33, rid, *value.to_bytes(4, "little")]
+    return bytes([0xAA, 0x11, 0x08, 0x11, 0, 0, 0, *data, 0x55])
+
+
+def _wait_for(predicate, timeout: float = 1.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.001)
+    return False
+
+
+def _controller() -> tuple[MotorControl, _FakeSerial, list[Motor]]:
+    serial = _FakeSerial()
+    control = MotorControl(serial)
+    motors = [
+        Motor(DM_Motor_Type.DM4310, 0x01, 0x11),
+        Motor(DM_Motor_Type.DM4340, 0x02, 0x12),
+        Motor(DM_Motor_Type.DM8009, 0x03, 0x13),
+    ]
+    for motor in motors:
+        control.addMotor(motor)
+    return control, serial, motors
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_control_mit_many_matches_single_frames() -> None:
+    """One write carrying the same bytes as per-motor controlMIT calls."""
+    control, serial, motors = _controller()
+    commands = [
+        (motors[0], 30.0, 1.2, 0.5, -1.0, 0.3),
+        (motors[1], 120.0, 0.4, -2.25, 3.5, -6.0),
+        (motors[2], 0.0, 2.5, 12.0, 0.0, 17.5),
+    ]
+
+    for command in commands:
+        control.controlMIT(*command)
+    expected = b"".join(serial.writes)
+    serial.writes.clear()
+
+    assert control.control_mit_many(commands) == 3
+    assert serial.writes == [expected]
+
+    # The buffer is reused across calls with the same motor count
+    buf = control._mit_batch_buf
+    control.control_mit_many(commands)
+    assert control._mit_batch_buf is buf
+    assert serial.writes[-1] == expected
+
+
+def test_control_mit_many_parses_replies_in_one_pass() -> None:
+    """All queued feedback frames update their motors after one call."""
+    control, serial, motors = _controller()
+    serial.rx += _feedback_frame(0x11, 0xFFFF, 0x800, 0x800)
+    serial.rx += _feedback_frame(0x12, 0x0000, 0x800, 0xFFF)
+
+    unknown = Motor(DM_Motor_Type.DM4310, 0x09, 0x19)
+    sent = control.control_mit_many(
+        [(motors[0], 0, 0, 0, 0, 0), (unknown, 0, 0, 0, 0, 0), (motors[1], 0, 0, 0, 0, 0)]
+    )
+
+    assert sent == 2
+    assert len(serial.writes) == 1 and len(serial.writes[0]) == 2 * 30
+    assert np.isclose(motors[0].getPosition(), 12.5)
+    assert np.isclose(motors[1].getPosition(), -12.5)
+    assert np.isclose(motors[1].getTorque(), 28.0)
+    assert control.data_save == b""
+
+
+def test_receiver_thread_updates_state_table() -> None:
+    """Control calls only write; the receiver thread fills the state table."""
+    control, serial, motors = _controller()
+    control.start_receiver()
+    try:
+        assert control.get_state(motors[0]) is None
+        reads = serial.reads
+        control.controlMIT(motors[0], 0, 0, 0, 0, 0)
+        assert len(serial.writes) == 1
+
+        # Garbage, a complete frame, then a frame split across two reads
+        frame = _feedback_frame(0x12, 0x0000, 0x800, 0xFFF)
+        serial.feed(b"\x00\x13" + _feedback_frame(0x11, 0xFFFF, 0x800, 0x800) + frame[:7])
+        assert _wait_for(lambda: control.get_state(motors[0]) is not None)
+        serial.feed(frame[7:])
+        assert _wait_for(lambda: control.get_state(motors[1]) is not None)
+
+        first = control.get_state(motors[0])
+        assert np.isclose(first.q, 12.5) and first.seq == 1
+        assert np.isclose(control.get_state(motors[1]).tau, 28.0)
+        assert serial.reads > reads  # drained by the thread, not by controlMIT
+
+        serial.feed(_feedback_frame(0x11, 0x8000, 0x800, 0x800))
+        assert _wait_for(lambda: control.get_state(motors[0]).seq == 2)
+        second = control.get_state(motors[0])
+        assert abs(second.q) < 1e-3 and second.timestamp >= first.timestamp
+        assert set(control.get_states()) == {0x01, 0x02}
+    finally:
+        control.stop_receiver()
+    assert not control.receiver_running
+
+
+def test_receiver_thread_routes_param_replies() -> None:
+    """Parameter reads still work while the receiver owns the port."""
+    control, serial, motors = _controller()
+    control.start_receiver()
+    try:
+        rid = int(DM_variable.CTRL_MODE)
+        timer = threading.Timer(0.02, serial.feed, args=(_param_frame(0x01, rid, 1),))
+        timer.start()
+        assert control.read_motor_param(motors[0], rid) == 1
+        assert control.get_state(motors[0]) is None
+    finally:
+        control.stop_receiver()
+
+
+def test_find_frames_matches_scan_with_overlaps() -> None:
+    """Vectorized search takes frames greedily, like the byte-by-byte scan."""
+    inner = _feedback_frame(0x11, 0xAA00, 0x800, 0x800)
+    # 0xAA in the payload 15 bytes before a real tail creates an overlapping candidate
+    noisy = bytearray(inner)
+    noisy[9] = 0xAA
+    stream = b"\x55\xaa" + bytes(noisy) + _feedback_frame(0x12, 0x5500, 2, 3) + b"\xaa\x11\x08"
+
+    frames, consumed = find_frames(stream)
+    assert [bytes(f) for f in frames] == [bytes(noisy), _feedback_frame(0x12, 0x5500, 2, 3)]
+    assert consumed == len(stream) - 3
+
+    frames, consumed = find_frames(b"\x00" * 40)
+    assert len(frames) == 0 and consumed == 40 - 15
+
+
+def test_process_frames_matches_scalar_decode() -> None:
+    """Batch decode equals per-field uint_to_float with each motor type's limits."""
+    control, _serial, motors = _controller()
+    rng = np.random.default_rng(3)
+    stream = bytearray()
+    expected = {}
+    for k in range(60):
+        motor = motors[k % 3]
+        q, dq, tau = (int(v) for v in rng.integers(0, [1 << 16, 1 << 12, 1 << 12]))
+        # Alternate CANID = MasterID and CANID = 0 (id in data[0])
+        frame = bytearray(_feedback_frame(motor.MasterID, q, dq, tau))
+        if k % 2:
+            frame[3] = 0
+        stream += frame
+        q_max, dq_max, tau_max = control.Limit_Param[motor.MotorType]
+        expected[motor.SlaveID] = (
+            uint_to_float(q, -q_max, q_max, 16),
+            uint_to_float(dq, -dq_max, dq_max, 12),
+            uint_to_float(tau, -tau_max, tau_max, 12),
+        )
+
+    assert control.process_frames(memoryview(stream)) == len(stream)
+    for motor in motors:
+        state = control.get_state(motor)
+        assert (motor.state_q, motor.state_dq, motor.state_tau) == expected[motor.SlaveID]
+        assert state.seq == 20
@@ -0,0 +1,82 @@
+"""Tests for minimum-jerk homing."""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from nextis.control.homing import MinJerkTrajectory, track_home, trajectory_velocity
+from nextis.hardware.mock import MockRobot
+
+
+class _TrackingBus:
+    """Bus whose motors follow each Goal_Position setpoint exactly."""
+
+    def __init__(self, robot: MockRobot) -> None:
+        self.robot = robot
+        self.setpoints: list[dict[str, float]] = []
+
+    def sync_write(self, register: str, values: dict[str, float]) -> None:
+        assert register == "Goal_Position"
+        self.setpoints.append(values)
+        self.robot.send_action({f"{k}.pos": v for k, v in values.items()})
+
+
+def test_min_jerk_profile_is_smooth_and_sized() -> None:
+    start = np.array([0.0, 1.0])
+    goal = np.array([1.0, 0.5])
+    traj = MinJerkTrajectory.sized(start, goal, max_velocity=0.5)
+
+    assert traj.duration == pytest.approx(1.875 * 1.0 / 0.5)
+    assert np.allclose(traj.sample(0.0), start)
+    assert np.allclose(traj.sample(traj.duration), goal)
+    assert np.allclose(traj.sample(traj.duration / 2), (start + goal) / 2)
+    ts = np.linspace(0.0, traj.duration, 2001)
+    vel = np.diff([traj.sample(t)[0] for t in ts]) / np.diff(ts)
+    assert vel.max() == pytest.approx(0.5, rel=1e-3)
+    assert vel[0] == pytest.approx(0.0, abs=1e-3)
+
+
+def test_track_home_exits_once_converged() -> None:
+    robot = MockRobot()
+    robot.send_action({"base.pos": 0.2, "link1.pos": -0.1})
+    bus = _TrackingBus(robot)
+
+    start = time.monotonic()
+    reached = track_home(
+        robot,
+        bus,
+        {"base": 0.0, "link1": 0.0},
+        duration=10.0,
+        max_velocity=1.0,
+        frequency=100.0,
+    )
+    elapsed = time.monotonic() - start
+
+    assert reached
+    assert elapsed < 1.0  # 0.5 s trajectory, not the 10 s budget
+    assert abs(bus.setpoints[-1]["base"]) < 0.02
+    # Setpoints move monotonically toward home
+    base = [s["base"] for s in bus.setpoints]
+    assert all(a >= b for a, b in zip(base, base[1:], strict=False))
+
+    # Already home: no setpoints at all
+    bus.setpoints.clear()
+    assert track_home(robot, bus, {"base": 0.0, "link1": 0.0})
+    assert bus.setpoints == []
+
+
+def test_default_trajectory_stays_under_rate_limit() -> None:
+    """The default peak velocity is below the slowest motor's limiter speed."""
+    from nextis.api.schemas import HomingStartRequest
+
+    request = HomingStartRequest(armId="arm")
+    limit = request.velocity * 0.8 / 0.15  # J4340P: ~0.8 rad/s at velocity_limit=0.15
+    peak = trajectory_velocity(request.velocity, request.max_velocity)
+    assert 0.0 < peak < limit
+    assert trajectory_velocity(0.15) == pytest.approx(0.8 * 0.8)
+    # An explicit request above the limit is capped to it
+    assert trajectory_velocity(request.velocity, 1.0) == pytest.approx(limit)
+    assert trajectory_velocity(request.velocity, 0.1) == 0.1
@@ -0,0 +1,62 @@
+"""Tests for concurrent motor scanning."""
+
+from __future__ import annotations
+
+import time
+
+from nextis.hardware import scanning
+from nextis.hardware.scanning import _crc16_dxl, _parse_dxl2_ping_replies, iter_scan_motors
+from nextis.hardware.types import MotorType
+
+
+def _dxl2_ping_reply(motor_id: int, model: int) -> bytes:
+    body = bytes([0xFF, 0xFF, 0xFD, 0x00, motor_id, 0x07, 0x00, 0x55, 0x00])
+    body += bytes([model & 0xFF, model >> 8, 0x2D])
+    crc = _crc16_dxl(body)
+    return body + bytes([crc & 0xFF, crc >> 8])
+
+
+def test_parse_dxl2_ping_replies() -> None:
+    """Broadcast ping replies are split, CRC-checked and partials kept."""
+    first = _dxl2_ping_reply(1, 1200)
+    corrupt = bytearray(_dxl2_ping_reply(2, 1200))
+    corrupt[-1] ^= 0xFF
+    third = _dxl2_ping_reply(3, 1060)
+    stream = b"\x00" + first + bytes(corrupt) + third + third[:5]
+
+    replies, consumed = _parse_dxl2_ping_replies(stream)
+    assert replies == [(1, 1200), (3, 1060)]
+    assert stream[consumed:] == third[:5]
+
+
+def test_iter_scan_motors_runs_ports_concurrently(monkeypatch) -> None:
+    """Ports are scanned in parallel and motors arrive as they are found."""
+    calls: list[str] = []
+    real_scan_damiao = scanning._scan_damiao
+
+    def fake_scan_damiao(port: str) -> list[scanning.DiscoveredMotor]:
+        calls.append(port)
+        time.sleep(0.1)
+        return real_scan_damiao(port)
+
+    monkeypatch.setattr(scanning, "_scan_damiao", fake_scan_damiao)
+    targets = [
+        ("sim:3", MotorType.DAMIAO),
+        ("sim:2", MotorType.DAMIAO),
+        ("sim:2", MotorType.DAMIAO),
+    ]
+
+    start = time.perf_counter()
+    found = list(iter_scan_motors(targets))
+    elapsed = time.perf_counter() - start
+
+    assert sorted(calls) == ["sim:2", "sim:3"]
+    assert sorted((m.port, m.motor_id) for m in found) == [
+        ("sim:2", 1),
+        ("sim:2", 2),
+        ("sim:3", 1),
+        ("sim:3", 2),
+        ("sim:3", 3),
+    ]
+    assert elapsed < 0.35  # two 0.1 s + 0.1 s collection scans overlapped
+    assert list(iter_scan_motors([])) == []
@@ -0,0 +1,839 @@
+"""Tests for the teleop control stack (joint layout, loop, timing).
+
+Runs the TeleopLoop against MockRobot / MockLeader — no hardware needed.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from nextis.control.force_feedback import GripperForceFeedback
+from nextis.control.intervention import InterventionDetector
+from nextis.control.joint_mapping import JointMapper, ValueMode
+from nextis.control.leader_assist import EFFORT_REGISTERS, GravityModel, LeaderAssistService
+from nextis.control.mailbox import Mailbox
+from nextis.control.metrics import LatencyHistogram, LoopMetrics, TickStage
+from nextis.control.safety import SafetyLayer
+from nextis.control.safety_monitor import SafetyMonitor
+from nextis.control.telemetry import TelemetryReader, TelemetrySnapshot
+from nextis.control.teleop_engine import TeleopEngine
+from nextis.control.teleop_loop import TeleopLoop
+from nextis.control.ticker import OverrunPolicy, RateTicker
+from nextis.control.torque_trend import TorqueTrendPredictor
+from nextis.errors import CalibrationError
+from nextis.hardware.mock import MOCK_JOINT_NAMES, MockLeader, MockRobot
+from nextis.hardware.types import MotorType
+
+
+def _identity_mapper(mode: ValueMode = ValueMode.FLOAT) -> JointMapper:
+    mapper = JointMapper()
+    mapper.joint_mapping = {f"{n}.pos": f"{n}.pos" for n in MOCK_JOINT_NAMES}
+    mapper.value_mode = mode
+    return mapper
+
+
+def _make_loop(**kwargs) -> TeleopLoop:
+    return TeleopLoop(
+        robot=MockRobot(),
+        leader=MockLeader(),
+        safety=SafetyLayer(robot_lock=threading.Lock()),
+        joint_mapper=kwargs.pop("joint_mapper", _identity_mapper()),
+        **kwargs,
+    )
+
+
+# ------------------------------------------------------------------
+# JointLayout
+# ------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("mode", [ValueMode.FLOAT, ValueMode.INT, ValueMode.RAD_TO_PERCENT])
+def test_layout_matches_convert_value(mode: ValueMode) -> None:
+    """Compiled layout reproduces convert_value for every mapped joint."""
+    mapper = _identity_mapper(mode)
+    mapper.leader_cal_ranges = {"link1.pos": (1000.0, 3000.0)}
+    leader_start = {"link2.pos": 0.1}
+    follower_start = {"link2.pos": 12.0}
+    scales = {"link2.pos": 40.0, "link3.pos": 25.0}
+
+    layout = mapper.compile(
+        leader_start_rad=leader_start,
+        follower_start_pos=follower_start,
+        rad_to_percent_scale=scales,
+    )
+    obs = {f"{n}.pos": 0.3 * (i - 3) + 0.05 for i, n in enumerate(MOCK_JOINT_NAMES)}
+
+    leader_vec = np.zeros(layout.num_leader)
+    valid = np.zeros(layout.num_leader, dtype=bool)
+    assert layout.gather(obs, leader_vec, valid)
+    action = layout.to_action(layout.apply(leader_vec, np.zeros(layout.num_follower)))
+
+    for l_key, f_key in mapper.joint_mapping.items():
+        expected = mapper.convert_value(
+            obs[l_key],
+            follower_key=f_key,
+            leader_key=l_key,
+            leader_start_rad=leader_start,
+            follower_start_pos=follower_start,
+            rad_to_percent_scale=scales,
+        )
+        assert action[f_key] == pytest.approx(expected)
+
+
+def test_layout_omits_missing_joints() -> None:
+    """Joints missing from the observation are dropped from the action."""
+    layout = _identity_mapper().compile(extra_leader_keys=["extra.pos"])
+    assert layout.leader_keys[-1] == "extra.pos"
+    assert layout.num_follower == len(MOCK_JOINT_NAMES)
+
+    leader_vec = np.zeros(layout.num_leader)
+    valid = np.zeros(layout.num_leader, dtype=bool)
+    obs = {"base.pos": 1.0, "gripper.pos": 0.5}
+    assert not layout.gather(obs, leader_vec, valid)
+
+    follower_valid = valid[layout.source_index]
+    action = layout.to_action(
+        layout.apply(leader_vec, np.zeros(layout.num_follower)), follower_valid
+    )
+    assert action == {"base.pos": 1.0, "gripper.pos": 0.5}
+
+
+# ------------------------------------------------------------------
+# TeleopLoop
+# ------------------------------------------------------------------
+
+
+def test_loop_publishes_follower_action() -> None:
+    """Running the loop against mocks sends actions and publishes them."""
+    loop = _make_loop(blend_duration=0.05)
+    loop.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while loop.loop_count < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        loop.stop()
+
+    assert loop.loop_count >= 10
+    action = loop.latest_action
+    assert set(action) == {f"{n}.pos" for n in MOCK_JOINT_NAMES}
+    assert loop.robot._commanded is not None
+
+
+# ------------------------------------------------------------------
+# Leader assist
+# ------------------------------------------------------------------
+
+
+def _calibrated_assist(tmp_path, n_joints: int = 3) -> LeaderAssistService:
+    service = LeaderAssistService(
+        calibration_path=tmp_path / "gravity.json", motor_type=MotorType.STS3215
+    )
+    rng = np.random.default_rng(0)
+    service.gravity_weights = {
+        f"joint_{i}": rng.normal(0, 50, 1 + 2 * n_joints).tolist() for i in range(n_joints)
+    }
+    service.save_calibration()
+    return service
+
+
+def test_assist_matches_scalar_model(tmp_path) -> None:
+    """The stacked weight matrix reproduces the per-joint scalar formula."""
+    service = _calibrated_assist(tmp_path)
+    service.k_assist = 0.8
+    service.k_haptic = 0.3
+    names = ["a", "b", "c"]
+    positions = [10.0, -45.0, 120.0]
+    velocities = [0.5, 30.0, -8.0]
+    loads = {"a": 2.0, "c": -5.0}
+
+    q = np.radians(positions)
+    feats = np.concatenate([[1.0], np.column_stack([np.sin(q), np.cos(q)]).ravel()])
+    expected = {}
+    for i, name in enumerate(names):
+        w = np.array(service.gravity_weights[f"joint_{i}"])
+        total = float(w @ feats) * service.k_gravity
+        if abs(velocities[i]) > service.vel_deadband:
+            total += service.k_assist * np.tanh(velocities[i] / service.v_threshold) * 100.0
+        total -= loads.get(name, 0.0) * service.k_haptic
+        total -= velocities[i] * service.k_damping
+        expected[name] = int(max(-service.max_pwm, min(service.max_pwm, total)))
+
+    assert service.compute_assist_torque(names, positions, velocities, loads) == expected
+    assert service.predict_gravity(positions) == pytest.approx(
+        [float(np.array(service.gravity_weights[f"joint_{i}"]) @ feats) for i in range(3)]
+    )
+
+    reloaded = LeaderAssistService(calibration_path=tmp_path / "gravity.json")
+    reloaded.update_gains(k_assist=0.8, k_haptic=0.3)
+    assert reloaded.compute_assist_torque(names, positions, velocities, loads) == expected
+
+
+def _coupled_loads(q_deg: np.ndarray) -> np.ndarray:
+    """Gravity torques of a 3-link planar chain (PWM units)."""
+    phi = np.cumsum(np.radians(q_deg), axis=-1)
+    c = np.cos(phi)
+    return np.stack(
+        [
+            120 * c[..., 0] + 60 * c[..., 1] + 20 * c[..., 2],
+            60 * c[..., 1] + 20 * c[..., 2],
+            20 * c[..., 2],
+        ],
+        axis=-1,
+    )
+
+
+def test_coupled_gravity_fit(tmp_path) -> None:
+    """The coupled model fits a serial chain the independent one cannot."""
+    rng = np.random.default_rng(1)
+    q = rng.uniform(-90, 90, size=(200, 3))
+    loads = _coupled_loads(q)
+    q_test = rng.uniform(-90, 90, size=(20, 3))
+
+    errors = {}
+    for model in GravityModel:
+        service = LeaderAssistService(calibration_path=tmp_path / f"{model.value}.json")
+        service.start_calibration()
+        for qi, li in zip(q, loads, strict=True):
+            service.record_sample(qi.tolist(), li.tolist())
+        service.compute_weights(model=model)
+        predicted = np.array([service.predict_gravity(qi.tolist()) for qi in q_test])
+        errors[model] = np.abs(predicted - _coupled_loads(q_test)).max()
+
+    assert errors[GravityModel.COUPLED] < 1e-2
+    assert errors[GravityModel.INDEPENDENT] > 5.0
+    reloaded = LeaderAssistService(calibration_path=tmp_path / "coupled.json")
+    assert reloaded.model == GravityModel.COUPLED
+
+
+def test_compute_weights_defaults_to_independent(tmp_path) -> None:
+    """The coupled model is opt-in and refuses to fit fewer samples than features."""
+    rng = np.random.default_rng(3)
+    q = rng.uniform(-90, 90, size=(10, 3))
+
+    service = LeaderAssistService(calibration_path=tmp_path / "default.json")
+    service.start_calibration()
+    for qi, li in zip(q, _coupled_loads(q), strict=True):
+        service.record_sample(qi.tolist(), li.tolist())
+    service.compute_weights()
+    assert service.model == GravityModel.INDEPENDENT
+    assert len(service.gravity_weights["joint_0"]) == 7
+
+    sparse = LeaderAssistService(calibration_path=tmp_path / "sparse.json")
+    sparse.start_calibration()
+    for qi, li in zip(q[:5], _coupled_loads(q[:5]), strict=True):
+        sparse.record_sample(qi.tolist(), li.tolist())
+    sparse.compute_weights(model=GravityModel.COUPLED)  # 5 samples < 11 features
+    assert not sparse.is_calibrated
+    assert sparse.calibration_mode
+    assert not (tmp_path / "sparse.json").exists()
+
+
+def test_online_rls_learns_gravity(tmp_path) -> None:
+    """RLS converges from scratch on samples gathered one at a time."""
+    service = LeaderAssistService(
+        calibration_path=tmp_path / "online.json", motor_type=MotorType.DYNAMIXEL_XL330
+    )
+    service.start_online_learning(forgetting=1.0, initial_covariance=1e4)
+    rng = np.random.default_rng(2)
+    for qi in rng.uniform(-90, 90, size=(100, 3)):
+        service.observe(qi, _coupled_loads(qi))
+
+    assert service.is_calibrated
+    q_test = np.array([30.0, -20.0, 45.0])
+    assert service.predict_gravity(q_test.tolist()) == pytest.approx(
+        _coupled_loads(q_test).tolist(), abs=0.5
+    )
+
+    service.stop_online_learning()
+    reloaded = LeaderAssistService(calibration_path=tmp_path / "online.json")
+    assert reloaded.predict_gravity(q_test.tolist()) == pytest.approx(
+        service.predict_gravity(q_test.tolist())
+    )
+
+
+class _PwmLeader(MockLeader):
+    """Leader that records PWM writes."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pwm_writes: list[dict[str, int]] = []
+        self.bus.write_pwm = self.pwm_writes.append
+
+
+def test_loop_batches_assist_groups(tmp_path) -> None:
+    """Assist groups get a PWM write per tick and feed online gravity learning."""
+    leader = _PwmLeader()
+    service = _calibrated_assist(tmp_path)
+    service.start_online_learning()
+    loop = TeleopLoop(
+        robot=MockRobot(),
+        leader=leader,
+        safety=SafetyLayer(robot_lock=threading.Lock()),
+        joint_mapper=_identity_mapper(),
+        leader_assists={"default": service},
+        blend_duration=0.05,
+    )
+    loop.assist_groups = {"default": list(MOCK_JOINT_NAMES[:3])}
+    loop.assist_enabled = True
+    loop.assist_sample_interval = 1
+    loop.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while loop.loop_count < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        loop.stop()
+
+    assert len(leader.pwm_writes) >= 10
+    assert set(leader.pwm_writes[-1]) == set(MOCK_JOINT_NAMES[:3])
+    assert loop._assist_has_last.all()
+    assert np.any(loop._assist_vel != 0.0)
+    # The slow mock leader stays under the deadband, so every tick samples
+    assert service.online_samples >= 10
+
+
+def test_effort_registers_decode_to_pwm(tmp_path) -> None:
+    """Each leader family's effort register decodes to signed PWM units."""
+    feetech = EFFORT_REGISTERS[MotorType.STS3215]
+    assert feetech.to_pwm(0x400 | 25) == -25.0
+    assert feetech.to_pwm(-25) == -25.0  # already decoded by the driver
+    xl330 = EFFORT_REGISTERS[MotorType.DYNAMIXEL_XL330]
+    assert xl330.name == "Present_Current"
+    assert xl330.to_pwm(0xFFF6) == pytest.approx(-10 * 1000 / 1470)
+    assert xl330.to_pwm(-10) == xl330.to_pwm(0xFFF6)
+    assert EFFORT_REGISTERS[MotorType.DYNAMIXEL_XL430].to_pwm(0xFFF6) == -10.0
+
+    service = LeaderAssistService(calibration_path=tmp_path / "gravity.json")
+    with pytest.raises(CalibrationError):
+        service.start_online_learning()  # no motor type, no effort register
+
+
+class _HoldingXL330Leader(MockLeader):
+    """XL330 leader resting at ``pose``; its servos draw the gravity current."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pose = np.zeros(3)
+        self.registers: list[str] = []
+        self.bus.sync_read = self._sync_read
+
+    def get_action(self) -> dict[str, float]:
+        obs = {f"{n}.pos": 0.0 for n in MOCK_JOINT_NAMES}
+        obs.update(
+            {f"{n}.pos": float(q) for n, q in zip(MOCK_JOINT_NAMES[:3], self.pose, strict=True)}
+        )
+        return obs
+
+    def _sync_read(self, register: str, motors: list[str], **kwargs) -> dict[str, int]:
+        self.registers.append(register)
+        current_ma = np.round(_coupled_loads(self.pose) * 1.47).astype(int)
+        # Raw two's-complement register values, as the XL330 reports them
+        return {m: int(c) & 0xFFFF for m, c in zip(motors, current_ma, strict=True)}
+
+
+def test_loop_learns_gravity_from_leader_current(tmp_path) -> None:
+    """Online learning through the loop decodes XL330 current into PWM labels."""
+    leader = _HoldingXL330Leader()
+    service = LeaderAssistService(
+        calibration_path=tmp_path / "xl330.json", motor_type=MotorType.DYNAMIXEL_XL330
+    )
+    service.start_online_learning(forgetting=1.0, initial_covariance=1e4)
+    loop = TeleopLoop(
+        robot=MockRobot(),
+        leader=leader,
+        safety=SafetyLayer(robot_lock=threading.Lock()),
+        joint_mapper=_identity_mapper(),
+        leader_assists={"default": service},
+    )
+    loop.assist_groups = {"default": list(MOCK_JOINT_NAMES[:3])}
+    loop.assist_enabled = True
+    loop.assist_sample_interval = 1
+    loop._alpha_vel = 1.0  # velocity is zero on the second tick at a pose
+
+    loop.begin()
+    for pose in np.random.default_rng(4).uniform(-90, 90, size=(80, 3)):
+        leader.pose = pose
+        loop.tick()  # moved: above the deadband, not sampled
+        loop.tick()  # at rest: sampled
+    loop.stop()
+
+    assert set(leader.registers) == {"Present_Current"}
+    assert service.is_calibrated and service.model == GravityModel.COUPLED
+    q_test = np.array([30.0, -20.0, 45.0])
+    assert service.predict_gravity(q_test.tolist()) == pytest.approx(
+        _coupled_loads(q_test).tolist(), abs=2.0
+    )
+
+
+def test_teleop_start_builds_leader_assist(tmp_path, monkeypatch) -> None:
+    """learnGravity wires an online-learning assist service per leader arm."""
+    from nextis.api.routes.teleop import _create_leader_assist
+    from nextis.api.schemas import TeleopStartRequest
+    from nextis.hardware.types import ArmDefinition, ArmRole
+
+    monkeypatch.setattr("nextis.config.CALIBRATION_DIR", tmp_path)
+    request = TeleopStartRequest.model_validate({"learnGravity": True})
+    arm = ArmDefinition(
+        id="lead", name="Lead", role=ArmRole.LEADER, motor_type=MotorType.DYNAMIXEL_XL330, port="x"
+    )
+
+    services, groups = _create_leader_assist(arm, MockLeader(), request.learn_gravity)
+    assert groups == {"default": [n for n in MOCK_JOINT_NAMES if n != "gripper"]}
+    service = services["default"]
+    assert service.online_learning
+    assert service.effort_register.name == "Present_Current"
+    assert service.calibration_path == tmp_path / "gravity_lead.json"
+
+    arm.config["assist_joints"] = ["base", "link1"]
+    _, groups = _create_leader_assist(arm, MockLeader())
+    assert groups == {"default": ["base", "link1"]}
+
+    arm.motor_type = MotorType.DAMIAO
+    with pytest.raises(CalibrationError):
+        _create_leader_assist(arm, MockLeader(), learn_gravity=True)
+
+
+# ------------------------------------------------------------------
+# Telemetry snapshot
+# ------------------------------------------------------------------
+
+
+class _CountingRobot(MockRobot):
+    """Follower that counts torque reads."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.torque_reads = 0
+
+    def get_torques(self) -> dict[str, float]:
+        self.torque_reads += 1
+        return super().get_torques()
+
+
+def test_telemetry_reader_differences_velocity() -> None:
+    """Velocities are differenced against the previous snapshot."""
+    robot = MockRobot()
+    reader = TelemetryReader(robot)
+    robot.send_action({"base.pos": 0.0})
+    first = reader.read({"base.pos": 1.0})
+    assert first.velocities == {"base.pos": 0.0}
+    assert first.leader_positions == {"base.pos": 1.0}
+    assert set(first.torques) == set(MOCK_JOINT_NAMES)
+
+    time.sleep(0.01)
+    robot.send_action({"base.pos": 0.5})
+    second = reader.read()
+    dt = second.timestamp - first.timestamp
+    assert second.velocities["base.pos"] == pytest.approx(0.5 / dt)
+
+
+def test_loop_reads_telemetry_once_per_tick() -> None:
+    """Safety and gripper feedback share one torque read per tick."""
+    mapper = _identity_mapper()
+    mapper._has_damiao_follower = True
+    robot = _CountingRobot()
+    loop = TeleopLoop(
+        robot=robot,
+        leader=MockLeader(),
+        safety=SafetyLayer(robot_lock=threading.Lock()),
+        joint_mapper=mapper,
+        gripper_ff=GripperForceFeedback(),
+        blend_duration=0.05,
+    )
+    loop.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while loop.loop_count < 15 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        loop.stop()
+
+    assert loop.loop_count >= 15
+    assert robot.torque_reads <= loop.loop_count
+    snapshot = loop.telemetry
+    assert snapshot is not None
+    assert set(snapshot.positions) == {f"{n}.pos" for n in MOCK_JOINT_NAMES}
+    assert loop.get_metrics()["stages"]["telemetry"]["count"] == robot.torque_reads
+
+
+def test_intervention_uses_snapshot_leader() -> None:
+    """The detector reads leader positions from the snapshot, not the arm."""
+    detector = InterventionDetector(move_threshold=0.5, inference_hz=30.0)
+
+    def snap(pos: float) -> TelemetrySnapshot:
+        return TelemetrySnapshot(
+            timestamp=time.perf_counter(), positions={}, leader_positions={"base.pos": pos}
+        )
+
+    assert not detector.check(None, snapshot=snap(0.0))
+    assert detector.check(None, snapshot=snap(0.1))
+
+
+# ------------------------------------------------------------------
+# Latency metrics
+# ------------------------------------------------------------------
+
+
+def test_latency_histogram_percentiles() -> None:
+    """Histogram percentiles stay within the bucket's relative error."""
+    hist = LatencyHistogram()
+    for us in range(1, 10_001):
+        hist.record(us / 1e6)
+
+    assert hist.count == 10_000
+    assert hist.max_us == 10_000
+    assert hist.percentile(50) == pytest.approx(5e-3, rel=0.04)
+    assert hist.percentile(99) == pytest.approx(9.9e-3, rel=0.04)
+    assert hist.percentile(100) <= 10e-3
+    assert hist.mean == pytest.approx(5.0005e-3, rel=1e-3)
+
+
+def test_loop_metrics_counts_overruns() -> None:
+    """Ticks whose work exceeds the period are counted as overruns."""
+    metrics = LoopMetrics(period=0.001)
+    metrics.begin_tick()
+    metrics.lap(TickStage.LEADER_READ)
+    metrics.end_tick()
+    metrics.begin_tick()
+    time.sleep(0.005)
+    metrics.lap(TickStage.SEND)
+    metrics.end_tick()
+
+    snap = metrics.snapshot()
+    assert snap["ticks"] == 2
+    assert snap["overruns"] == 1
+    assert snap["worst_tick_ms"] >= 5.0
+    assert snap["stages"]["leader_read"]["count"] == 1
+    assert snap["stages"]["send"]["count"] == 1
+    assert snap["stages"]["assist"]["count"] == 0
+
+
+def test_loop_snapshot_reports_stages() -> None:
+    """A running loop fills the per-stage histograms."""
+    loop = _make_loop(blend_duration=0.05)
+    loop.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while loop.loop_count < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        loop.stop()
+
+    snap = loop.get_metrics()
+    assert snap["ticks"] >= 10
+    for stage in ("leader_read", "map", "send", "safety", "tick", "sleep_error"):
+        assert snap["stages"][stage]["count"] > 0
+
+
+# ------------------------------------------------------------------
+# RateTicker
+# ------------------------------------------------------------------
+
+
+def test_ticker_does_not_drift() -> None:
+    """Deadlines stay on the absolute grid regardless of per-tick work."""
+    ticker = RateTicker(200.0)
+    ticker.start()
+    origin = ticker.deadline - ticker.period
+    for _ in range(20):
+        time.sleep(0.001)
+        ticker.wait()
+
+    # Every deadline is origin + n * period; only skipped ticks move it further
+    assert ticker.deadline == pytest.approx(origin + (21 + ticker.skipped) * ticker.period)
+
+
+def test_ticker_skip_realigns_after_overrun() -> None:
+    """SKIP drops missed deadlines and schedules the next future one."""
+    ticker = RateTicker(100.0, policy=OverrunPolicy.SKIP)
+    ticker.start()
+    origin = ticker.deadline - ticker.period
+    time.sleep(0.035)
+    lateness = ticker.wait()
+
+    behind = int(lateness // ticker.period)
+    assert ticker.overruns == 1
+    assert behind >= 2 and ticker.skipped == behind
+    assert ticker.deadline == pytest.approx(origin + (2 + behind) * ticker.period)
+    assert ticker.deadline > time.perf_counter()
+
+
+def test_ticker_skip_small_overrun_keeps_next_deadline() -> None:
+    """A sub-period overrun skips nothing: the next deadline is under a period away."""
+    ticker = RateTicker(50.0, policy=OverrunPolicy.SKIP)
+    ticker.start()
+    origin = ticker.deadline - ticker.period
+    time.sleep(ticker.period * 1.25)
+    lateness = ticker.wait()
+    now = time.perf_counter()
+
+    assert ticker.skipped == int(lateness // ticker.period)
+    assert 0.0 < ticker.deadline - now < ticker.period
+    assert ticker.deadline == pytest.approx(origin + (2 + ticker.skipped) * ticker.period)
+
+
+def test_ticker_catch_up_runs_missed_ticks() -> None:
+    """CATCH_UP keeps the grid: missed deadlines return immediately."""
+    ticker = RateTicker(100.0, policy=OverrunPolicy.CATCH_UP, max_catch_up=100)
+    ticker.start()
+    origin = ticker.deadline - ticker.period
+    time.sleep(0.025)
+    ticker.wait()
+    assert ticker.skipped == 0
+    assert ticker.deadline == pytest.approx(origin + 2 * ticker.period)
+    assert ticker.deadline < time.perf_counter()
+
+    # The next deadline is already due, so this wait is an overrun too
+    ticker.wait()
+    assert ticker.deadline == pytest.approx(origin + 3 * ticker.period)
+    assert ticker.stats()["overruns"] == 2
+
+
+# ------------------------------------------------------------------
+# Pipelined I/O
+# ------------------------------------------------------------------
+
+
+def test_mailbox_keeps_latest_value() -> None:
+    """Mailbox overwrites old values and wakes waiters on publish."""
+    box: Mailbox[int] = Mailbox()
+    assert box.latest().value is None
+    assert box.wait_newer(0, timeout=0.01) is None
+
+    box.publish(1)
+    box.publish(2)
+    envelope = box.wait_newer(0, timeout=0.01)
+    assert envelope is not None
+    assert (envelope.seq, envelope.value) == (2, 2)
+    assert box.wait_newer(2, timeout=0.01) is None
+
+    threading.Timer(0.02, box.publish, args=(3,)).start()
+    envelope = box.wait_newer(2, timeout=1.0)
+    assert envelope is not None and envelope.value == 3
+
+
+class _SlowRobot(MockRobot):
+    """Follower whose writes take longer than a control period."""
+
+    def send_action(self, action: dict[str, float]) -> None:
+        time.sleep(0.03)
+        super().send_action(action)
+
+
+def test_pipelined_loop_decouples_slow_follower() -> None:
+    """A slow follower write does not drag down the control tick rate."""
+    loop = TeleopLoop(
+        robot=_SlowRobot(),
+        leader=MockLeader(),
+        safety=SafetyLayer(robot_lock=threading.Lock()),
+        joint_mapper=_identity_mapper(),
+        blend_duration=0.05,
+        pipelined=True,
+    )
+    loop.start()
+    time.sleep(0.5)
+    loop.stop()
+
+    snap = loop.get_metrics()
+    assert snap["pipelined"] is True
+    # ~30 ticks at 60Hz; serial sends at 30ms each would cap this near 16
+    assert loop.loop_count >= 24
+    assert snap["pipeline"]["follower_write"]["count"] > 0
+    assert snap["pipeline"]["end_to_end"]["p50_ms"] >= 30.0
+    assert loop.robot._commanded is not None
+    assert not any(t.is_alive() for t in threading.enumerate() if t.name.startswith("Teleop"))
+
+
+# ------------------------------------------------------------------
+# Safety monitor
+# ------------------------------------------------------------------
+
+
+class _LoadedRobot(MockRobot):
+    """Follower whose bus reports configurable Present_Load values."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.loads = dict.fromkeys(MOCK_JOINT_NAMES, 100)
+        self.bus.sync_read = lambda register, motors, **kw: {m: self.loads[m] for m in motors}
+
+
+def test_safety_monitor_debounces_all_motors() -> None:
+    """Every motor is checked each sample; trips after violation_limit samples."""
+    robot = _LoadedRobot()
+    monitor = SafetyMonitor(robot, SafetyLayer(robot_lock=threading.Lock(), violation_limit=3))
+    monitor._discover()
+    robot.loads["link4"] = 600
+    robot.loads["gripper"] = 1024 + 700  # Direction bit set
+
+    assert monitor.sample() is None
+    assert monitor.sample() is None
+    violation = monitor.sample()
+    assert violation is not None
+    assert violation.motors == ("link4", "gripper")
+    assert violation.values == (600.0, 700.0)
+    assert monitor.violation is violation
+
+
+def test_loop_stops_on_monitor_violation() -> None:
+    """The loop E-stops once the monitor thread publishes a violation."""
+    robot = _LoadedRobot()
+    loop = TeleopLoop(
+        robot=robot,
+        leader=MockLeader(),
+        safety=SafetyLayer(robot_lock=threading.Lock()),
+        joint_mapper=_identity_mapper(),
+        blend_duration=0.05,
+        safety_monitor_hz=200.0,
+    )
+    loop.start()
+    try:
+        time.sleep(0.1)
+        assert loop.is_running
+        robot.loads["link2"] = 900
+        deadline = time.monotonic() + 1.0
+        while loop.is_running and time.monotonic() < deadline:
+            time.sleep(0.005)
+    finally:
+        loop.stop()
+
+    assert not loop.is_running
+    assert not robot.is_connected
+    stats = loop.get_metrics()["safety_monitor"]
+    assert stats["tripped"] and "link2" in stats["violation"]
+    assert stats["samples"] > loop.loop_count
+
+
+# ------------------------------------------------------------------
+# Torque trend
+# ------------------------------------------------------------------
+
+
+def test_torque_trend_slows_before_limit() -> None:
+    """A steep torque ramp scales speed down well before the limit."""
+    trend = TorqueTrendPredictor(["a", "b"], np.array([4.0, 4.0]), horizon=0.3, min_scale=0.2)
+    dt = 1 / 60
+    scales = []
+    for k in range(42):
+        # Joint a ramps at 4 Nm/s toward its limit, joint b only jitters
+        torques = np.array([1.0 + 4.0 * k * dt, 0.05 * (-1) ** k])
+        scales.append(trend.update(k * dt, torques))
+
+    assert scales[5] == 1.0  # 3.3 Nm/s headroom left at t=83ms → ~0.7s to limit
+    assert min(scales) < 0.5
+    assert trend.slowdowns == 1
+    assert trend.stats()["time_to_limit_ms"] < 100
+
+    # Torque levels off: scale ramps back up at recovery_rate per sample
+    flat = np.array([3.5, 0.0])
+    recovered = [trend.update((42 + k) * dt, flat) for k in range(40)]
+    assert all(b - a <= trend.recovery_rate + 1e-9 for a, b in itertools.pairwise(recovered))
+    assert recovered[-1] == 1.0
+
+
+def test_torque_trend_matches_per_joint_fit() -> None:
+    """The vectorized fit for 14 joints equals a per-joint polyfit."""
+    trend = TorqueTrendPredictor([f"m{i}" for i in range(14)], np.full(14, 5.0), window=12)
+    rng = np.random.default_rng(3)
+    times = np.arange(40) / 60
+    samples = np.cumsum(rng.normal(0, 0.2, size=(40, 14)), axis=0)
+    for t, torques in zip(times, samples, strict=True):
+        trend.update(t, torques)
+
+    last = samples[-1]
+    slopes = np.array([np.polyfit(times[-12:], samples[-12:, j], 1)[0] for j in range(14)])
+    rate = slopes * np.sign(last)
+    expected = np.where(rate > 0, (5.0 - np.abs(last)) / np.where(rate > 0, rate, 1), np.inf)
+    assert np.allclose(trend.time_to_limit, expected)
+
+
+class _RampingRobot(MockRobot):
+    """Follower whose base torque climbs steadily toward its limit."""
+
+    def get_torques(self) -> dict[str, float]:
+        torques = dict.fromkeys(MOCK_JOINT_NAMES, 0.0)
+        torques["base"] = min(9.9, 8.0 * (time.monotonic() - self._start_time))
+        return torques
+
+
+def test_loop_scales_speed_on_torque_trend() -> None:
+    """The loop shortens each step toward the target while the trend is steep."""
+    loop = TeleopLoop(
+        robot=_RampingRobot(),
+        leader=MockLeader(),
+        safety=SafetyLayer(robot_lock=threading.Lock()),
+        joint_mapper=_identity_mapper(),
+        blend_duration=0.05,
+    )
+    loop.telemetry_enabled = True
+    loop.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while loop._speed_scale == 1.0 and time.monotonic() < deadline:
+            time.sleep(0.005)
+    finally:
+        loop.stop()
+
+    stats = loop.get_metrics()["torque_trend"]
+    assert stats["slowdowns"] >= 1
+    assert stats["min_speed_scale"] < 1.0
+
+
+# ------------------------------------------------------------------
+# TeleopEngine
+# ------------------------------------------------------------------
+
+
+def test_engine_runs_pairings_independently() -> None:
+    """One pairing tripping safety stops only that pairing."""
+    healthy = _make_loop(blend_duration=0.05)
+    failing = _make_loop(blend_duration=0.05)
+    engine = TeleopEngine({"station_a": healthy, "station_b": failing})
+    engine.start()
+    try:
+        time.sleep(0.1)
+        failing.robot.bus._can_bus_dead = True
+        time.sleep(0.15)
+        assert engine.is_running
+        assert engine.active_pairings == ["station_a"]
+        count = healthy.loop_count
+        time.sleep(0.1)
+        assert healthy.loop_count > count
+    finally:
+        engine.stop()
+
+    snap = engine.get_metrics()
+    assert set(snap["pairings"]) == {"station_a", "station_b"}
+    assert snap["pairings"]["station_a"]["ticks"] > snap["pairings"]["station_b"]["ticks"]
+    assert snap["scheduler"]["ticks"] == engine.loop_count
+    assert not healthy.is_running
+
+
+def test_engine_slow_pairing_does_not_delay_others() -> None:
+    """A pairing whose bus stalls misses ticks; the other keeps every tick."""
+    fast = _make_loop(blend_duration=0.05)
+    slow = _make_loop(blend_duration=0.05)
+    slow_tick = slow.tick
+
+    def stalled_tick() -> bool:
+        time.sleep(0.08)  # several 60 Hz periods
+        return slow_tick()
+
+    slow.tick = stalled_tick
+    engine = TeleopEngine({"station_a": fast, "station_b": slow}, frequency=60)
+    engine.start()
+    try:
+        time.sleep(0.5)
+    finally:
+        engine.stop()
+
+    snap = engine.get_metrics()
+    assert snap["pairings"]["station_b"]["missed_ticks"] > 0
+    # Serial ticking would hold station_a to station_b's rate
+    assert fast.loop_count > 2 * slow.loop_count